@@ -0,0 +1,194 @@
+"""
+Asynchronous asset loading.
+
+Every request returns an AssetHandle right away. Its file is read and
+decoded on a small thread pool; assets that need the GPU are then queued for
+upload. The GL thread calls update() once per frame, which runs the queued
+uploads until the frame's time budget is spent, so menus and the game keep
+their frame rate while content streams in.
+
+A handle that is needed right now can be waited on: wait() blocks until the
+asset is decoded and uploads it immediately (call it on the GL thread).
+Requests are cached by key, so asking twice for a file returns the same handle.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum, auto
+from typing import Any, Callable, Generic, TypeVar
+import queue
+import threading
+import time
+
+import pygame
+
+from engine.graphics.mesh_registry import MeshRegistry
+from engine.graphics.opengl_3d_utils import MeshData, OpenGL_3D_Utils
+from engine.text_common import GlyphAtlas
+
+
+T = TypeVar("T")
+
+
+class AssetState(Enum):
+    LOADING = auto()    # decoding on the thread pool
+    DECODED = auto()    # waiting for its GPU upload
+    READY = auto()
+    FAILED = auto()
+
+
+class AssetHandle(Generic[T]):
+    def __init__(self, key: tuple, upload: Callable[[Any], T] | None) -> None:
+        self.key = key
+        self.state = AssetState.LOADING
+        self.value: T | None = None
+        self.error: BaseException | None = None
+
+        self.__upload = upload
+        self.__decoded: Any = None
+        self.__future: Future | None = None
+        self.__lock = threading.Lock()
+
+    def is_ready(self) -> bool:
+        return self.state == AssetState.READY
+
+    def wait(self) -> T:
+        """Return the value, decoding and uploading it now if it is not ready yet.
+        Raises the error of a failed load."""
+        if self.__future is not None:
+            self.__future.result()
+
+        self._finish()
+
+        if self.state == AssetState.FAILED:
+            raise self.error  # type: ignore
+        return self.value  # type: ignore
+
+    def _start(self, future: Future) -> None:
+        self.__future = future
+
+    def _decoded(self, data: Any) -> bool:
+        """Store the decoded data (worker thread), return True if it still needs an upload."""
+        with self.__lock:
+            if self.__upload is None:
+                self.value = data
+                self.state = AssetState.READY
+                return False
+
+            self.__decoded = data
+            self.state = AssetState.DECODED
+            return True
+
+    def _failed(self, error: BaseException) -> None:
+        with self.__lock:
+            self.error = error
+            self.state = AssetState.FAILED
+
+    def _finish(self) -> None:
+        """Run the upload if it is pending (GL thread)."""
+        with self.__lock:
+            if self.state != AssetState.DECODED:
+                return
+
+            try:
+                self.value = self.__upload(self.__decoded)  # type: ignore
+                self.state = AssetState.READY
+            except Exception as error:
+                self.error = error
+                self.state = AssetState.FAILED
+
+            self.__decoded = None
+
+
+class AssetManager:
+    # GPU upload time per frame, in seconds; at least one upload runs every frame
+    UPLOAD_BUDGET = 0.002
+
+    WORKERS = 2
+
+    __executor: ThreadPoolExecutor | None = None
+    __handles: dict[tuple, AssetHandle] = {}
+    __uploads: "queue.SimpleQueue[AssetHandle]" = queue.SimpleQueue()
+
+    @classmethod
+    def request(
+        cls,
+        key: tuple,
+        decode: Callable[[], Any],
+        upload: Callable[[Any], T] | None = None
+    ) -> AssetHandle[T]:
+        """Return the handle of `key`, starting its load on first request.
+
+        Args:
+            key: Cache key of the asset, e.g. (kind, path)
+            decode: CPU work, run on the thread pool
+            upload: GPU work on the decoded data, run on the GL thread; its result is the value
+        """
+        if key in cls.__handles:
+            return cls.__handles[key]
+
+        if cls.__executor is None:
+            cls.__executor = ThreadPoolExecutor(max_workers=cls.WORKERS, thread_name_prefix="assets")
+
+        handle: AssetHandle[T] = AssetHandle(key, upload)
+        cls.__handles[key] = handle
+        handle._start(cls.__executor.submit(cls.__decode, handle, decode))
+        return handle
+
+    @classmethod
+    def __decode(cls, handle: AssetHandle, decode: Callable[[], Any]) -> None:
+        try:
+            data = decode()
+        except Exception as error:
+            handle._failed(error)
+            return
+
+        if handle._decoded(data):
+            cls.__uploads.put(handle)
+
+    @classmethod
+    def update(cls, budget: float | None = None) -> None:
+        """Run queued GPU uploads for up to `budget` seconds. Call once per frame on the GL thread."""
+        if budget is None:
+            budget = cls.UPLOAD_BUDGET
+
+        deadline = time.perf_counter() + budget
+        while True:
+            try:
+                handle = cls.__uploads.get_nowait()
+            except queue.Empty:
+                return
+
+            # Already uploaded by wait() if it is no longer DECODED
+            handle._finish()
+
+            if time.perf_counter() >= deadline:
+                return
+
+    @classmethod
+    def load_music(cls, path: str) -> AssetHandle[bytes]:
+        """Read a music file into memory, see MusicManager.play()."""
+        return cls.request(("music", path), lambda: cls.__read_bytes(path))
+
+    @classmethod
+    def load_mesh(cls, path: str) -> AssetHandle[MeshData]:
+        """Load a processed mesh and keep it uploaded in the MeshRegistry, the value is its MeshData."""
+        def upload(mesh: MeshData) -> MeshData:
+            # The reference held here keeps the mesh resident for every later user
+            MeshRegistry.acquire(mesh)
+            return mesh
+
+        return cls.request(("mesh", path), lambda: OpenGL_3D_Utils.load(path), upload)
+
+    @classmethod
+    def load_font(cls, path: str, size: int) -> AssetHandle[GlyphAtlas]:
+        """Open a font and create its glyph atlas, the value is the GlyphAtlas."""
+        return cls.request(
+            ("font", path, size),
+            lambda: pygame.font.Font(path, size),
+            lambda font: GlyphAtlas.add(path, size, font)
+        )
+
+    @staticmethod
+    def __read_bytes(path: str) -> bytes:
+        with open(path, "rb") as asset_file:
+            return asset_file.read()
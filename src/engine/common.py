@@ -1,6 +1,6 @@
+import ctypes
 import os
 import sys
-from OpenGL.GL import *  # type: ignore
 
 
 def get_screen_resolution() -> tuple[float, float]:
@@ -19,3 +19,16 @@ def get_resource_path(relative_path):
         # Running in a normal Python environment
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
+
+
+def get_cache_path(*parts: str, create: bool = True) -> str:
+    """ Get absolute path to a folder under .cache, creating it if needed (and `create` is set) """
+    if getattr(sys, 'frozen', False):
+        # Next to the executable: the PyInstaller bundle folder is temporary
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.abspath(".")
+    path = os.path.join(base_path, ".cache", *parts)
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,140 @@
+"""
+Frame pacing of the game loop.
+
+Instead of spinning on the clock between frames, the loop calls wait()
+once per frame. It sleeps until shortly before the frame deadline and
+spins only the last SPIN_THRESHOLD seconds, which keeps the wake-up
+precise while the CPU stays idle most of the frame. On Windows the
+system timer resolution is raised to 1 ms while pacing (timeBeginPeriod).
+
+The frame rate is capped at frame_cap; without a cap the presentation is
+left to vsync (VSYNC in consts: flip() blocks until the next refresh). While the window is
+unfocused the loop runs at UNFOCUSED_FPS, and nothing is drawn while it
+is minimized.
+
+With the FRAME_STATS=1 environment variable the wake-up jitter (how late
+wait() returns after its deadline), the frame rate and the CPU use are
+printed every REPORT_INTERVAL seconds.
+"""
+
+from collections import deque
+import ctypes
+import os
+import sys
+import time
+
+import pygame
+
+
+class FramePacer:
+    # The last part of a wait is spun: sleep() may wake up later than asked
+    SPIN_THRESHOLD = 0.002
+
+    UNFOCUSED_FPS = 20
+
+    ENV_VAR = "FRAME_STATS"
+    REPORT_INTERVAL = 5.0
+
+    def __init__(self, frame_cap: float | None) -> None:
+        """
+        Args:
+            frame_cap: Maximum frames per second, None to leave it to vsync (see DisplayManager)
+        """
+        self.__frame_cap = frame_cap
+        self.__next_deadline = time.perf_counter()
+        self.__is_timer_period_raised = False
+
+        # Seconds wait() returned after its deadline, for the last frames
+        self.__jitter: deque[float] = deque(maxlen=1000)
+
+        self.__is_reporting = os.environ.get(self.ENV_VAR, "") not in ("", "0")
+        self.__report_start = time.perf_counter()
+        self.__report_cpu_start = time.process_time()
+        self.__report_frames = 0
+
+    def begin(self) -> None:
+        """Start pacing from now. Call when the loop is entered."""
+        self.__next_deadline = time.perf_counter()
+        self.__set_timer_period(True)
+
+    def end(self) -> None:
+        """Call when the loop is left."""
+        self.__set_timer_period(False)
+
+    def should_draw(self) -> bool:
+        """False while the window is minimized."""
+        return pygame.display.get_active()
+
+    def wait(self) -> None:
+        """Wait for the deadline of the next frame."""
+        interval = self.__get_frame_interval()
+        self.__report_frames += 1
+
+        if interval > 0.0:
+            self.__next_deadline += interval
+            now = time.perf_counter()
+
+            # Too late already (a hitch): start again from now instead of rushing frames
+            if now > self.__next_deadline:
+                self.__next_deadline = now
+            else:
+                self.__wait_until(self.__next_deadline)
+                self.__jitter.append(time.perf_counter() - self.__next_deadline)
+
+        if self.__is_reporting and time.perf_counter() - self.__report_start >= self.REPORT_INTERVAL:
+            self.report()
+
+    def get_jitter_stats(self) -> tuple[float, float, float]:
+        """(mean, 99th percentile, max) of the wake-up jitter of the last frames, in seconds."""
+        if not self.__jitter:
+            return (0.0, 0.0, 0.0)
+
+        jitter = sorted(self.__jitter)
+        return (sum(jitter) / len(jitter), jitter[int(len(jitter) * 0.99)], jitter[-1])
+
+    def report(self, file=None) -> None:
+        file = file or sys.stderr
+
+        now = time.perf_counter()
+        cpu_now = time.process_time()
+        elapsed = now - self.__report_start
+
+        mean, p99, worst = self.get_jitter_stats()
+        print(
+            f"frame pacing: {self.__report_frames / elapsed:.1f} fps, "
+            f"cpu {(cpu_now - self.__report_cpu_start) / elapsed * 100:.0f}%, "
+            f"jitter mean {mean * 1000:.3f} ms, p99 {p99 * 1000:.3f} ms, max {worst * 1000:.3f} ms",
+            file=file
+        )
+
+        self.__report_start = now
+        self.__report_cpu_start = cpu_now
+        self.__report_frames = 0
+
+    def __get_frame_interval(self) -> float:
+        if not pygame.key.get_focused() or not pygame.display.get_active():
+            return 1.0 / self.UNFOCUSED_FPS
+        if self.__frame_cap is not None:
+            return 1.0 / self.__frame_cap
+
+        # flip() waits for vsync, or without it the frame takes as long as it takes
+        return 0.0
+
+    def __wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining > self.SPIN_THRESHOLD:
+            time.sleep(remaining - self.SPIN_THRESHOLD)
+
+        while time.perf_counter() < deadline:
+            pass
+
+    def __set_timer_period(self, raised: bool) -> None:
+        windll = getattr(ctypes, "windll", None)
+        if windll is None or raised == self.__is_timer_period_raised:
+            return
+
+        if raised:
+            windll.winmm.timeBeginPeriod(1)
+        else:
+            windll.winmm.timeEndPeriod(1)
+        self.__is_timer_period_raised = raised
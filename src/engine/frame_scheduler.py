@@ -0,0 +1,59 @@
+"""
+Fixed-step timing of the game loop.
+
+The simulation advances in fixed UPDATE_DT steps; the loop runs once per
+drawn frame (see FramePacer). Every frame begin_frame() returns how many
+steps are due, at most max_catch_up_steps: after a long hitch (a pause, a
+mesh load) the rest of the lost time is dropped instead of running a
+spiral of back-to-back updates.
+
+The time left in the update accumulator, as a fraction of a step, is the
+interpolation alpha: renderers draw entities between their previous and
+current simulation positions, so motion stays smooth at any display rate.
+"""
+
+import time
+
+
+class FrameScheduler:
+    MAX_CATCH_UP_STEPS = 8
+
+    def __init__(self, update_dt: float, max_catch_up_steps: int = MAX_CATCH_UP_STEPS) -> None:
+        self.__update_dt = update_dt
+        self.__max_catch_up_steps = max_catch_up_steps
+
+        self.__last_time = time.perf_counter()
+        self.__update_accumulator = 0.0
+
+        # Simulation time given up to the catch-up cap, in seconds
+        self.dropped_time = 0.0
+
+    def reset(self) -> None:
+        """Start timing from now, e.g. when the loop is entered again after a pause."""
+        self.__last_time = time.perf_counter()
+        self.__update_accumulator = 0.0
+
+    def begin_frame(self) -> int:
+        """Account the time since the previous call, return the number of update steps to run now."""
+        now = time.perf_counter()
+        frame_time = now - self.__last_time
+        self.__last_time = now
+
+        self.__update_accumulator += frame_time
+
+        steps = int(self.__update_accumulator // self.__update_dt)
+        if steps > self.__max_catch_up_steps:
+            steps = self.__max_catch_up_steps
+
+        self.__update_accumulator -= steps * self.__update_dt
+
+        if self.__update_accumulator >= self.__update_dt:
+            dropped = self.__update_accumulator - self.__update_accumulator % self.__update_dt
+            self.dropped_time += dropped
+            self.__update_accumulator -= dropped
+
+        return steps
+
+    def get_alpha(self) -> float:
+        """Position between the previous (0) and the current (1) simulation state to draw."""
+        return min(self.__update_accumulator / self.__update_dt, 1.0)
@@ -1,6 +1,10 @@
 """
 Optimized batch renderer for static blocks using instanced rendering.
 Reduces draw calls from 2000+ to 1.
+
+Block positions live in a persistent instance buffer: the whole buffer is
+uploaded only when a map is loaded, single edits patch one slot. The
+renderer follows the GameField through its journal of changes.
 """
 
 from OpenGL.GL import *  # type: ignore
@@ -8,7 +12,11 @@ import numpy as np
 import ctypes
 
 from game.consts import BLOCK_SIZE, DARK_GREY
+from game.enums.tile_enum import TileEnum
+from game.game_field import GameField
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
 from engine.graphics.opengl_utils import OpenGLUtils
+from engine.shader_utils import ShaderUtils
 
 
 class BlocksRenderer:
@@ -28,34 +36,48 @@ class BlocksRenderer:
         self.__vertex_count = 4
         self.__instance_count = 0
 
+        # CPU mirror of the instance buffer and the block cell stored in each slot
+        self.__positions = np.zeros((64, 2), dtype=np.float32)
+        self.__slots: dict[tuple[int, int], int] = {}
+        self.__cells: list[tuple[int, int]] = []
+
+        self.__setup_uniforms()
+        self.__setup_vao()
+
+        # The CPU mirror is enough to restore the blocks on a new context
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __setup_uniforms(self):
         # Cache uniform locations
-        self.__uUseTexture = glGetUniformLocation(shader, "uUseTexture")
-        self.__uIsPlayer = glGetUniformLocation(shader, "uIsPlayer")
-        self.__uColor = glGetUniformLocation(shader, "uColor")
+        self.__uUseTexture = glGetUniformLocation(self.__shader, "uUseTexture")
+        self.__uIsPlayer = glGetUniformLocation(self.__shader, "uIsPlayer")
+        self.__uColor = glGetUniformLocation(self.__shader, "uColor")
 
+    def __rebuild(self):
+        self.__shader = ShaderUtils.get_program(self.__shader)
+        self.__setup_uniforms()
         self.__setup_vao()
 
     def __setup_vao(self):
         """Setup VAO with vertex and instance position data."""
         # Create VAO
-        self.__vao = glGenVertexArrays(1)
+        self.__vao = GpuResources.gen_vertex_array("blocks")
         glBindVertexArray(self.__vao)
 
         # Vertex position data (single square)
         vertices = OpenGLUtils.create_square_vertices(BLOCK_SIZE)
-        self.__vbo_vertices = glGenBuffers(1)
+        self.__vbo_vertices = GpuResources.gen_buffer("blocks")
         glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_vertices)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_vertices, vertices, GL_STATIC_DRAW)
 
         # Vertex position attribute (location = 0)
         glEnableVertexAttribArray(0)
         glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 8, ctypes.c_void_p(0))
 
-        # Instance position buffer (will be updated each frame)
-        self.__vbo_positions = glGenBuffers(1)
+        # Instance position buffer (filled by set_blocks() / set_block())
+        self.__vbo_positions = GpuResources.gen_buffer("blocks")
         glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_positions)
-        # Allocate empty buffer (will be updated in draw())
-        glBufferData(GL_ARRAY_BUFFER, 0, None, GL_DYNAMIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_positions, self.__positions, GL_DYNAMIC_DRAW)
 
         # Instance position attribute (location = 1)
         glEnableVertexAttribArray(1)
@@ -64,26 +86,83 @@ class BlocksRenderer:
 
         glBindVertexArray(0)
 
-    def draw(self, positions: list[tuple[float, float]]) -> None:
+    def update(self, game_field: GameField) -> None:
+        """Apply the changes of the field since the previous update."""
+        is_reloaded, changed_cells = game_field.take_changes()
+
+        if is_reloaded:
+            self.set_blocks(np.argwhere(game_field.field))
+            return
+
+        for x, y in changed_cells:
+            self.set_block(x, y, game_field.field[x, y] != TileEnum.EMPTY)
+
+    def set_blocks(self, cells: np.ndarray) -> None:
         """
-        Draw all blocks at specified positions.
+        Replace all blocks and upload the whole instance buffer.
 
         Args:
-            positions: List of (x, y) positions for blocks
+            cells: Array of (x, y) field cells with a block, shape (N, 2)
         """
-        if not positions:
-            return
+        count = len(cells)
+        capacity = len(self.__positions)
+        while capacity < count:
+            capacity *= 2
 
-        # Update instance position buffer
-        positions_array = np.array(positions, dtype=np.float32)
+        self.__positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.__positions[:count] = np.asarray(cells, dtype=np.float32) * BLOCK_SIZE
 
-        glBindBuffer(GL_COPY_WRITE_BUFFER, self.__vbo_positions)
-        glBufferData(
-            GL_COPY_WRITE_BUFFER,
-            positions_array.nbytes,
-            positions_array,
-            GL_DYNAMIC_DRAW
-        )
+        self.__cells = [(int(x), int(y)) for x, y in cells]
+        self.__slots = {cell: slot for slot, cell in enumerate(self.__cells)}
+        self.__instance_count = count
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_positions)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_positions, self.__positions, GL_DYNAMIC_DRAW)
+
+    def set_block(self, x: int, y: int, is_block: bool) -> None:
+        """Add or remove the block at field cell (x, y), patching only the affected slot."""
+        cell = (x, y)
+
+        if is_block and cell not in self.__slots:
+            slot = self.__instance_count
+
+            if slot == len(self.__positions):
+                # Out of space: grow the buffer and re-upload it once
+                self.__positions = np.concatenate((self.__positions, np.zeros_like(self.__positions)))
+                self.__positions[slot] = (x * BLOCK_SIZE, y * BLOCK_SIZE)
+                glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_positions)
+                GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_positions, self.__positions, GL_DYNAMIC_DRAW)
+            else:
+                self.__positions[slot] = (x * BLOCK_SIZE, y * BLOCK_SIZE)
+                self.__upload_slot(slot)
+
+            self.__slots[cell] = slot
+            self.__cells.append(cell)
+            self.__instance_count += 1
+
+        elif not is_block and cell in self.__slots:
+            # Move the last block into the freed slot to keep instances contiguous
+            slot = self.__slots.pop(cell)
+            last_slot = self.__instance_count - 1
+            last_cell = self.__cells.pop()
+
+            if slot != last_slot:
+                self.__positions[slot] = self.__positions[last_slot]
+                self.__cells[slot] = last_cell
+                self.__slots[last_cell] = slot
+                self.__upload_slot(slot)
+
+            self.__instance_count -= 1
+
+    def __upload_slot(self, slot: int) -> None:
+        position = self.__positions[slot]
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_positions)
+        glBufferSubData(GL_ARRAY_BUFFER, slot * position.nbytes, position.nbytes, position)
+
+    def draw(self) -> None:
+        """Draw all blocks currently stored in the instance buffer."""
+        if self.__instance_count == 0:
+            return
 
         # Setup shader
         glUseProgram(self.__shader)
@@ -93,15 +172,15 @@ class BlocksRenderer:
 
         # Draw all instances in one call
         glBindVertexArray(self.__vao)
-        glDrawArraysInstanced(GL_TRIANGLE_FAN, 0, self.__vertex_count, len(positions))
+        glDrawArraysInstanced(GL_TRIANGLE_FAN, 0, self.__vertex_count, self.__instance_count)
         glBindVertexArray(0)
 
     def cleanup(self) -> None:
-        """Free GPU resources."""
+        """Free GPU resources (deleted at the end of the frame)."""
         if self.__vao:
-            glDeleteBuffers(1, [self.__vbo_vertices])
-            glDeleteBuffers(1, [self.__vbo_positions])
-            glDeleteVertexArrays(1, [self.__vao])
+            GpuResources.release(GpuResourceType.BUFFER, self.__vbo_vertices)
+            GpuResources.release(GpuResourceType.BUFFER, self.__vbo_positions)
+            GpuResources.release(GpuResourceType.VERTEX_ARRAY, self.__vao)
             self.__vao = None
             self.__vbo_vertices = None
             self.__vbo_positions = None
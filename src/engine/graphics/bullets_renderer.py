@@ -0,0 +1,57 @@
+"""
+Batch renderer for bullets using instanced rendering.
+Draws every bullet in one call, whatever the weapon.
+"""
+
+import numpy as np
+
+from game.systems.bullets import Bullets
+from engine.graphics.quads_renderer import QuadsRenderer
+
+
+class BulletsRenderer:
+    """Renders all bullets in a single draw call using instanced rendering."""
+
+    def __init__(self, shader):
+        """
+        Initialize the bullet renderer.
+
+        Args:
+            shader: The quads shader program to use for rendering
+        """
+        self.__quads = QuadsRenderer(shader)
+
+        # CPU staging copy of the instance buffer
+        self.__instances = QuadsRenderer.create_instances(64)
+
+    def update(self, bullets: Bullets, alpha: float = 1.0) -> None:
+        """Pack the live bullets into the instance buffer.
+
+        Args:
+            bullets: The bullets to draw
+            alpha: Position between the previous (0) and the current (1) update, see FrameScheduler
+        """
+        alive = np.flatnonzero(bullets.alive[:len(bullets)])
+        count = len(alive)
+
+        if len(self.__instances) < count:
+            self.__instances = QuadsRenderer.create_instances(max(count, len(self.__instances) * 2))
+
+        instances = self.__instances[:count]
+        prev_x, prev_y = bullets.prev_x[alive], bullets.prev_y[alive]
+        instances[:, 0] = prev_x + (bullets.x[alive] - prev_x) * alpha
+        instances[:, 1] = prev_y + (bullets.y[alive] - prev_y) * alpha
+        instances[:, 2] = bullets.width[alive]
+        instances[:, 3] = bullets.height[alive]
+        instances[:, 4] = np.radians(bullets.angle[alive])
+        instances[:, 5:9] = bullets.color[alive]
+
+        self.__quads.set_quads(instances)
+
+    def draw(self) -> None:
+        """Draw all bullets currently stored in the instance buffer."""
+        self.__quads.draw()
+
+    def cleanup(self) -> None:
+        """Free GPU resources."""
+        self.__quads.cleanup()
@@ -4,11 +4,24 @@ from OpenGL.GL import *  # type: ignore
 import pygame
 from pygame.locals import DOUBLEBUF, OPENGL, RESIZABLE
 
-from game.consts import GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from game.consts import GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH, VSYNC
+from engine.graphics.gpu_resources import GpuResources
 from engine.graphics.opengl_utils import OpenGLUtils
+from engine.shader_utils import ShaderUtils
 
 
 class DisplayManager:
+    @staticmethod
+    def set_mode(screen_size: tuple[int, int]) -> pygame.Surface:
+        """Open the game window, with vsync when VSYNC is set and the driver allows it."""
+        if VSYNC:
+            try:
+                return pygame.display.set_mode(screen_size, DOUBLEBUF | OPENGL | RESIZABLE, vsync=1)
+            except pygame.error:
+                pass
+
+        return pygame.display.set_mode(screen_size, DOUBLEBUF | OPENGL | RESIZABLE)
+
     def set_screen_size(
         self,
         screen: pygame.Surface,
@@ -16,9 +29,13 @@ class DisplayManager:
         screen_size: tuple[int, int]
     ) -> pygame.Surface:
         # Set up the viewport to maintain aspect ratio
-        screen = pygame.display.set_mode(screen_size, DOUBLEBUF | OPENGL | RESIZABLE)
+        screen = DisplayManager.set_mode(screen_size)
         glViewport(0, 0, *screen_size)
 
+        # Recreate GL objects if set_mode() gave us a new context
+        if GpuResources.check_context():
+            shader = ShaderUtils.get_program(shader)
+
         # Update the projection matrix in the shader
         glUseProgram(shader)
         uProjection = glGetUniformLocation(shader, "uProjection")
@@ -0,0 +1,173 @@
+"""
+Registry of every GL object created by the game.
+
+Each buffer, VAO, texture and program is created (or registered) here with
+an owner tag, so live counts and GPU bytes can be reported per tag.
+Releasing an object only queues it: the queue is deleted in batches by
+collect() at the end of the frame, when nothing can still be drawing it.
+
+When the display is recreated with a new GL context every handle becomes
+invalid. check_context() detects it through a sentinel VAO, forgets the
+stale handles and calls the rebuild callbacks of the owners.
+"""
+
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Callable
+import weakref
+
+from OpenGL.GL import *  # type: ignore
+import numpy as np
+
+
+class GpuResourceType(Enum):
+    BUFFER = auto()
+    VERTEX_ARRAY = auto()
+    TEXTURE = auto()
+    PROGRAM = auto()
+
+
+@dataclass
+class GpuResource:
+    type: GpuResourceType
+    handle: int
+    tag: str
+    nbytes: int = 0
+
+
+class GpuResources:
+    __resources: dict[tuple[GpuResourceType, int], GpuResource] = {}
+    __pending: list[GpuResource] = []
+    __rebuild_callbacks: list[Callable[[], Callable[[], None] | None]] = []
+    __sentinel: int | None = None
+
+    @classmethod
+    def gen_buffer(cls, tag: str) -> int:
+        return cls.__add(GpuResourceType.BUFFER, glGenBuffers(1), tag)
+
+    @classmethod
+    def gen_vertex_array(cls, tag: str) -> int:
+        return cls.__add(GpuResourceType.VERTEX_ARRAY, glGenVertexArrays(1), tag)
+
+    @classmethod
+    def gen_texture(cls, tag: str) -> int:
+        return cls.__add(GpuResourceType.TEXTURE, glGenTextures(1), tag)
+
+    @classmethod
+    def add_program(cls, program: int, tag: str) -> int:
+        """Register a program linked elsewhere (see ShaderUtils)."""
+        return cls.__add(GpuResourceType.PROGRAM, program, tag)
+
+    @classmethod
+    def __add(cls, resource_type: GpuResourceType, handle: int, tag: str) -> int:
+        handle = int(handle)
+        cls.__resources[(resource_type, handle)] = GpuResource(resource_type, handle, tag)
+        return handle
+
+    @classmethod
+    def buffer_data(cls, target, buffer: int, data: np.ndarray | None, usage, nbytes: int | None = None) -> None:
+        """glBufferData() on a bound buffer, recording its size.
+
+        Args:
+            target: Buffer binding target, buffer must already be bound to it
+            buffer: Buffer handle, used for the accounting
+            data: Data to upload, or None to only allocate storage
+            usage: GL usage hint
+            nbytes: Storage size, defaults to data.nbytes
+        """
+        if nbytes is None:
+            nbytes = data.nbytes if data is not None else 0
+
+        glBufferData(target, nbytes, data, usage)
+        cls.set_nbytes(GpuResourceType.BUFFER, buffer, nbytes)
+
+    @classmethod
+    def set_nbytes(cls, resource_type: GpuResourceType, handle: int, nbytes: int) -> None:
+        resource = cls.__resources.get((resource_type, int(handle)))
+        if resource is not None:
+            resource.nbytes = nbytes
+
+    @classmethod
+    def release(cls, resource_type: GpuResourceType, handle: int | None) -> None:
+        """Queue an object for deletion at the end of the frame."""
+        if not handle:
+            return
+
+        resource = cls.__resources.pop((resource_type, int(handle)), None)
+        if resource is not None:
+            cls.__pending.append(resource)
+
+    @classmethod
+    def collect(cls) -> None:
+        """Delete every released object, one GL call per object type."""
+        if not cls.__pending:
+            return
+
+        handles: dict[GpuResourceType, list[int]] = {resource_type: [] for resource_type in GpuResourceType}
+        for resource in cls.__pending:
+            handles[resource.type].append(resource.handle)
+        cls.__pending = []
+
+        if handles[GpuResourceType.VERTEX_ARRAY]:
+            glDeleteVertexArrays(len(handles[GpuResourceType.VERTEX_ARRAY]), handles[GpuResourceType.VERTEX_ARRAY])
+        if handles[GpuResourceType.BUFFER]:
+            glDeleteBuffers(len(handles[GpuResourceType.BUFFER]), handles[GpuResourceType.BUFFER])
+        if handles[GpuResourceType.TEXTURE]:
+            glDeleteTextures(handles[GpuResourceType.TEXTURE])
+        for program in handles[GpuResourceType.PROGRAM]:
+            glDeleteProgram(program)
+
+    @classmethod
+    def get_stats(cls) -> dict[str, tuple[int, int]]:
+        """Return tag -> (live objects, bytes) for everything not yet released."""
+        stats: dict[str, tuple[int, int]] = {}
+        for resource in cls.__resources.values():
+            count, nbytes = stats.get(resource.tag, (0, 0))
+            stats[resource.tag] = (count + 1, nbytes + resource.nbytes)
+        return stats
+
+    @classmethod
+    def add_rebuild_callback(cls, callback: Callable[[], None]) -> None:
+        """Call `callback` to recreate the owner's objects after a context loss.
+
+        Bound methods are held weakly, so registering does not keep the owner alive.
+        """
+        # Drop the callbacks of owners that are gone, the list would grow with every object otherwise
+        cls.__rebuild_callbacks = [reference for reference in cls.__rebuild_callbacks if reference() is not None]
+
+        if hasattr(callback, "__self__"):
+            cls.__rebuild_callbacks.append(weakref.WeakMethod(callback))  # type: ignore
+        else:
+            cls.__rebuild_callbacks.append(lambda: callback)
+
+    @classmethod
+    def check_context(cls) -> bool:
+        """Rebuild everything if the GL context was recreated, return True if it was.
+
+        Must be called with the current context, right after the display is (re)created.
+        """
+        if cls.__sentinel is not None and glIsVertexArray(cls.__sentinel):
+            return False
+
+        is_lost = cls.__sentinel is not None
+        cls.__sentinel = int(glGenVertexArrays(1))
+
+        if is_lost:
+            cls.__rebuild()
+
+        return is_lost
+
+    @classmethod
+    def __rebuild(cls) -> None:
+        # The old handles died with their context: nothing to delete
+        cls.__resources.clear()
+        cls.__pending.clear()
+
+        callbacks = [callback() for callback in cls.__rebuild_callbacks]
+        cls.__rebuild_callbacks = [
+            reference for reference, callback in zip(cls.__rebuild_callbacks, callbacks) if callback is not None
+        ]
+
+        for callback in callbacks:
+            if callback is not None:
+                callback()
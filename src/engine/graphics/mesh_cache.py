@@ -0,0 +1,130 @@
+"""
+On-disk cache of processed meshes.
+
+Each source file gets a folder under .cache/meshes with one uncompressed
+.npy file per MeshData array (LOD arrays prefixed with "lod<level>_") and
+a meta.json describing the source it was built from. Warm loads memory-map
+the arrays and never touch the source format loader.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable
+
+import numpy as np
+
+from engine.common import get_cache_path
+from engine.graphics.opengl_3d_utils import MeshData
+
+
+class MeshCache:
+    # Bump when the processing that produces MeshData changes
+    VERSION = 3
+
+    ARRAYS = ("vertices", "normals", "faces", "edges")
+
+    @staticmethod
+    def load(file_path: str, build: Callable[[str], MeshData]) -> MeshData:
+        """Return the cached mesh for `file_path`, building and storing it with `build` if stale."""
+        folder = MeshCache.__get_folder(file_path)
+        meta = MeshCache.__read_meta(folder)
+        stat = os.stat(file_path)
+
+        if meta is not None and not MeshCache.__is_fresh(folder, meta, file_path, stat):
+            meta = None
+
+        if meta is not None:
+            try:
+                return MeshCache.__read_mesh(folder, file_path, meta)
+            except (OSError, ValueError):
+                pass
+
+        mesh = build(file_path)
+        MeshCache.__write(folder, file_path, stat, mesh)
+        return mesh
+
+    @staticmethod
+    def __get_folder(file_path: str) -> str:
+        key = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+        # Created by __write() only: a missing source must not leave an empty folder
+        return get_cache_path("meshes", key, create=False)
+
+    @staticmethod
+    def __read_meta(folder: str) -> dict | None:
+        try:
+            with open(os.path.join(folder, "meta.json"), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def __is_fresh(folder: str, meta: dict, file_path: str, stat: os.stat_result) -> bool:
+        if meta.get("version") != MeshCache.VERSION or meta.get("path") != os.path.abspath(file_path):
+            return False
+
+        if meta.get("mtime") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+            return True
+
+        # Touched but maybe not changed (e.g. a fresh checkout): compare the contents
+        if meta.get("sha256") != MeshCache.__hash_file(file_path):
+            return False
+
+        meta["mtime"], meta["size"] = stat.st_mtime_ns, stat.st_size
+        MeshCache.__write_meta(folder, meta)
+        return True
+
+    @staticmethod
+    def __hash_file(file_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def __read_mesh(folder: str, file_path: str, meta: dict) -> MeshData:
+        mesh = MeshCache.__read_arrays(folder, "", file_path)
+        mesh.lods = [
+            MeshCache.__read_arrays(folder, f"lod{level}_", file_path, lod_error)
+            for level, lod_error in enumerate(meta.get("lods", []), 1)
+        ]
+        return mesh
+
+    @staticmethod
+    def __read_arrays(folder: str, prefix: str, file_path: str, lod_error: float = 0.0) -> MeshData:
+        arrays = {
+            name: np.load(os.path.join(folder, f"{prefix}{name}.npy"), mmap_mode='r')
+            for name in MeshCache.ARRAYS
+        }
+        return MeshData(**arrays, source_path=file_path, lod_error=lod_error)
+
+    @staticmethod
+    def __write(folder: str, file_path: str, stat: os.stat_result, mesh: MeshData) -> None:
+        try:
+            os.makedirs(folder, exist_ok=True)
+            for prefix, level in [("", mesh)] + [(f"lod{i}_", lod) for i, lod in enumerate(mesh.lods, 1)]:
+                for name in MeshCache.ARRAYS:
+                    np.save(os.path.join(folder, f"{prefix}{name}.npy"), np.ascontiguousarray(getattr(level, name)))
+
+            # Written last: the arrays are only trusted once the meta matches
+            meta = {
+                "version": MeshCache.VERSION,
+                "path": os.path.abspath(file_path),
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": MeshCache.__hash_file(file_path),
+                "lods": [lod.lod_error for lod in mesh.lods],
+            }
+            MeshCache.__write_meta(folder, meta)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
+    @staticmethod
+    def __write_meta(folder: str, meta: dict) -> None:
+        try:
+            with open(os.path.join(folder, "meta.json"), 'w') as f:
+                json.dump(meta, f, indent=4)
+        except OSError:
+            pass
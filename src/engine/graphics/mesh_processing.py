@@ -0,0 +1,218 @@
+"""
+Offline processing of imported meshes.
+
+Runs once per model when the mesh cache is cold:
+- welds duplicate vertices of the triangle soup,
+- reorders triangles for the post-transform vertex cache (Tipsify) and
+  vertices for fetch locality,
+- builds coarser levels of detail by vertex clustering.
+"""
+
+import numpy as np
+
+from engine.graphics.opengl_3d_utils import MeshData
+
+
+class MeshProcessing:
+    # Vertices closer than this (in normalized model units) are the same vertex
+    WELD_TOLERANCE = 1e-5
+
+    # Cluster cell size of each LOD, in normalized model units (the model fits in a unit cube)
+    LOD_CELL_SIZES = (1 / 64, 1 / 32, 1 / 16)
+
+    # Vertex cache size assumed by the triangle reordering
+    CACHE_SIZE = 16
+
+    @staticmethod
+    def process(mesh: MeshData) -> MeshData:
+        """Return the welded, cache-optimized mesh with its LODs attached."""
+        vertices, normals, faces = MeshProcessing.weld(mesh.vertices, mesh.normals, mesh.faces.reshape(-1, 3))
+        vertices, normals, faces = MeshProcessing.optimize_vertex_cache(vertices, normals, faces)
+
+        lods = []
+        for cell_size in MeshProcessing.LOD_CELL_SIZES:
+            lod_vertices, lod_faces, lod_error = MeshProcessing.simplify(vertices, faces, cell_size)
+
+            # Not worth a level if clustering barely removed anything
+            previous_count = len(lods[-1].faces) if lods else len(faces) * 3
+            if len(lod_faces) == 0 or len(lod_faces) * 3 > previous_count * 0.8:
+                continue
+
+            lod_normals = MeshProcessing.compute_normals(lod_vertices, lod_faces)
+            lod_vertices, lod_normals, lod_faces = MeshProcessing.optimize_vertex_cache(
+                lod_vertices, lod_normals, lod_faces
+            )
+            lods.append(MeshProcessing.__create_mesh(lod_vertices, lod_normals, lod_faces, mesh.source_path, lod_error))
+
+        result = MeshProcessing.__create_mesh(vertices, normals, faces, mesh.source_path, 0.0)
+        result.lods = lods
+        return result
+
+    @staticmethod
+    def __create_mesh(
+        vertices: np.ndarray,
+        normals: np.ndarray,
+        faces: np.ndarray,
+        source_path: str,
+        lod_error: float
+    ) -> MeshData:
+
+        return MeshData(
+            vertices=vertices.astype(np.float32),
+            normals=normals.astype(np.float32),
+            faces=faces.flatten().astype(np.uint32),
+            edges=MeshProcessing.unique_edges(faces).flatten().astype(np.uint32),
+            source_path=source_path,
+            lod_error=lod_error
+        )
+
+    @staticmethod
+    def weld(vertices: np.ndarray, normals: np.ndarray, faces: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Merge vertices that share a position, dropping triangles that collapse."""
+        keys = np.round(vertices / MeshProcessing.WELD_TOLERANCE).astype(np.int64)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+        faces = inverse.reshape(-1)[faces]
+        faces = faces[MeshProcessing.__non_degenerate(faces)]
+
+        return vertices[first], normals[first], faces
+
+    @staticmethod
+    def simplify(vertices: np.ndarray, faces: np.ndarray, cell_size: float) -> tuple[np.ndarray, np.ndarray, float]:
+        """Vertex clustering: every grid cell of `cell_size` collapses to the mean of its vertices.
+
+        Also returns the largest distance a vertex moved, at most `cell_size` * sqrt(3).
+        """
+        cells = np.floor(vertices / cell_size).astype(np.int64)
+        _, inverse = np.unique(cells, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        cluster_count = inverse.max() + 1
+        sums = np.zeros((cluster_count, 3), dtype=np.float64)
+        np.add.at(sums, inverse, vertices)
+        cluster_vertices = sums / np.bincount(inverse, minlength=cluster_count)[:, None]
+        error = float(np.linalg.norm(cluster_vertices[inverse] - vertices, axis=1).max())
+
+        faces = inverse[faces]
+        faces = faces[MeshProcessing.__non_degenerate(faces)]
+
+        # Triangles that collapsed onto the same three clusters
+        _, unique = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+        faces = faces[np.sort(unique)]
+
+        return cluster_vertices.astype(np.float32), faces, error
+
+    @staticmethod
+    def compute_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+        """Area-weighted vertex normals."""
+        triangles = vertices[faces]
+        face_normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+        normals = np.zeros_like(vertices, dtype=np.float64)
+        for corner in range(3):
+            np.add.at(normals, faces[:, corner], face_normals)
+
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        return normals / np.where(lengths > 0, lengths, 1.0)
+
+    @staticmethod
+    def unique_edges(faces: np.ndarray) -> np.ndarray:
+        edges = np.concatenate((faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]))
+        return np.unique(np.sort(edges, axis=1), axis=0)
+
+    @staticmethod
+    def optimize_vertex_cache(
+        vertices: np.ndarray,
+        normals: np.ndarray,
+        faces: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reorder triangles with Tipsify, then vertices in order of first use."""
+        faces = faces[MeshProcessing.__tipsify(faces, len(vertices))]
+
+        # Renumber vertices in the order the GPU fetches them; unused ones are dropped
+        flat = faces.reshape(-1)
+        _, first_use = np.unique(flat, return_index=True)
+        order = flat[np.sort(first_use)]
+
+        remap = np.full(len(vertices), -1, dtype=np.int64)
+        remap[order] = np.arange(len(order))
+
+        return vertices[order], normals[order], remap[faces]
+
+    @staticmethod
+    def __tipsify(faces: np.ndarray, vertex_count: int) -> np.ndarray:
+        """Return the triangle order of Tipsify (Sander et al. 2007)."""
+        cache_size = MeshProcessing.CACHE_SIZE
+        triangle_count = len(faces)
+
+        # Triangles around each vertex
+        flat = faces.reshape(-1)
+        live = np.bincount(flat, minlength=vertex_count)
+        offsets = np.concatenate(([0], np.cumsum(live)))
+        adjacency = (np.argsort(flat, kind='stable') // 3).tolist()
+        offsets = offsets.tolist()
+        live = live.tolist()
+        faces_list = faces.tolist()
+
+        cache_time = [0] * vertex_count
+        emitted = [False] * triangle_count
+        dead_end: list[int] = []
+        order: list[int] = []
+
+        time = cache_size + 1
+        cursor = 0
+        fan = 0 if triangle_count else -1
+
+        while fan >= 0:
+            candidates: list[int] = []
+
+            # Emit every remaining triangle around the fanning vertex
+            for triangle in adjacency[offsets[fan]:offsets[fan + 1]]:
+                if emitted[triangle]:
+                    continue
+
+                for vertex in faces_list[triangle]:
+                    dead_end.append(vertex)
+                    candidates.append(vertex)
+                    live[vertex] -= 1
+                    if time - cache_time[vertex] > cache_size:
+                        cache_time[vertex] = time
+                        time += 1
+
+                emitted[triangle] = True
+                order.append(triangle)
+
+            # Next fanning vertex: the oldest candidate still in the cache after its remaining triangles
+            fan = -1
+            best_priority = -1
+            for vertex in candidates:
+                if live[vertex] <= 0:
+                    continue
+
+                priority = 0
+                if time - cache_time[vertex] + 2 * live[vertex] <= cache_size:
+                    priority = time - cache_time[vertex]
+
+                if priority > best_priority:
+                    fan, best_priority = vertex, priority
+
+            if fan >= 0:
+                continue
+
+            # Dead end: the most recently used vertex with triangles left, else the next one in order
+            while dead_end:
+                vertex = dead_end.pop()
+                if live[vertex] > 0:
+                    fan = vertex
+                    break
+
+            if fan < 0:
+                while cursor < vertex_count and live[cursor] <= 0:
+                    cursor += 1
+                fan = cursor if cursor < vertex_count else -1
+
+        return np.array(order, dtype=np.int64)
+
+    @staticmethod
+    def __non_degenerate(faces: np.ndarray) -> np.ndarray:
+        return (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
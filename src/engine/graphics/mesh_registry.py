@@ -0,0 +1,92 @@
+"""
+Registry of meshes uploaded to the GPU.
+
+Every MeshData is uploaded once, keyed by its source file, and shared by
+all objects drawing it. Owners acquire a GpuMesh and release it when they
+are done; the GL objects are freed when the last reference goes away.
+The LODs of a mesh are uploaded with it and share its lifetime.
+"""
+
+from dataclasses import dataclass, field
+
+from engine.graphics.gpu_resources import GpuResources
+from engine.graphics.opengl_3d_utils import MeshData
+from engine.graphics.renderer_3d import Renderer3D
+
+
+@dataclass
+class GpuMesh:
+    mesh: MeshData
+    vao: int = 0
+    ebo_faces: int = 0
+    ebo_edges: int = 0
+    references: int = 0
+    renderer: Renderer3D = field(default_factory=Renderer3D)
+    lods: list["GpuMesh"] = field(default_factory=list)
+
+    def upload(self) -> None:
+        self.vao, self.ebo_faces, self.ebo_edges = self.renderer.create_vao_ebo(self.mesh)
+
+        # LODs are owned (and freed) by the renderer of the full mesh
+        self.lods = [GpuMesh(lod, renderer=self.renderer) for lod in self.mesh.lods]
+        for lod in self.lods:
+            lod.upload()
+
+    def select_lod(self, pixel_size: float, max_error: float) -> "GpuMesh":
+        """Return the coarsest level whose simplification error stays under `max_error` pixels.
+
+        Args:
+            pixel_size: On-screen size of the (unit-sized) model in pixels
+            max_error: Largest acceptable vertex displacement in pixels
+        """
+        selected = self
+        for lod in self.lods:
+            if lod.mesh.lod_error * pixel_size > max_error:
+                break
+            selected = lod
+        return selected
+
+
+class MeshRegistry:
+    __meshes: dict[str, GpuMesh] = {}
+
+    @classmethod
+    def acquire(cls, mesh: MeshData) -> GpuMesh:
+        """Return the shared GPU copy of `mesh`, uploading it on first use."""
+        key = cls.__get_key(mesh)
+
+        if key not in cls.__meshes:
+            gpu_mesh = GpuMesh(mesh)
+            gpu_mesh.upload()
+            cls.__meshes[key] = gpu_mesh
+
+        gpu_mesh = cls.__meshes[key]
+        gpu_mesh.references += 1
+        return gpu_mesh
+
+    @classmethod
+    def release(cls, mesh: MeshData) -> None:
+        """Drop one reference, freeing the GL objects with the last one."""
+        key = cls.__get_key(mesh)
+        gpu_mesh = cls.__meshes.get(key)
+        if gpu_mesh is None:
+            return
+
+        gpu_mesh.references -= 1
+        if gpu_mesh.references <= 0:
+            gpu_mesh.renderer.cleanup()
+            del cls.__meshes[key]
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """Upload every live mesh again, e.g. on a new GL context."""
+        for gpu_mesh in cls.__meshes.values():
+            gpu_mesh.upload()
+
+    @staticmethod
+    def __get_key(mesh: MeshData) -> str:
+        # Meshes built in memory have no file to be shared by
+        return mesh.source_path or f"<mesh {id(mesh)}>"
+
+
+GpuResources.add_rebuild_callback(MeshRegistry.rebuild)
@@ -0,0 +1,197 @@
+"""
+Batch renderer for 3D meshes using instanced rendering.
+
+The matrices of every instance are computed in one vectorized pass per
+frame into a preallocated instance buffer. Each instance draws the
+coarsest LOD of its mesh that is indistinguishable at its on-screen size.
+Instances are grouped by mesh level, and each level is drawn with a single
+glDrawElementsInstanced call.
+"""
+
+from OpenGL.GL import *  # type: ignore
+import numpy as np
+import ctypes
+
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+from engine.graphics.mesh_registry import GpuMesh, MeshRegistry
+from engine.graphics.opengl_3d_utils import MeshData, OpenGL_3D_Utils
+from engine.shader_utils import ShaderUtils
+
+
+class MeshesRenderer:
+    """Renders every instance of each mesh in a single draw call."""
+
+    # Floats per instance: model (16), mvp (16), normal matrix (9), color (3)
+    INSTANCE_FLOATS = 44
+
+    # (first location, locations, components per location, offset in floats)
+    INSTANCE_ATTRIBUTES = ((2, 4, 4, 0), (6, 4, 4, 16), (10, 3, 3, 32), (13, 1, 3, 41))
+
+    # Largest vertex displacement of a LOD allowed on screen, in pixels
+    LOD_MAX_ERROR_PIXELS = 1.0
+
+    def __init__(self, shader, capacity: int = 16):
+        """
+        Initialize the meshes renderer.
+
+        Args:
+            shader: The 3D shader program to use for rendering
+            capacity: Initial number of instances the buffer can hold
+        """
+        self.__shader = shader
+        self.__setup_uniforms()
+
+        # CPU staging copy of the instance buffer
+        self.__instances = np.zeros((capacity, self.INSTANCE_FLOATS), dtype=np.float32)
+
+        # (mesh, first instance, instance count) of the last update()
+        self.__batches: list[tuple[GpuMesh, int, int]] = []
+
+        # GPU copy of every mesh drawn so far by id(), with the MeshData to keep that id valid
+        self.__gpu_meshes: dict[int, tuple[MeshData, GpuMesh]] = {}
+
+        self.__setup_buffer()
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __setup_uniforms(self):
+        self.__uLightPos = glGetUniformLocation(self.__shader, "lightPos")
+        self.__uViewPos = glGetUniformLocation(self.__shader, "viewPos")
+
+    def __rebuild(self):
+        self.__shader = ShaderUtils.get_program(self.__shader)
+        self.__setup_uniforms()
+        self.__setup_buffer()
+
+    def __setup_buffer(self):
+        self.__vbo_instances = GpuResources.gen_buffer("meshes")
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_instances, self.__instances, GL_STREAM_DRAW)
+
+    def update(
+        self,
+        instances: list[tuple[MeshData, tuple[float, float], tuple[float, float, float], tuple[float, float, float]]],
+        projection: np.ndarray,
+        view: np.ndarray,
+        t: float,
+        pixels_per_unit: float
+    ) -> None:
+        """
+        Compute the matrices of every instance and upload them.
+
+        Args:
+            instances: (mesh, position, size, color) of each instance
+            projection: Row-major projection matrix
+            view: Row-major view matrix
+            t: Time of the shared spin around the Y axis
+            pixels_per_unit: Screen pixels per world unit, to pick the LODs
+        """
+        # The projection is orthographic: the on-screen size only depends on the instance size
+        instances = [
+            (
+                self.__get_gpu_mesh(mesh).select_lod(max(size) * pixels_per_unit, self.LOD_MAX_ERROR_PIXELS),
+                position,
+                size,
+                color
+            )
+            for mesh, position, size, color in instances
+        ]
+
+        # Group instances of the same mesh level together
+        instances = sorted(instances, key=lambda instance: id(instance[0]))
+        count = len(instances)
+
+        self.__batches = []
+        for i, (mesh, *_) in enumerate(instances):
+            if self.__batches and self.__batches[-1][0] is mesh:
+                first, batch_count = self.__batches[-1][1:]
+                self.__batches[-1] = (mesh, first, batch_count + 1)
+            else:
+                self.__batches.append((mesh, i, 1))
+
+        if count == 0:
+            return
+
+        if len(self.__instances) < count:
+            self.__instances = np.zeros((max(count, len(self.__instances) * 2), self.INSTANCE_FLOATS), dtype=np.float32)
+            glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+            GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_instances, self.__instances, GL_STREAM_DRAW)
+
+        positions = np.array([instance[1] for instance in instances], dtype=np.float32)
+        sizes = np.array([instance[2] for instance in instances], dtype=np.float32)
+        colors = np.array([instance[3] for instance in instances], dtype=np.float32)
+
+        # Order: projection @ view @ translate(world) @ scale(local) @ rotate(local)
+        rotation = OpenGL_3D_Utils.rotate(t)
+
+        transforms = np.zeros((count, 4, 4), dtype=np.float32)
+        transforms[:, :3, :3] = sizes[:, :, None] * rotation[None, :3, :3]
+        transforms[:, :2, 3] = positions
+        transforms[:, 3, 3] = 1.0
+
+        mvp = (projection @ view)[None] @ transforms
+
+        # Lighting is done in the rotated model space, as before
+        model = np.broadcast_to(rotation, (count, 4, 4))
+        normal_matrix = np.linalg.inv(model[:, :3, :3]).transpose(0, 2, 1)
+
+        # GL expects column-major matrices: transpose before flattening
+        staging = self.__instances[:count]
+        staging[:, 0:16] = model.transpose(0, 2, 1).reshape(count, 16)
+        staging[:, 16:32] = mvp.transpose(0, 2, 1).reshape(count, 16)
+        staging[:, 32:41] = normal_matrix.transpose(0, 2, 1).reshape(count, 9)
+        staging[:, 41:44] = colors
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, staging.nbytes, staging)
+
+    def __get_gpu_mesh(self, mesh: MeshData) -> GpuMesh:
+        """Return the shared GPU copy of `mesh`, held until cleanup()."""
+        entry = self.__gpu_meshes.get(id(mesh))
+        if entry is None:
+            entry = (mesh, MeshRegistry.acquire(mesh))
+            self.__gpu_meshes[id(mesh)] = entry
+        return entry[1]
+
+    def draw(self, light_pos: np.ndarray, camera_pos: np.ndarray) -> None:
+        """Draw the instances of the last update(), one call per mesh level."""
+        if not self.__batches:
+            return
+
+        glUseProgram(self.__shader)
+        glUniform3fv(self.__uLightPos, 1, light_pos)
+        glUniform3fv(self.__uViewPos, 1, camera_pos)
+
+        # Faces are opaque; state is set once for the whole pass
+        glEnable(GL_DEPTH_TEST)
+        glDisable(GL_BLEND)
+        glEnable(GL_POLYGON_OFFSET_FILL)
+        glPolygonOffset(1.0, 1.0)
+
+        stride = self.INSTANCE_FLOATS * 4
+
+        for mesh, first, count in self.__batches:
+            glBindVertexArray(mesh.vao)
+
+            # Point the mesh's instance attributes at its block of the instance buffer
+            glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+            for location, locations, size, offset in self.INSTANCE_ATTRIBUTES:
+                for column in range(locations):
+                    pointer = (first * self.INSTANCE_FLOATS + offset + column * size) * 4
+                    glEnableVertexAttribArray(location + column)
+                    glVertexAttribPointer(location + column, size, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(pointer))
+                    glVertexAttribDivisor(location + column, 1)
+
+            glDrawElementsInstanced(GL_TRIANGLES, len(mesh.mesh.faces), GL_UNSIGNED_INT, None, count)
+
+        glBindVertexArray(0)
+
+        glDisable(GL_POLYGON_OFFSET_FILL)
+        glEnable(GL_BLEND)
+
+    def cleanup(self) -> None:
+        """Free GPU resources (deleted at the end of the frame)."""
+        GpuResources.release(GpuResourceType.BUFFER, self.__vbo_instances)
+
+        for mesh, _ in self.__gpu_meshes.values():
+            MeshRegistry.release(mesh)
+        self.__gpu_meshes.clear()
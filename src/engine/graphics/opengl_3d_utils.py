@@ -4,10 +4,8 @@ import math
 import os
 
 import numpy as np
-import trimesh
 
-from dataclasses import dataclass
-import numpy as np
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -16,6 +14,9 @@ class MeshData:
     normals: np.ndarray   # (N, 3) float32
     faces: np.ndarray     # (M,) uint32 (flat index buffer)
     edges: np.ndarray     # (K,) uint32 (flat index buffer)
+    source_path: str = ""  # file the mesh was loaded from
+    lod_error: float = 0.0  # largest vertex displacement of this level (0 for the full mesh)
+    lods: list["MeshData"] = field(default_factory=list)  # coarser levels, finest first
 
     @property
     def face_count(self):
@@ -61,6 +62,17 @@ class OpenGL_3D_Utils:
 
     @staticmethod
     def load(file_path: str) -> MeshData:
+        """Load a processed mesh, from the mesh cache when it is up to date."""
+        from engine.graphics.mesh_cache import MeshCache
+
+        return MeshCache.load(file_path, OpenGL_3D_Utils.load_uncached)
+
+    @staticmethod
+    def load_uncached(file_path: str) -> MeshData:
+        # trimesh is slow to import and only needed when the cache is cold
+        import trimesh
+
+        from engine.graphics.mesh_processing import MeshProcessing
 
         mesh = trimesh.load(file_path)
 
@@ -89,7 +101,9 @@ class OpenGL_3D_Utils:
             vertices=mesh.vertices.astype(np.float32),
             normals=mesh.vertex_normals.astype(np.float32),
             faces=mesh.faces.flatten().astype(np.uint32),
-            edges=mesh.edges_unique.flatten().astype(np.uint32)
+            edges=mesh.edges_unique.flatten().astype(np.uint32),
+            source_path=file_path
         )
 
-        return data
+        # Weld, reorder for the vertex cache and build the LODs
+        return MeshProcessing.process(data)
@@ -0,0 +1,66 @@
+"""
+Batch renderer for players using instanced rendering.
+
+Each player is two quads: the health square, scaled by the remaining
+health around the player's center, and the translucent body on top of
+it. Taking damage only changes the instance data, never the geometry.
+"""
+
+from game.consts import PLAYER_HEALTH
+from game.entities.player import Player
+from engine.graphics.quads_renderer import QuadsRenderer
+
+
+class PlayersRenderer:
+    """Renders all players in a single draw call using instanced rendering."""
+
+    # Alpha of the body quad drawn over the health square
+    BODY_ALPHA = 0.4
+
+    def __init__(self, shader):
+        """
+        Initialize the player renderer.
+
+        Args:
+            shader: The quads shader program to use for rendering
+        """
+        self.__quads = QuadsRenderer(shader)
+
+        # CPU staging copy of the instance buffer, two quads per player
+        self.__instances = QuadsRenderer.create_instances(8)
+
+    def update(self, players: list[Player], alpha: float = 1.0) -> None:
+        """Pack the health and body quads of every player into the instance buffer.
+
+        Args:
+            players: The players to draw
+            alpha: Position between the previous (0) and the current (1) update, see FrameScheduler
+        """
+        count = len(players) * 2
+        if len(self.__instances) < count:
+            self.__instances = QuadsRenderer.create_instances(max(count, len(self.__instances) * 2))
+
+        instances = self.__instances[:count]
+
+        for i, player in enumerate(players):
+            rect = player.rect
+            x, y = player.get_draw_position(alpha)
+            size = rect.w * max(player.get_health(), 0.0) / PLAYER_HEALTH
+
+            # Health first, the translucent body is blended over it
+            instances[2 * i] = (
+                x + (rect.w - size) / 2, y + (rect.h - size) / 2, size, size, 0.0, *player._color
+            )
+            instances[2 * i + 1] = (
+                x, y, rect.w, rect.h, 0.0, *player._color[:3], self.BODY_ALPHA
+            )
+
+        self.__quads.set_quads(instances)
+
+    def draw(self) -> None:
+        """Draw all players currently stored in the instance buffer."""
+        self.__quads.draw()
+
+    def cleanup(self) -> None:
+        """Free GPU resources."""
+        self.__quads.cleanup()
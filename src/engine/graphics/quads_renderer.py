@@ -0,0 +1,137 @@
+"""
+Batch renderer for colored quads using instanced rendering.
+
+Every quad is an instance of one shared unit square; the per-instance
+buffer holds its offset, size, rotation angle and color. Callers pack
+their quads once per frame and get a single draw call for all of them.
+"""
+
+from OpenGL.GL import *  # type: ignore
+import numpy as np
+import ctypes
+
+from game.consts import GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+from engine.graphics.opengl_utils import OpenGLUtils
+from engine.shader_utils import ShaderUtils
+
+
+class QuadsRenderer:
+    """Renders a batch of colored, rotated quads in a single draw call."""
+
+    # Floats per instance: offset (2), size (2), angle (1), color (4)
+    INSTANCE_FLOATS = 9
+
+    def __init__(self, shader, capacity: int = 64):
+        """
+        Initialize the quads renderer.
+
+        Args:
+            shader: The quads shader program to use for rendering
+            capacity: Initial number of instances the GPU buffer can hold
+        """
+        self.__shader = shader
+        self.__vao = None
+        self.__vbo_vertices = None
+        self.__vbo_instances = None
+        self.__vertex_count = 4
+        self.__instance_count = 0
+        self.__capacity = capacity
+
+        self.__setup_projection()
+        self.__setup_vao()
+
+        # Instances are re-uploaded every frame, only the buffers need recreating
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __setup_projection(self):
+        glUseProgram(self.__shader)
+        uProjection = glGetUniformLocation(self.__shader, "uProjection")
+        projection = OpenGLUtils.ortho(0, GAME_FIELD_WIDTH, 0, GAME_FIELD_HEIGHT, -1, 1)
+        glUniformMatrix4fv(uProjection, 1, GL_FALSE, projection.T)
+
+    def __rebuild(self):
+        self.__shader = ShaderUtils.get_program(self.__shader)
+        self.__setup_projection()
+        self.__setup_vao()
+
+    @staticmethod
+    def create_instances(count: int) -> np.ndarray:
+        """Return a zeroed instance array for `count` quads."""
+        return np.zeros((count, QuadsRenderer.INSTANCE_FLOATS), dtype=np.float32)
+
+    def __setup_vao(self):
+        """Setup VAO with the shared quad and the per-instance attributes."""
+        self.__vao = GpuResources.gen_vertex_array("quads")
+        glBindVertexArray(self.__vao)
+
+        # Unit square, scaled to the instance size in the vertex shader
+        vertices = OpenGLUtils.create_square_vertices(1.0)
+        self.__vbo_vertices = GpuResources.gen_buffer("quads")
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_vertices)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo_vertices, vertices, GL_STATIC_DRAW)
+
+        # Vertex position attribute (location = 0)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 8, ctypes.c_void_p(0))
+
+        # Interleaved instance buffer (filled by set_quads())
+        self.__vbo_instances = GpuResources.gen_buffer("quads")
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+        GpuResources.buffer_data(
+            GL_ARRAY_BUFFER, self.__vbo_instances, None, GL_STREAM_DRAW, self.__capacity * self.INSTANCE_FLOATS * 4
+        )
+
+        # (location, components, offset in floats)
+        stride = self.INSTANCE_FLOATS * 4
+        for location, size, offset in ((1, 2, 0), (2, 2, 2), (3, 1, 4), (4, 4, 5)):
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(offset * 4))
+            glVertexAttribDivisor(location, 1)  # Advance once per instance
+
+        glBindVertexArray(0)
+
+    def set_quads(self, instances: np.ndarray) -> None:
+        """
+        Upload the quads to draw, replacing the previous ones.
+
+        Args:
+            instances: float32 array of shape (N, INSTANCE_FLOATS), see create_instances()
+        """
+        count = len(instances)
+        self.__instance_count = count
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.__vbo_instances)
+
+        if count > self.__capacity:
+            # Out of space: reallocate the buffer with the new data
+            while self.__capacity < count:
+                self.__capacity *= 2
+            GpuResources.buffer_data(
+                GL_ARRAY_BUFFER, self.__vbo_instances, None, GL_STREAM_DRAW, self.__capacity * self.INSTANCE_FLOATS * 4
+            )
+
+        if count > 0:
+            glBufferSubData(GL_ARRAY_BUFFER, 0, instances.nbytes, instances)
+
+    def draw(self) -> None:
+        """Draw all quads currently stored in the instance buffer."""
+        if self.__instance_count == 0:
+            return
+
+        glUseProgram(self.__shader)
+
+        # Draw all instances in one call
+        glBindVertexArray(self.__vao)
+        glDrawArraysInstanced(GL_TRIANGLE_FAN, 0, self.__vertex_count, self.__instance_count)
+        glBindVertexArray(0)
+
+    def cleanup(self) -> None:
+        """Free GPU resources (deleted at the end of the frame)."""
+        if self.__vao:
+            GpuResources.release(GpuResourceType.BUFFER, self.__vbo_vertices)
+            GpuResources.release(GpuResourceType.BUFFER, self.__vbo_instances)
+            GpuResources.release(GpuResourceType.VERTEX_ARRAY, self.__vao)
+            self.__vao = None
+            self.__vbo_vertices = None
+            self.__vbo_instances = None
@@ -1,17 +1,18 @@
 
 from OpenGL.GL import *  # type: ignore
 import numpy as np
+from engine.graphics.gpu_resources import GpuResources
 from game.systems.float_rect import FloatRect
 
 
 class Renderer2D:
-    def create_vao_vbo(self, vertices: np.ndarray) -> tuple[int, int]:
-        vao = glGenVertexArrays(1)
+    def create_vao_vbo(self, vertices: np.ndarray, tag: str = "2d") -> tuple[int, int]:
+        vao = GpuResources.gen_vertex_array(tag)
         glBindVertexArray(vao)
 
-        vbo = glGenBuffers(1)
+        vbo = GpuResources.gen_buffer(tag)
         glBindBuffer(GL_ARRAY_BUFFER, vbo)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, vbo, vertices, GL_STATIC_DRAW)
 
         return vao, vbo
 
@@ -1,93 +1,57 @@
 
 from OpenGL.GL import *  # type: ignore
-import numpy as np
-from engine.graphics.opengl_3d_utils import MeshData, OpenGL_3D_Utils
-from game.systems.float_rect import FloatRect
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+from engine.graphics.opengl_3d_utils import MeshData
 
 
 class Renderer3D:
-    def create_vao_ebo(self, model_mesh: MeshData):
-        vao = glGenVertexArrays(1)
-        vbo_pos = glGenBuffers(1)
-        vbo_norm = glGenBuffers(1)
-        ebo_faces = glGenBuffers(1)
-        ebo_edges = glGenBuffers(1)
+    def __init__(self) -> None:
+        # Every object created by create_vao_ebo(), released by cleanup()
+        self.__vaos: list[int] = []
+        self.__buffers: list[int] = []
+
+    def create_vao_ebo(self, model_mesh: MeshData, tag: str = "meshes"):
+        vao = GpuResources.gen_vertex_array(tag)
+        vbo_pos = GpuResources.gen_buffer(tag)
+        vbo_norm = GpuResources.gen_buffer(tag)
+        ebo_faces = GpuResources.gen_buffer(tag)
+        ebo_edges = GpuResources.gen_buffer(tag)
+
+        self.__vaos.append(vao)
+        self.__buffers += [vbo_pos, vbo_norm, ebo_faces, ebo_edges]
 
         glBindVertexArray(vao)
 
         # Positions
         glBindBuffer(GL_ARRAY_BUFFER, vbo_pos)
-        glBufferData(GL_ARRAY_BUFFER, model_mesh.vertices.nbytes, model_mesh.vertices, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, vbo_pos, model_mesh.vertices, GL_STATIC_DRAW)
         glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
         glEnableVertexAttribArray(0)
 
         # Normals
         glBindBuffer(GL_ARRAY_BUFFER, vbo_norm)
-        glBufferData(GL_ARRAY_BUFFER, model_mesh.normals.nbytes, model_mesh.normals, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, vbo_norm, model_mesh.normals, GL_STATIC_DRAW)
         glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 0, None)
         glEnableVertexAttribArray(1)
 
         # Faces EBO
         glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ebo_faces)
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, model_mesh.faces.nbytes, model_mesh.faces, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ELEMENT_ARRAY_BUFFER, ebo_faces, model_mesh.faces, GL_STATIC_DRAW)
 
         glBindVertexArray(0)
 
         # Edges EBO (можно биндать по необходимости)
         glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ebo_edges)
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, model_mesh.edges.nbytes, model_mesh.edges, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ELEMENT_ARRAY_BUFFER, ebo_edges, model_mesh.edges, GL_STATIC_DRAW)
 
         return vao, ebo_faces, ebo_edges
 
-    def draw_3d_model(
-        self,
-        position: tuple[float, float],
-        size: tuple[float, float, float],
-        color: tuple[float, float, float],
-        vao: int,
-        ebo_faces: int,
-        shader,
-        model_mesh: MeshData,
-        projection: 'np.ndarray',
-        view: 'np.ndarray',
-        t: float,
-        light_pos: 'np.ndarray',
-        camera_pos: 'np.ndarray',
-        uniforms: dict | None = None
-    ) -> None:
-
-        model = OpenGL_3D_Utils.rotate(t)
-        translate = OpenGL_3D_Utils.translate(position[0], position[1], 0.0)
-        scale_mat = OpenGL_3D_Utils.scale(size[0], size[1], size[2])
-        # Order: projection @ view @ translate(world) @ scale(local) @ rotate(local)
-        mvp = projection @ view @ translate @ scale_mat @ model
-
-        # Use cached uniform locations if provided (optimization)
-        if uniforms is None:
-            uniforms = {
-                "mvp": glGetUniformLocation(shader, "mvp"),
-                "model": glGetUniformLocation(shader, "model"),
-                "lightPos": glGetUniformLocation(shader, "lightPos"),
-                "viewPos": glGetUniformLocation(shader, "viewPos"),
-                "objectColor": glGetUniformLocation(shader, "objectColor"),
-            }
-
-        glUniformMatrix4fv(uniforms["mvp"], 1, GL_TRUE, mvp)
-        glUniformMatrix4fv(uniforms["model"], 1, GL_TRUE, model)
-        glUniform3fv(uniforms["lightPos"], 1, light_pos)
-        glUniform3fv(uniforms["viewPos"], 1, camera_pos)
-
-        glBindVertexArray(vao)
-
-        # --- Draw faces (opaque) ---
-        glEnable(GL_DEPTH_TEST)
-        glDisable(GL_BLEND)
-        glEnable(GL_POLYGON_OFFSET_FILL)
-        glPolygonOffset(1.0, 1.0)
-
-        glUniform3f(uniforms["objectColor"], *color)
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ebo_faces)
-        glDrawElements(GL_TRIANGLES, len(model_mesh.faces), GL_UNSIGNED_INT, None)
+    def cleanup(self) -> None:
+        """Free every VAO and buffer created by this renderer (deleted at the end of the frame)."""
+        for vao in self.__vaos:
+            GpuResources.release(GpuResourceType.VERTEX_ARRAY, vao)
+        for buffer in self.__buffers:
+            GpuResources.release(GpuResourceType.BUFFER, buffer)
 
-        glDisable(GL_POLYGON_OFFSET_FILL)
-        glEnable(GL_BLEND)
+        self.__vaos.clear()
+        self.__buffers.clear()
@@ -0,0 +1,62 @@
+"""
+Renderer for the score labels above the players.
+
+The simulation only counts the scores; the text of a label is rebuilt
+when its player's score changes and the label follows the player.
+"""
+
+from engine.graphics.gpu_resources import GpuResources
+from engine.shader_utils import ShaderUtils
+from game.consts import BLOCK_SIZE
+from game.entities.player import Player
+from game.systems.scores import Scores
+
+
+class ScoresRenderer:
+    def __init__(self, shader):
+        """
+        Args:
+            shader: The 2d shader program to use for rendering
+        """
+        self.__shader = shader
+
+        # player id -> (label, shown score)
+        self.__scores: dict[int, tuple[Scores, int]] = {}
+
+        # New labels need the program of the new context, the existing ones rebuild themselves
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __rebuild(self) -> None:
+        self.__shader = ShaderUtils.get_program(self.__shader)
+
+    def update(self, players: list[Player], alpha: float = 1.0) -> None:
+        """Follow the positions and the scores of the players.
+
+        Args:
+            players: The players to label
+            alpha: Position between the previous (0) and the current (1) update, see FrameScheduler
+        """
+        for player in players:
+            score = player.get_scores()
+
+            if player._id not in self.__scores:
+                label = Scores(player.rect.x, player.rect.y, str(score), self.__shader, player._color)
+                self.__scores[player._id] = (label, score)
+
+            label, shown_score = self.__scores[player._id]
+            if score != shown_score:
+                label.update_text(str(score))
+                self.__scores[player._id] = (label, score)
+
+            x, y = player.get_draw_position(alpha)
+            label.update_pos(x, y - BLOCK_SIZE * 1.01)
+
+    def draw(self) -> None:
+        for label, _ in self.__scores.values():
+            label.draw()
+
+    def cleanup(self) -> None:
+        """Free GPU resources."""
+        for label, _ in self.__scores.values():
+            label.cleanup()
+        self.__scores.clear()
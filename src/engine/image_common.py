@@ -1,8 +1,15 @@
 import pygame
 from OpenGL.GL import *  # type: ignore
 
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+
 
 def load_texture(path):
+    return upload_texture(decode_image(path))
+
+
+def decode_image(path) -> tuple[bytes, int, int, tuple[float, float]]:
+    """Read an image into (RGBA bytes, width, height, ratio), safe off the GL thread."""
     # 1. Загружаем изображение через Pygame
     image = pygame.image.load(path)
 
@@ -17,8 +24,14 @@ def load_texture(path):
     width = image.get_width()
     height = image.get_height()
 
+    return texture_data, width, height, ratio
+
+
+def upload_texture(image: tuple[bytes, int, int, tuple[float, float]]):
+    texture_data, width, height, ratio = image
+
     # 3. Генерируем текстуру в OpenGL
-    texture = glGenTextures(1)
+    texture = GpuResources.gen_texture("textures")
     glBindTexture(GL_TEXTURE_2D, texture)
 
     # 4. Настройки фильтрации и повторения
@@ -29,5 +42,6 @@ def load_texture(path):
 
     # 5. Загружаем данные (байты) в GPU
     glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+    GpuResources.set_nbytes(GpuResourceType.TEXTURE, texture, width * height * 4)
 
     return texture, ratio
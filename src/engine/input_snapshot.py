@@ -0,0 +1,90 @@
+"""
+Per-tick input of all players.
+
+Every tick poll() reads each controller once, only the axes and buttons the
+game uses, into a compact NumPy record per player slot. Gameplay code reads
+the record, never the device. Button presses are edge-triggered; presses
+that come as events between two polls are latched by handle_events(), routed
+to the slot by the joystick instance id, so a press shorter than a tick is
+not lost.
+
+The record of a tick can be copied and loaded back (see World.step()) to
+record and replay a match.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pygame
+
+from game.systems.object_protocol import Controller
+
+
+class InputSnapshot:
+    # Device axes and buttons that are polled, in record order
+    AXES = (0, 5)       # left stick x, right trigger
+    BUTTONS = (0,)      # A
+
+    # Indices into the "axes" and "buttons"/"pressed" fields
+    MOVE_X = 0
+    SHOOT = 1
+    JUMP = 0
+
+    # Axis values without a controller: triggers rest at -1
+    AXES_AT_REST = (0.0, -1.0)
+
+    DTYPE = np.dtype([
+        ("connected", np.bool_),
+        ("axes", np.float32, (len(AXES),)),
+        ("buttons", np.bool_, (len(BUTTONS),)),
+        ("pressed", np.bool_, (len(BUTTONS),)),     # went down since the previous tick
+    ])
+
+    def __init__(self, slots: int) -> None:
+        self.state = np.zeros(slots, dtype=self.DTYPE)
+        self.state["axes"] = self.AXES_AT_REST
+
+        self.__latched = np.zeros((slots, len(self.BUTTONS)), dtype=np.bool_)
+        self.__slots_by_instance_id: dict[int, int] = {}
+        self.__button_indices = {button: i for i, button in enumerate(self.BUTTONS)}
+
+    def poll(self, controllers: Sequence[Controller | None]) -> None:
+        """Read the controllers, indexed by slot, into the record of this tick."""
+        previous_buttons = self.state["buttons"].copy()
+        self.__slots_by_instance_id.clear()
+
+        for slot in range(len(self.state)):
+            controller = controllers[slot] if slot < len(controllers) else None
+
+            if controller is None:
+                self.state[slot] = (False, self.AXES_AT_REST, False, False)
+                continue
+
+            self.state[slot] = (
+                True,
+                [controller.get_axis(axis) for axis in self.AXES],
+                [controller.get_button(button) for button in self.BUTTONS],
+                False
+            )
+
+            # Only real joysticks send events
+            get_instance_id = getattr(controller, "get_instance_id", None)
+            if get_instance_id is not None:
+                self.__slots_by_instance_id[get_instance_id()] = slot
+
+        self.state["pressed"] = (self.state["buttons"] & ~previous_buttons) | self.__latched
+        self.__latched[:] = False
+
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """Latch the button presses for the next poll()."""
+        for event in events:
+            if event.type != pygame.JOYBUTTONDOWN or event.button not in self.__button_indices:
+                continue
+
+            slot = self.__slots_by_instance_id.get(event.instance_id)
+            if slot is not None:
+                self.__latched[slot, self.__button_indices[event.button]] = True
+
+    def load(self, state: np.ndarray) -> None:
+        """Replace the record of this tick with a recorded one."""
+        self.state[:] = state
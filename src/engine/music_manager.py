@@ -1,7 +1,11 @@
 
 from typing import Literal
+import io
+import os
 import pygame
 
+from engine.asset_manager import AssetManager
+
 
 class MusicManager:
     def __init__(self) -> None:
@@ -10,11 +14,23 @@ class MusicManager:
         self.__game_window_music = "src/_content/music/dynamic_game_theme.mp3"
         self.__victory_menu_music = "src/_content/music/victory_menu_music.mp3"
 
+        # Read every track in the background, switching music then never touches the disk
+        tracks = (
+            self.__main_menu_music,
+            self.__pause_menu_music,
+            self.__game_window_music,
+            self.__victory_menu_music
+        )
+        for path in tracks:
+            AssetManager.load_music(path)
+
     def set_volume(self, volume: float) -> None:
         pygame.mixer.music.set_volume(volume)
 
     def play(self, path: str) -> None:
-        pygame.mixer.music.load(path)
+        # A new stream every time: the mixer keeps reading from it while playing
+        data = AssetManager.load_music(path).wait()
+        pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(path)[1][1:])
         pygame.mixer.music.play(-1)
 
     def stop(self) -> None:
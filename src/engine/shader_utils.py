@@ -1,13 +1,30 @@
+import hashlib
+import os
 
 from OpenGL.GL import *  # type: ignore
+from OpenGL.error import GLError
+import numpy as np
+
+from engine.common import get_cache_path
+from engine.graphics.gpu_resources import GpuResources
 
 
 class ShaderUtils:
+    # Source hash -> linked program, shared by every window and menu
+    __programs: dict[str, int] = {}
+    __sources: dict[str, tuple[str, str]] = {}
+
+    # Old -> new handle of the programs relinked by the last rebuild()
+    __relinked: dict[int, int] = {}
 
     @staticmethod
     def compile_shader(filepath, shader_type):
         with open(filepath, 'r') as f:
             src = f.read()
+        return ShaderUtils.__compile_source(src, shader_type)
+
+    @staticmethod
+    def __compile_source(src, shader_type):
         shader = glCreateShader(shader_type)
         glShaderSource(shader, src)
         glCompileShader(shader)
@@ -18,11 +35,44 @@ class ShaderUtils:
 
     @staticmethod
     def create_shader(vertex_filepath, fragment_filepath):
-        vs = ShaderUtils.compile_shader(vertex_filepath, GL_VERTEX_SHADER)
-        fs = ShaderUtils.compile_shader(fragment_filepath, GL_FRAGMENT_SHADER)
+        """Return the program for the two shader files.
+
+        The same sources are linked once per process; a linked program binary is
+        also kept on disk, so a cold start links from it instead of compiling.
+        """
+        with open(vertex_filepath, 'r') as f:
+            vertex_src = f.read()
+        with open(fragment_filepath, 'r') as f:
+            fragment_src = f.read()
+
+        key = hashlib.sha256(f"{vertex_src}\0{fragment_src}".encode('utf-8')).hexdigest()
+        if key in ShaderUtils.__programs:
+            return ShaderUtils.__programs[key]
+
+        ShaderUtils.__sources[key] = (vertex_src, fragment_src)
+        ShaderUtils.__programs[key] = ShaderUtils.__build(key, vertex_src, fragment_src)
+        return ShaderUtils.__programs[key]
+
+    @staticmethod
+    def __build(key: str, vertex_src: str, fragment_src: str) -> int:
+        binary_path = ShaderUtils.__get_binary_path(key)
+
+        prog = ShaderUtils.__load_binary(binary_path)
+        if prog is None:
+            prog = ShaderUtils.__link(vertex_src, fragment_src)
+            ShaderUtils.__save_binary(prog, binary_path)
+
+        return GpuResources.add_program(prog, "shaders")
+
+    @staticmethod
+    def __link(vertex_src, fragment_src):
+        vs = ShaderUtils.__compile_source(vertex_src, GL_VERTEX_SHADER)
+        fs = ShaderUtils.__compile_source(fragment_src, GL_FRAGMENT_SHADER)
         prog = glCreateProgram()
         glAttachShader(prog, vs)
         glAttachShader(prog, fs)
+        if ShaderUtils.__is_binary_supported():
+            glProgramParameteri(prog, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
         glLinkProgram(prog)
         if glGetProgramiv(prog, GL_LINK_STATUS) != GL_TRUE:
             log = glGetProgramInfoLog(prog).decode('utf-8')
@@ -30,3 +80,96 @@ class ShaderUtils:
         glDeleteShader(vs)
         glDeleteShader(fs)
         return prog
+
+    @staticmethod
+    def __is_binary_supported() -> bool:
+        try:
+            return bool(glGetProgramBinary) and glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) > 0
+        except GLError:
+            return False
+
+    @staticmethod
+    def __get_binary_path(key: str) -> str | None:
+        if not ShaderUtils.__is_binary_supported():
+            return None
+
+        # Binaries are only valid for the driver that produced them
+        driver = b"|".join(glGetString(name) or b"" for name in (GL_VENDOR, GL_RENDERER, GL_VERSION))
+        driver_key = hashlib.sha256(driver).hexdigest()[:16]
+
+        return os.path.join(get_cache_path("shaders", driver_key), f"{key}.bin")
+
+    @staticmethod
+    def __load_binary(binary_path: str | None):
+        """Return a program linked from the cached binary, or None to compile."""
+        if binary_path is None or not os.path.exists(binary_path):
+            return None
+
+        try:
+            with open(binary_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # uint32 binary format, then the binary itself
+        if len(data) <= 4:
+            return None
+        binary_format = int(np.frombuffer(data[:4], dtype=np.uint32)[0])
+        binary = np.frombuffer(data[4:], dtype=np.uint8)
+
+        prog = glCreateProgram()
+        try:
+            glProgramBinary(prog, binary_format, binary, len(binary))
+            if glGetProgramiv(prog, GL_LINK_STATUS) == GL_TRUE:
+                return prog
+        except GLError:
+            pass
+
+        # Rejected by the driver (e.g. after an update): compile and overwrite it
+        glDeleteProgram(prog)
+        return None
+
+    @staticmethod
+    def __save_binary(prog, binary_path: str | None) -> None:
+        if binary_path is None:
+            return
+
+        try:
+            length = int(glGetProgramiv(prog, GL_PROGRAM_BINARY_LENGTH))
+            if length <= 0:
+                return
+
+            binary = np.zeros(length, dtype=np.uint8)
+            binary_format = np.zeros(1, dtype=np.uint32)
+            written = np.zeros(1, dtype=np.int32)
+            glGetProgramBinary(prog, length, written, binary_format, binary)
+
+            with open(binary_path, 'wb') as f:
+                f.write(binary_format.tobytes())
+                f.write(binary[:int(written[0])].tobytes())
+        except (GLError, OSError):
+            # The cache is only an optimization
+            pass
+
+    @staticmethod
+    def rebuild() -> None:
+        """Link every program again in the new GL context, see get_program()."""
+        relinked = {}
+        for key, program in ShaderUtils.__programs.items():
+            ShaderUtils.__programs[key] = ShaderUtils.__build(key, *ShaderUtils.__sources[key])
+            relinked[program] = ShaderUtils.__programs[key]
+
+        ShaderUtils.__relinked = relinked
+
+    @staticmethod
+    def get_program(program) -> int:
+        """Return the handle that replaced `program` after a context loss.
+
+        Only valid in a rebuild callback: the owners of a program swap their
+        dead handle for the new one and query its uniform locations again.
+        """
+        return ShaderUtils.__relinked.get(int(program), program)
+
+
+# Registered before any program exists, so it runs before the callbacks of the programs' owners
+GpuResources.add_rebuild_callback(ShaderUtils.rebuild)
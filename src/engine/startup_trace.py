@@ -0,0 +1,117 @@
+"""
+Startup trace: where the time before the first frame goes.
+
+Enabled with the STARTUP_TRACE=1 environment variable or the --startup-trace
+command line flag. It reports, like `python -X importtime`, the self and
+cumulative time of every module import above a threshold, together with the
+named init phases of main.py and the time of the first presented frame.
+
+Must be imported (and enabled) before anything else to see every import.
+Only uses the standard library for that reason.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+import builtins
+import os
+import sys
+import time
+
+
+class StartupTrace:
+    ENV_VAR = "STARTUP_TRACE"
+    FLAG = "--startup-trace"
+
+    # Imports faster than this (cumulative) are left out of the report
+    IMPORT_THRESHOLD = 0.001
+
+    __enabled = False
+    __start = time.perf_counter()
+    __original_import = builtins.__import__
+
+    # (name, start, end) relative to the start, in seconds
+    __phases: list[tuple[str, float, float]] = []
+
+    # (depth, module, self seconds, cumulative seconds) in load order
+    __imports: list[tuple[int, str, float, float]] = []
+    __children_time: list[float] = []
+
+    __first_frame: float | None = None
+
+    @classmethod
+    def enable_from_environment(cls) -> bool:
+        if os.environ.get(cls.ENV_VAR, "") not in ("", "0") or cls.FLAG in sys.argv:
+            cls.enable()
+        return cls.__enabled
+
+    @classmethod
+    def enable(cls) -> None:
+        if cls.__enabled:
+            return
+
+        cls.__enabled = True
+        builtins.__import__ = cls.__traced_import
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.__enabled
+
+    @classmethod
+    def __traced_import(cls, name, globals=None, locals=None, fromlist=(), level=0):
+        # Already imported modules cost nothing worth reporting
+        if level == 0 and name in sys.modules:
+            return cls.__original_import(name, globals, locals, fromlist, level)
+
+        depth = len(cls.__children_time)
+        index = len(cls.__imports)
+        cls.__imports.append((depth, name, 0.0, 0.0))
+        cls.__children_time.append(0.0)
+
+        start = time.perf_counter()
+        try:
+            return cls.__original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = cls.__children_time.pop()
+            cls.__imports[index] = (depth, name, cumulative - children, cumulative)
+
+            if cls.__children_time:
+                cls.__children_time[-1] += cumulative
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        """Time the block as a named init phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if cls.__enabled:
+                cls.__phases.append((name, start - cls.__start, time.perf_counter() - cls.__start))
+
+    @classmethod
+    def first_frame(cls) -> None:
+        """Call after every presented frame: the first call ends the trace and prints the report."""
+        if not cls.__enabled or cls.__first_frame is not None:
+            return
+
+        cls.__first_frame = time.perf_counter() - cls.__start
+        builtins.__import__ = cls.__original_import
+        cls.report()
+
+    @classmethod
+    def report(cls, file=None) -> None:
+        file = file or sys.stderr
+
+        print("import time:       self [ms] | cumulative [ms] | imported module", file=file)
+        for depth, name, self_time, cumulative in cls.__imports:
+            if cumulative >= cls.IMPORT_THRESHOLD:
+                indented_name = '  ' * depth + name
+                print(f"import time: {self_time * 1000:15.1f} | {cumulative * 1000:15.1f} | {indented_name}", file=file)
+
+        print("startup phase:    start [ms] |   duration [ms] | phase", file=file)
+        for name, start, end in cls.__phases:
+            print(f"startup phase: {start * 1000:13.1f} | {(end - start) * 1000:15.1f} | {name}", file=file)
+
+        if cls.__first_frame is not None:
+            print(f"first frame: {cls.__first_frame * 1000:.1f} ms", file=file)
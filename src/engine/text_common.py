@@ -2,88 +2,132 @@ from OpenGL.GL import *  # type: ignore
 
 import numpy as np
 import pygame
-import ctypes
-
-
-def create_text_texture(
-    text: str,
-    text_texture,
-    text_vao,
-    text_vbo,
-    font: pygame.font.Font | None,
-    font_file_path: str,
-    font_height: int
-):
-    """Render text to a pygame surface and upload as an OpenGL texture.
-    Return text_texture, text_size, text_vao, text_vbo."""
-    if font is None:
-        # choose a size relative to button height
-        font_size = max(8, font_height)
-        font = pygame.font.Font(font_file_path, font_size)
-
-    # render text to surface with alpha
-    text_surf = font.render(text, True, (255, 255, 255))
-    text_surf = text_surf.convert_alpha()
-    w, h = text_surf.get_size()
-
-    # get pixel data (flipped vertically for GL)
-    pixel_data = pygame.image.tostring(text_surf, "RGBA", True)
-
-    # create or replace texture
-    if text_texture:
-        glDeleteTextures([text_texture])
-
-    tex = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, tex)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, w, h, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixel_data)
-    glBindTexture(GL_TEXTURE_2D, 0)
-
-    text_texture = tex
-    text_size = (w, h)
-
-    # create text VAO/VBO (positions are absolute in screen/game units)
-    if not text_vao:
-        text_vao = glGenVertexArrays(1)
-        text_vbo = glGenBuffers(1)
-
-    return text_texture, text_size, text_vao, text_vbo
-
-
-def update_text_vbo(
-    x: float,
-    y: float,
-    text_texture,
-    text_size: tuple[int, int],
-    text_vao,
-    text_vbo
-) -> None:
-    """Upload vertex+texcoord data for the text quad positioned at (x,y)."""
-    if not text_texture:
-        return
-
-    w, h = text_size
-
-    # vertices: x,y,u,v  (triangle fan)
-    verts = np.array([
-        x, y, 0.0, 0.0,
-        x + w, y, 1.0, 0.0,
-        x + w, y - h, 1.0, 1.0,
-        x, y - h, 0.0, 1.0,
-    ], dtype=np.float32)
-
-    glBindVertexArray(text_vao)
-    glBindBuffer(GL_ARRAY_BUFFER, text_vbo)
-    glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_DYNAMIC_DRAW)
-
-    stride = 4 * 4  # 4 floats per vertex, 4 bytes each
-    glEnableVertexAttribArray(0)
-    glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
-    glEnableVertexAttribArray(2)
-    glVertexAttribPointer(2, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(8))
-
-    glBindVertexArray(0)
+
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+
+
+class GlyphAtlas:
+    """One texture with the rasterized glyphs of a font at one pixel size.
+
+    Glyphs are rasterized the first time they are needed and packed into
+    shelves (rows as high as their tallest glyph). When the atlas is full its
+    height doubles: the CPU copy is re-uploaded and `version` changes, so text
+    laid out with the old texture coordinates knows to lay itself out again.
+    """
+
+    WIDTH = 1024
+    PADDING = 1
+
+    __atlases: dict[tuple[str, int], "GlyphAtlas"] = {}
+
+    @classmethod
+    def add(cls, font_file_path: str, font_size: int, font: pygame.font.Font) -> "GlyphAtlas":
+        """Create the atlas of (font file, pixel size) from an already opened font (see AssetManager.load_font())."""
+        key = (font_file_path, font_size)
+        if key not in cls.__atlases:
+            cls.__atlases[key] = GlyphAtlas(font)
+        return cls.__atlases[key]
+
+    def __init__(self, font: pygame.font.Font) -> None:
+        self.__font = font
+        self.line_height = self.__font.get_height()
+        self.version = 0
+
+        # CPU copy of the texture, rows top to bottom
+        height = 64
+        while height < self.line_height * 2:
+            height *= 2
+        self.__pixels = np.zeros((height, self.WIDTH, 4), dtype=np.uint8)
+
+        # char -> (x, y, width, height) in atlas pixels
+        self.__glyphs: dict[str, tuple[int, int, int, int]] = {}
+        self.__shelf_x = 0
+        self.__shelf_y = 0
+        self.__shelf_height = 0
+
+        self.texture = 0
+        self.__create_texture()
+        GpuResources.add_rebuild_callback(self.__create_texture)
+
+    def __create_texture(self) -> None:
+        self.texture = GpuResources.gen_texture("text")
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        self.__upload()
+
+    def __upload(self) -> None:
+        """Upload the whole CPU copy (texture must be bound)."""
+        height, width = self.__pixels.shape[:2]
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, self.__pixels)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        GpuResources.set_nbytes(GpuResourceType.TEXTURE, self.texture, self.__pixels.nbytes)
+
+    def __get_glyph(self, char: str) -> tuple[int, int, int, int]:
+        if char not in self.__glyphs:
+            self.__glyphs[char] = self.__add_glyph(char)
+        return self.__glyphs[char]
+
+    def __add_glyph(self, char: str) -> tuple[int, int, int, int]:
+        surface = self.__font.render(char, True, (255, 255, 255))
+        w, h = surface.get_size()
+        if w == 0 or h == 0:
+            return (0, 0, 0, 0)
+
+        pixels = np.frombuffer(pygame.image.tostring(surface, "RGBA"), dtype=np.uint8).reshape(h, w, 4)
+
+        # Next shelf if the glyph does not fit in the current one
+        if self.__shelf_x + w + self.PADDING > self.WIDTH:
+            self.__shelf_y += self.__shelf_height + self.PADDING
+            self.__shelf_x = 0
+            self.__shelf_height = 0
+
+        # Grow the atlas if the shelf does not fit
+        is_grown = False
+        while self.__shelf_y + h > len(self.__pixels):
+            self.__pixels = np.concatenate((self.__pixels, np.zeros_like(self.__pixels)))
+            is_grown = True
+
+        x, y = self.__shelf_x, self.__shelf_y
+        self.__pixels[y:y + h, x:x + w] = pixels
+        self.__shelf_x += w + self.PADDING
+        self.__shelf_height = max(self.__shelf_height, h)
+
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        if is_grown:
+            # Texture coordinates of every glyph changed
+            self.version += 1
+            self.__upload()
+        else:
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, w, h, GL_RGBA, GL_UNSIGNED_BYTE, np.ascontiguousarray(pixels))
+            glBindTexture(GL_TEXTURE_2D, 0)
+
+        return (x, y, w, h)
+
+    def measure(self, text: str) -> tuple[int, int]:
+        """Return the (width, height) of `text` in pixels."""
+        return sum(self.__get_glyph(char)[2] for char in text), self.line_height
+
+    def layout(self, text: str, x: float, y: float) -> np.ndarray:
+        """Build triangles (x, y, u, v) for `text` with its bottom-left corner at (x, y)."""
+        vertices = np.zeros((len(text), 6, 4), dtype=np.float32)
+
+        for i, char in enumerate(text):
+            gx, gy, w, h = self.__get_glyph(char)
+
+            # UVs are taken after every glyph is added, in case the atlas grew
+            vertices[i, :, 0] = (x, x + w, x + w, x, x + w, x)
+            vertices[i, :, 1] = (y, y, y - h, y, y - h, y - h)
+            vertices[i, :, 2] = (gx, gx + w, gx + w, gx, gx + w, gx)
+            vertices[i, :, 3] = (gy + h, gy + h, gy, gy + h, gy, gy)
+            x += w
+
+        height, width = self.__pixels.shape[:2]
+        vertices[:, :, 2] /= width
+        vertices[:, :, 3] /= height
+
+        return vertices.reshape(-1, 4)
@@ -5,7 +5,9 @@ import ctypes
 import pygame
 
 from engine.common import get_resource_path
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
 from game.consts import BLUE, BUTTON_HEIGHT, BUTTON_WIDTH, GREY, GREY_2, ORANGE, WHITE
+from engine.shader_utils import ShaderUtils
 from engine.ui.text_worker import TextWorker
 
 
@@ -22,11 +24,35 @@ class Button:
 
         self.__function = function
 
+        self.__shader = shader
+        self.__setup_uniforms()
+
+        self.__vertex_count = 4
+        self.__setup_vao()
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+        self.__text_worker = TextWorker(
+            x=self.__rect.x,
+            y=self.__rect.y + BUTTON_HEIGHT * 0.25,
+            text=self.__text,
+            rect_size=(self.__rect.width, self.__rect.height * 0.5),
+            font_file_path=get_resource_path("src/_content/fonts/Orbitron-VariableFont_wght.ttf"),
+            shader=shader,
+            color=WHITE
+        )
+
+    def __setup_uniforms(self) -> None:
         # Shader uniform locations
-        self.__uColor = glGetUniformLocation(shader, "uColor")
-        self.__uUseTexture = glGetUniformLocation(shader, "uUseTexture")
-        self.__uIsPlayer = glGetUniformLocation(shader, "uIsPlayer")
+        self.__uColor = glGetUniformLocation(self.__shader, "uColor")
+        self.__uUseTexture = glGetUniformLocation(self.__shader, "uUseTexture")
+        self.__uIsPlayer = glGetUniformLocation(self.__shader, "uIsPlayer")
+
+    def __rebuild(self) -> None:
+        self.__shader = ShaderUtils.get_program(self.__shader)
+        self.__setup_uniforms()
+        self.__setup_vao()
 
+    def __setup_vao(self) -> None:
         # Background quad (uses positions in screen/game units)
         vertices = np.array([
             0.0, 0.0,
@@ -35,24 +61,22 @@ class Button:
             0.0, BUTTON_HEIGHT,
         ], dtype=np.float32)
 
-        self.__vertex_count = 4
-
         # VAO/VBO for background rectangle
-        self.__vao = glGenVertexArrays(1)
+        self.__vao = GpuResources.gen_vertex_array("ui")
         glBindVertexArray(self.__vao)
 
-        self.__vbo = glGenBuffers(1)
+        self.__vbo = GpuResources.gen_buffer("ui")
         glBindBuffer(GL_ARRAY_BUFFER, self.__vbo)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__vbo, vertices, GL_STATIC_DRAW)
 
         glEnableVertexAttribArray(0)
         glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 8, ctypes.c_void_p(0))
 
         # Dynamic offset buffer (we'll update it per-draw)
-        self.__offset_vbo = glGenBuffers(1)
+        self.__offset_vbo = GpuResources.gen_buffer("ui")
         glBindBuffer(GL_ARRAY_BUFFER, self.__offset_vbo)
         offset_data = np.array([0.0, 0.0], dtype=np.float32)
-        glBufferData(GL_ARRAY_BUFFER, offset_data.nbytes, offset_data, GL_DYNAMIC_DRAW)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__offset_vbo, offset_data, GL_DYNAMIC_DRAW)
 
         glEnableVertexAttribArray(1)
         glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 8, ctypes.c_void_p(0))
@@ -60,17 +84,6 @@ class Button:
 
         glBindVertexArray(0)
 
-        self.__text_worker = TextWorker(
-            x=self.__rect.x,
-            y=self.__rect.y + BUTTON_HEIGHT * 0.25,
-            text=self.__text,
-            rect_size=(self.__rect.width, self.__rect.height * 0.5),
-            font=None,
-            font_file_path=get_resource_path("src/_content/fonts/Orbitron-VariableFont_wght.ttf"),
-            shader=shader,
-            color=WHITE
-        )
-
     def update(self) -> None:
 
         # JOYSTICK
@@ -125,6 +138,13 @@ class Button:
 
         self.__text_worker.draw()
 
+    def cleanup(self) -> None:
+        """Free GPU resources (deleted at the end of the frame)."""
+        GpuResources.release(GpuResourceType.BUFFER, self.__vbo)
+        GpuResources.release(GpuResourceType.BUFFER, self.__offset_vbo)
+        GpuResources.release(GpuResourceType.VERTEX_ARRAY, self.__vao)
+        self.__text_worker.cleanup()
+
     def __perform_function(self) -> None:
         if self.__function is None:
             return
@@ -1,8 +1,12 @@
 from OpenGL.GL import *  # type: ignore
 from OpenGL.GL.shaders import ShaderProgram
+import ctypes
 import pygame
 
-from engine.text_common import create_text_texture, update_text_vbo
+from engine.asset_manager import AssetManager
+from engine.graphics.gpu_resources import GpuResourceType, GpuResources
+from engine.shader_utils import ShaderUtils
+from engine.text_common import GlyphAtlas
 
 
 class TextWorker:
@@ -12,7 +16,6 @@ class TextWorker:
         y: float,
         text: str,
         rect_size: tuple[float, float],
-        font: pygame.font.Font | None,
         font_file_path: str,
         shader: ShaderProgram | None,
         color: tuple[float, float, float, float]
@@ -22,66 +25,113 @@ class TextWorker:
         self.__color = color
         self.__text = text
 
-        # Shader uniform locations
-        self.__uColor = glGetUniformLocation(shader, "uColor")
-        self.__uUseTexture = glGetUniformLocation(shader, "uUseTexture")
-        self.__uTexture = glGetUniformLocation(shader, "uTexture")
+        self.__shader = shader
+        self.__setup_uniforms()
+
+        # Glyphs are shared by every text with the same font and size.
+        # The font is opened in the background, the text is drawn once its atlas is ready
+        self.__font = AssetManager.load_font(font_file_path, max(8, int(self.__rect.height)))
 
-        # Text rendering objects (created lazily)
-        self._text_texture = 0
-        self._text_size = (0, 0)
+        # Text quads relative to the rect, created lazily and rebuilt only when the text changes
         self.__text_vao = None
         self.__text_vbo = None
-        self.__font_file_path = font_file_path
-        self.__font = font
+        self.__vertex_count = 0
+        self.__layout_key: tuple[str, int] | None = None
+
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __setup_uniforms(self) -> None:
+        # Shader uniform locations
+        self.__uColor = glGetUniformLocation(self.__shader, "uColor")
+        self.__uUseTexture = glGetUniformLocation(self.__shader, "uUseTexture")
+        self.__uTexture = glGetUniformLocation(self.__shader, "uTexture")
+        self.__uIsPlayer = glGetUniformLocation(self.__shader, "uIsPlayer")
+        self.__uPlayerPos = glGetUniformLocation(self.__shader, "uPlayerPos")
+
+    def __rebuild(self) -> None:
+        self.__shader = ShaderUtils.get_program(self.__shader)
+        self.__setup_uniforms()
+        self.__reset()
+
+    def __reset(self) -> None:
+        # Recreated lazily by the next draw()
+        self.__text_vao = None
+        self.__text_vbo = None
+        self.__layout_key = None
+
+    def __layout(self, atlas: GlyphAtlas) -> None:
+        if self.__text_vao is None:
+            self.__text_vao = GpuResources.gen_vertex_array("text")
+            self.__text_vbo = GpuResources.gen_buffer("text")
+
+            glBindVertexArray(self.__text_vao)
+            glBindBuffer(GL_ARRAY_BUFFER, self.__text_vbo)
+
+            stride = 4 * 4  # 4 floats per vertex, 4 bytes each
+            glEnableVertexAttribArray(0)
+            glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
+            glEnableVertexAttribArray(2)
+            glVertexAttribPointer(2, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(8))
+
+            glBindVertexArray(0)
+
+        # centered inside the rect, the rect position is added by the shader
+        text_width, text_height = atlas.measure(self.__text)
+        text_x = (self.__rect.width - text_width) / 2.0
+        text_y = (self.__rect.height + text_height) / 2.0
+
+        vertices = atlas.layout(self.__text, text_x, text_y)
+        self.__vertex_count = len(vertices)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.__text_vbo)
+        GpuResources.buffer_data(GL_ARRAY_BUFFER, self.__text_vbo, vertices, GL_DYNAMIC_DRAW)
+
+        # The atlas may have grown while the glyphs were added
+        self.__layout_key = (self.__text, atlas.version)
 
     def draw(self) -> None:
-        # Prepare text texture if needed
-        if not self._text_texture or self._text_size == (0, 0) or getattr(self, "_last_text", None) != self.__text:
-
-            self._text_texture, self._text_size, self.__text_vao, self.__text_vbo = create_text_texture(
-                self.__text,
-                self._text_texture,
-                self.__text_vao,
-                self.__text_vbo,
-                self.__font,
-                self.__font_file_path,
-                int(self.__rect.height)
-            )
-
-            self._last_text = self.__text
-
-        if not self._text_texture:
+        if not self.__font.is_ready():
+            if self.__font.error is not None:
+                raise self.__font.error
             return
 
-        # compute centered position for the text inside the button rect
-        text_width, text_height = self._text_size
-        text_x = self.__rect.x + (self.__rect.width - text_width) / 2.0
-        text_y = self.__rect.y + (self.__rect.height + text_height) / 2.0
+        atlas = self.__font.value
+        if self.__layout_key != (self.__text, atlas.version):
+            self.__layout(atlas)
 
-        # update VBO for text quad
-        update_text_vbo(text_x, text_y, self._text_texture, self._text_size, self.__text_vao, self.__text_vbo)
+        if self.__vertex_count == 0:
+            return
 
         # enable blending for text alpha
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
-        # bind texture and draw the quad
+        # bind texture and draw the quads
         glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self._text_texture)
+        glBindTexture(GL_TEXTURE_2D, atlas.texture)
         glUniform1i(self.__uTexture, 0)
         glUniform1i(self.__uUseTexture, 1)
 
         glUniform4f(self.__uColor, *self.__color)
+        glUniform1i(self.__uIsPlayer, 1)
+        glUniform2f(self.__uPlayerPos, self.__rect.x, self.__rect.y)
 
         glBindVertexArray(self.__text_vao)
-        glDrawArrays(GL_TRIANGLE_FAN, 0, 4)
+        glDrawArrays(GL_TRIANGLES, 0, self.__vertex_count)
         glBindVertexArray(0)
         glBindTexture(GL_TEXTURE_2D, 0)
 
+        glUniform1i(self.__uIsPlayer, 0)
+
     def update_text(self, text: str) -> None:
         self.__text = text
 
     def update_pos(self, x: float, y: float) -> None:
         rect = pygame.Rect(x, y, self.__rect.w, self.__rect.h)
         self.__rect = rect
+
+    def cleanup(self) -> None:
+        """Free GPU resources (deleted at the end of the frame). The shared glyph atlas stays."""
+        GpuResources.release(GpuResourceType.VERTEX_ARRAY, self.__text_vao)
+        GpuResources.release(GpuResourceType.BUFFER, self.__text_vbo)
+        self.__reset()
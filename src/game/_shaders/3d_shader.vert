@@ -2,15 +2,20 @@
 layout (location = 0) in vec3 aPos;
 layout (location = 1) in vec3 aNormal;
 
+// Per-instance data (divisor = 1), matrices are column-major
+layout (location = 2) in mat4 aModel;
+layout (location = 6) in mat4 aMvp;
+layout (location = 10) in mat3 aNormalMatrix;
+layout (location = 13) in vec3 aColor;
+
 out vec3 FragPos;
 out vec3 Normal;
-
-uniform mat4 model;
-uniform mat4 mvp;
+out vec3 Color;
 
 void main()
 {
-    FragPos = vec3(model * vec4(aPos, 1.0));
-    Normal = mat3(transpose(inverse(model))) * aNormal;
-    gl_Position = mvp * vec4(aPos, 1.0);
-}
\ No newline at end of file
+    FragPos = vec3(aModel * vec4(aPos, 1.0));
+    Normal = aNormalMatrix * aNormal;
+    Color = aColor;
+    gl_Position = aMvp * vec4(aPos, 1.0);
+}
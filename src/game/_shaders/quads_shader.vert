@@ -0,0 +1,29 @@
+#version 330 core
+
+// Unit quad corner, shared by every instance
+layout (location = 0) in vec2 aPos;
+
+// Per-instance data (divisor = 1)
+layout (location = 1) in vec2 aOffset;
+layout (location = 2) in vec2 aSize;
+layout (location = 3) in float aAngle;
+layout (location = 4) in vec4 aColor;
+
+uniform mat4 uProjection;
+
+out vec4 vColor;
+
+void main()
+{
+    // Scale the unit quad to the instance size and rotate it around its center
+    vec2 center = aSize * 0.5;
+    vec2 local = aPos * aSize - center;
+
+    float s = sin(aAngle);
+    float c = cos(aAngle);
+    vec2 rotated = vec2(local.x * c - local.y * s, local.x * s + local.y * c);
+
+    gl_Position = uProjection * vec4(rotated + center + aOffset, 0.0, 1.0);
+
+    vColor = aColor;
+}
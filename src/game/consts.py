@@ -21,6 +21,10 @@ DRAW_FPS = 60
 UPDATE_DT = 1.0 / UPDATE_FPS
 DRAW_DT = 1.0 / DRAW_FPS
 
+# Game frame rate limit (see FramePacer), None to draw at the display refresh rate with VSYNC
+FRAME_CAP: float | None = DRAW_FPS
+VSYNC = False
+
 OLD_FPS = 120
 
 # Game consts / Characteristics
@@ -41,6 +45,9 @@ ANTI_GRAVITY_DECAY = (BLOCK_SIZE / 15000) * OLD_FPS
 
 GRAVITY = (BLOCK_SIZE / 1.15) * OLD_FPS
 
+COLLISION_INSET = 2.0
+CONTACT_DISTANCE = 0.1
+
 BUFF_COOLDOWN = 15000
 
 # Game consts / Bullets
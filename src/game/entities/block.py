@@ -1,6 +1,4 @@
 
-from OpenGL.GL import *  # type: ignore
-
 from game.consts import BLOCK_SIZE
 from game.systems.float_rect import FloatRect
 
@@ -1,11 +1,6 @@
 
 
-import numpy as np
-from OpenGL.GL.shaders import ShaderProgram
-from OpenGL.GL import *  # type: ignore
-
 from engine.graphics.opengl_3d_utils import MeshData
-from engine.graphics.renderer_3d import Renderer3D
 from game.enums.buff_enum import BuffEnum
 from game.systems.float_rect import FloatRect
 from game.consts import BLOCK_SIZE
@@ -14,7 +9,6 @@ from game.consts import BLOCK_SIZE
 class Buff:
     def __init__(
         self,
-        shader: ShaderProgram | None,
         position: tuple[float, float],
         type: BuffEnum,
         model_mesh: MeshData
@@ -22,7 +16,6 @@ class Buff:
 
         self.__type = type
 
-        self.__shader = shader
         self.__position = position  # world position (x, y)
         self.__model_mesh = model_mesh
 
@@ -37,19 +30,10 @@ class Buff:
             self.__height
         )
 
-        self.__renderer = Renderer3D()
-        self.__vao, self.__ebo_faces, self.__ebo_edges = self.__renderer.create_vao_ebo(self.__model_mesh)
-
-    def draw(
-        self,
-        projection: 'np.ndarray',
-        view: 'np.ndarray',
-        t: float,
-        light_pos: 'np.ndarray',
-        camera_pos: 'np.ndarray',
-        uniforms: dict
-    ) -> None:
-
+    def get_draw_data(
+        self
+    ) -> tuple[MeshData, tuple[float, float], tuple[float, float, float], tuple[float, float, float]]:
+        """Return the (mesh, position, size, color) instance drawn by MeshesRenderer."""
         if self.__type == BuffEnum.ENDLESS_HEALTH:
             color = (194 / 255, 29 / 255, 29 / 255)
         elif self.__type == BuffEnum.STRENGTH_INCREASE:
@@ -57,21 +41,7 @@ class Buff:
         else:
             color = (0.4, 0.4, 0.45)
 
-        self.__renderer.draw_3d_model(
-            position=self.__position,
-            size=(self.__width, self.__height, self.__depth),
-            color=color,
-            vao=self.__vao,
-            ebo_faces=self.__ebo_faces,
-            shader=self.__shader,
-            model_mesh=self.__model_mesh,
-            projection=projection,
-            view=view,
-            t=t,
-            light_pos=light_pos,
-            camera_pos=camera_pos,
-            uniforms=uniforms
-        )
+        return self.__model_mesh, self.__position, (self.__width, self.__height, self.__depth), color
 
     def change_position(self, position: tuple[float, float]) -> None:
         self.__position = position
@@ -1,11 +1,6 @@
 
 
-import numpy as np
-from OpenGL.GL.shaders import ShaderProgram
-from OpenGL.GL import *  # type: ignore
-
 from engine.graphics.opengl_3d_utils import MeshData
-from engine.graphics.renderer_3d import Renderer3D
 from game.enums.weapon_enum import WeaponEnum
 from game.systems.float_rect import FloatRect
 from game.consts import BLOCK_SIZE
@@ -14,13 +9,11 @@ from game.consts import BLOCK_SIZE
 class Weapon:
     def __init__(
         self,
-        shader: ShaderProgram | None,
         position: tuple[float, float],
         type: WeaponEnum,
         model_mesh: MeshData
     ) -> None:
 
-        self.__shader = shader
         self.__type = type
         self.__position = position  # world position (x, y)
         self.__model_mesh = model_mesh
@@ -36,34 +29,11 @@ class Weapon:
             self.__height
         )
 
-        self.__renderer = Renderer3D()
-        self.__vao, self.__ebo_faces, self.__ebo_edges = self.__renderer.create_vao_ebo(self.__model_mesh)
-
-    def draw(
-        self,
-        projection: 'np.ndarray',
-        view: 'np.ndarray',
-        t: float,
-        light_pos: 'np.ndarray',
-        camera_pos: 'np.ndarray',
-        uniforms: dict
-    ) -> None:
-
-        self.__renderer.draw_3d_model(
-            position=self.__position,
-            size=(self.__width, self.__height * 2, self.__depth),
-            color=(0.4, 0.4, 0.45),
-            vao=self.__vao,
-            ebo_faces=self.__ebo_faces,
-            shader=self.__shader,
-            model_mesh=self.__model_mesh,
-            projection=projection,
-            view=view,
-            t=t,
-            light_pos=light_pos,
-            camera_pos=camera_pos,
-            uniforms=uniforms
-        )
+    def get_draw_data(
+        self
+    ) -> tuple[MeshData, tuple[float, float], tuple[float, float, float], tuple[float, float, float]]:
+        """Return the (mesh, position, size, color) instance drawn by MeshesRenderer."""
+        return self.__model_mesh, self.__position, (self.__width, self.__height * 2, self.__depth), (0.4, 0.4, 0.45)
 
     def change_position(self, position: tuple[float, float]) -> None:
         self.__position = position
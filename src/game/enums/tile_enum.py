@@ -0,0 +1,8 @@
+
+
+from enum import IntEnum
+
+
+class TileEnum(IntEnum):
+    EMPTY = 0
+    BLOCK = 1
@@ -1,32 +1,47 @@
+import math
 import numpy as np
 import json
-from OpenGL.GL import *  # type: ignore
+import os
 
 from game.entities.block import Block
 from game.enums.direction_enum import DirectionEnum
+from game.enums.tile_enum import TileEnum
 from game.systems.float_rect import FloatRect
+from game.map_file import MapData, MapFile
 from game.systems.position import IntPosition
 from game.consts import BLOCK_SIZE
-from engine.graphics.blocks_renderer import BlocksRenderer
 
 
 class GameField:
-    def __init__(self, x: int, y: int, shader) -> None:
-        self.field = np.zeros(shape=(x, y), dtype=object)
-        self.field.fill(None)
+    # Block kinds that can be stored in the tile grid, by tile id
+    PALETTE: dict[TileEnum, type[Block]] = {
+        TileEnum.BLOCK: Block
+    }
 
-        self.__blocks_renderer = BlocksRenderer(shader)
+    # Stored in the distance fields when there is no block up to the field border
+    NO_BLOCK_DISTANCE = np.iinfo(np.int16).max
 
-    def draw(self) -> None:
-        """Draw all blocks using instanced rendering (1 draw call)."""
-        # Collect positions of all blocks
-        positions = []
-        for (bx, by), block in np.ndenumerate(self.field):
-            if block:
-                positions.append((bx * BLOCK_SIZE, by * BLOCK_SIZE))
+    def __init__(self, x: int, y: int) -> None:
+        # Tile ids (see TileEnum), indexed as field[x][y]
+        self.field = np.zeros(shape=(x, y), dtype=np.uint8)
 
-        # Render all blocks in a single draw call
-        self.__blocks_renderer.draw(positions)
+        # Player spawn points of the loaded map, in cell units
+        self.spawn_points: list[tuple[float, float]] = []
+
+        # Per-cell distance (in cells) to the nearest block in each direction, 0 on a block
+        self.__distances: dict[DirectionEnum, np.ndarray] = {}
+        self.__update_distances()
+
+        # Journal of edited cells for the renderer (see take_changes()); a reload replaces every block
+        self.__changed_cells: list[tuple[int, int]] = []
+        self.__is_reloaded = True
+
+    def take_changes(self) -> tuple[bool, list[tuple[int, int]]]:
+        """Return (whole field replaced, edited cells) since the previous call and reset the journal."""
+        is_reloaded, changed_cells = self.__is_reloaded, self.__changed_cells
+        self.__is_reloaded = False
+        self.__changed_cells = []
+        return is_reloaded, changed_cells
 
     def _get_block_position(self, bx: int, by: int) -> tuple[float, float]:
         return (
@@ -46,161 +61,188 @@ class GameField:
     def _get_block_rect(self, x: int, y: int) -> FloatRect:
         return FloatRect(x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
 
+    def is_inside(self, x: int, y: int) -> bool:
+        return 0 <= x < self.field.shape[0] and 0 <= y < self.field.shape[1]
+
+    def is_block(self, x: int, y: int) -> bool:
+        return self.is_inside(x, y) and self.field[x, y] != TileEnum.EMPTY
+
     def colliderect_with(self, x: float, y: float, rect: FloatRect) -> bool:
         block_pos = self.get_block_field_position(x, y)
 
-        if 0 <= block_pos.x < len(self.field) and 0 <= block_pos.y < len(self.field[0]):
-            block = self.field[block_pos.x][block_pos.y]
-            if block and rect.colliderect(self._get_block_rect(block_pos.x, block_pos.y)):
-                return True
+        if self.is_block(block_pos.x, block_pos.y):
+            return rect.colliderect(self._get_block_rect(block_pos.x, block_pos.y))
 
         return False
 
-    def return_block_positions(self) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
-        none_positions = []
-        block_positions = []
-        for (bx, by), block in np.ndenumerate(self.field):
-            if not block:
-                pos = self._get_block_position(bx, by)
-                none_positions.append(pos)
-            else:
-                pos = self._get_block_position(bx, by)
-                block_positions.append(pos)
-        return (none_positions, block_positions)
-
-    def vertical_block_distance(
-        self,
-        rightx: float,
-        leftx: float,
-        bottomy: float,
-        topy: float,
-        direction: DirectionEnum
-    ) -> float:
-
-        if direction == DirectionEnum.UP or direction == DirectionEnum.DOWN:
-            distance = 0
-
-            if direction == DirectionEnum.DOWN:
-                y = bottomy
-            else:
-                y = topy
-
-            while True:
-                # Получаем индексы блоков по обеим границам
-                pos1 = self.get_block_field_position(leftx, y)
-                pos2 = self.get_block_field_position(rightx, y)
-
-                # Проверка выхода за границы поля
-                out1 = not (0 <= pos1.x < self.field.shape[0] and 0 <= pos1.y < self.field.shape[1])
-                out2 = not (0 <= pos2.x < self.field.shape[0] and 0 <= pos2.y < self.field.shape[1])
-                if out1 and out2:
-                    return float('inf')
-
-                # Проверка наличия блока
-                block1 = self.field[pos1.x][pos1.y] if not out1 else None
-                block2 = self.field[pos2.x][pos2.y] if not out2 else None
-                if block1 or block2:
-                    return distance
-
-                distance += 0.1
+    def colliderect_blocks(self, rect: FloatRect) -> bool:
+        """Check `rect` against the blocks of only the grid cells it overlaps."""
+        first_x = max(math.floor(rect.left / BLOCK_SIZE), 0)
+        last_x = min(math.ceil(rect.right / BLOCK_SIZE) - 1, self.field.shape[0] - 1)
+        first_y = max(math.floor(rect.top / BLOCK_SIZE), 0)
+        last_y = min(math.ceil(rect.bottom / BLOCK_SIZE) - 1, self.field.shape[1] - 1)
 
-                if direction == DirectionEnum.DOWN:
-                    y += 0.1
-                else:
-                    y -= 0.1
+        if first_x > last_x or first_y > last_y:
+            return False
 
-        return 0
+        return bool(self.field[first_x:last_x + 1, first_y:last_y + 1].any())
 
-    def horizontal_block_distance(
+    def colliderect_blocks_many(
         self,
-        rightx: float,
-        leftx: float,
-        bottomy: float,
-        topy: float,
-        direction: DirectionEnum
-    ) -> float:
-
-        if direction == DirectionEnum.RIGHT or direction == DirectionEnum.LEFT:
-            distance = 0
-
-            if direction == DirectionEnum.RIGHT:
-                x = rightx
-            else:
-                x = leftx
+        x: np.ndarray,
+        y: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized colliderect_blocks for rects no larger than a block.
+        Such a rect overlaps at most 2x2 cells, so only its corner cells are checked."""
+        first_x = np.floor(x / BLOCK_SIZE).astype(np.intp)
+        last_x = np.ceil((x + width) / BLOCK_SIZE).astype(np.intp) - 1
+        first_y = np.floor(y / BLOCK_SIZE).astype(np.intp)
+        last_y = np.ceil((y + height) / BLOCK_SIZE).astype(np.intp) - 1
+
+        hits = np.zeros(len(x), dtype=np.bool_)
+        for cells_x in (first_x, last_x):
+            for cells_y in (first_y, last_y):
+                inside = (cells_x >= 0) & (cells_x < self.field.shape[0]) & \
+                    (cells_y >= 0) & (cells_y < self.field.shape[1])
+                hits[inside] |= self.field[cells_x[inside], cells_y[inside]] != TileEnum.EMPTY
+
+        return hits
 
-            while True:
-                # Получаем индексы блоков по обеим границам
-                pos1 = self.get_block_field_position(x, bottomy - 2.0)
-                pos2 = self.get_block_field_position(x, topy + 2.0)
+    def return_block_positions(self) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        is_block = self.field != TileEnum.EMPTY
+        none_positions = [tuple(pos) for pos in (np.argwhere(~is_block) * BLOCK_SIZE).tolist()]
+        block_positions = [tuple(pos) for pos in (np.argwhere(is_block) * BLOCK_SIZE).tolist()]
+        return (none_positions, block_positions)
 
-                # Проверка выхода за границы поля
-                out1 = not (0 <= pos1.x < self.field.shape[0] and 0 <= pos1.y < self.field.shape[1])
-                out2 = not (0 <= pos2.x < self.field.shape[0] and 0 <= pos2.y < self.field.shape[1])
-                if out1 and out2:
-                    return float('inf')
+    def find_block_line(self, direction: DirectionEnum, line: int, first_lane: int, last_lane: int) -> int | None:
+        """Index of the nearest grid line, starting at `line` and going in `direction`, that has a block
+        in any of the lanes `first_lane..last_lane`. Lines are columns for LEFT/RIGHT and rows for UP/DOWN."""
+        distances = self.__distances[direction]
+
+        if direction in (DirectionEnum.LEFT, DirectionEnum.RIGHT):
+            distance = int(distances[line, first_lane:last_lane + 1].min())
+        else:
+            distance = int(distances[first_lane:last_lane + 1, line].min())
+
+        if distance == self.NO_BLOCK_DISTANCE:
+            return None
+
+        if direction in (DirectionEnum.RIGHT, DirectionEnum.DOWN):
+            return line + distance
+        return line - distance
+
+    def __update_distances(self, x: int | None = None, y: int | None = None) -> None:
+        """Rebuild the distance fields, or only the row `y` and column `x` after a single cell edit."""
+        if x is None or y is None:
+            solid = self.field != TileEnum.EMPTY
+            row, column = solid, solid
+        else:
+            row = self.field[:, y:y + 1] != TileEnum.EMPTY
+            column = self.field[x:x + 1, :] != TileEnum.EMPTY
+
+        for direction, axis, forward in (
+            (DirectionEnum.RIGHT, 0, True),
+            (DirectionEnum.LEFT, 0, False),
+            (DirectionEnum.DOWN, 1, True),
+            (DirectionEnum.UP, 1, False),
+        ):
+            if x is None or y is None:
+                self.__distances[direction] = self.__line_distances(row, axis, forward)
+            elif axis == 0:
+                self.__distances[direction][:, y:y + 1] = self.__line_distances(row, axis, forward)
+            else:
+                self.__distances[direction][x:x + 1, :] = self.__line_distances(column, axis, forward)
 
-                # Проверка наличия блока
-                block1 = self.field[pos1.x][pos1.y] if not out1 else None
-                block2 = self.field[pos2.x][pos2.y] if not out2 else None
-                if block1 or block2:
-                    return distance
+    def __line_distances(self, solid: np.ndarray, axis: int, forward: bool) -> np.ndarray:
+        index = np.arange(solid.shape[axis]).reshape((-1, 1) if axis == 0 else (1, -1))
 
-                distance += 0.1
+        if forward:
+            # Index of the nearest block at or after each cell
+            nearest = np.where(solid, index, self.NO_BLOCK_DISTANCE)
+            nearest = np.flip(np.minimum.accumulate(np.flip(nearest, axis), axis=axis), axis)
+            distance = np.where(nearest == self.NO_BLOCK_DISTANCE, self.NO_BLOCK_DISTANCE, nearest - index)
+        else:
+            # Index of the nearest block at or before each cell
+            nearest = np.maximum.accumulate(np.where(solid, index, -1), axis=axis)
+            distance = np.where(nearest < 0, self.NO_BLOCK_DISTANCE, index - nearest)
 
-                if direction == DirectionEnum.RIGHT:
-                    x += 0.1
-                else:
-                    x -= 0.1
-        return 0
+        return distance.astype(np.int16)
 
     def put_block_by_screen_pos(self, x: int, y: int) -> None:
         pos = self.get_block_field_position(x, y)
         self.put_block(pos)
 
-    def put_block(self, pos: IntPosition) -> None:
-        try:
-            block = self.field[pos.x][pos.y]
-            if not block:
-                self.field[pos.x][pos.y] = Block()
-        except IndexError:
+    def put_block(self, pos: IntPosition, tile: TileEnum = TileEnum.BLOCK) -> None:
+        if not self.is_inside(pos.x, pos.y):
             return
+        if self.field[pos.x, pos.y] == TileEnum.EMPTY:
+            self.field[pos.x, pos.y] = tile
+            self.__update_distances(pos.x, pos.y)
+            self.__journal(pos.x, pos.y)
 
     def hit_block(self, pos: IntPosition) -> None:
-        try:
-            block = self.field[pos.x][pos.y]
-            if block:
-                self.field[pos.x][pos.y] = None
-        except IndexError:
+        if not self.is_inside(pos.x, pos.y):
             return
+        if self.field[pos.x, pos.y] != TileEnum.EMPTY:
+            self.field[pos.x, pos.y] = TileEnum.EMPTY
+            self.__update_distances(pos.x, pos.y)
+            self.__journal(pos.x, pos.y)
+
+    def __journal(self, x: int, y: int) -> None:
+        # Nobody took the reload yet: it already covers this cell
+        if not self.__is_reloaded:
+            self.__changed_cells.append((x, y))
+
+    def clear(self) -> None:
+        self.field.fill(TileEnum.EMPTY)
+        self.__update_distances()
+        self.__is_reloaded = True
 
     def hit_block_by_screen_pos(self, x, y) -> None:
         pos = self.get_block_field_position(x, y)
         self.hit_block(pos)
 
+    def get_spawn_position(self) -> tuple[float, float]:
+        """Screen position of the first spawn point, the field center when the map has none."""
+        if not self.spawn_points:
+            return (self.field.shape[0] * BLOCK_SIZE / 2, self.field.shape[1] * BLOCK_SIZE / 2)
+
+        x, y = self.spawn_points[0]
+        return (x * BLOCK_SIZE, y * BLOCK_SIZE)
+
     def save_to_file(self, path: str) -> None:
+        """Save as a binary map for a .bmap path, as a JSON map otherwise."""
+        if os.path.splitext(path)[1] == ".bmap":
+            MapFile.save(f"src/_content/maps/{path}", MapData(self.field, self.spawn_points))
+            return
+
         map = {}
         positions = {}
-        for (x, y), block in np.ndenumerate(self.field):
-            if isinstance(block, Block):
-                positions[str(IntPosition(x, y))] = type(block).__name__
+        for x, y in np.argwhere(self.field).tolist():
+            kind = self.PALETTE[TileEnum(self.field[x, y])]
+            positions[str(IntPosition(x, y))] = kind.__name__
         map["positions"] = positions
         json_string = json.dumps(map, indent=2)
         with open(f"src/_content/maps/{path}", "w") as json_file:
             json_file.write(json_string)
 
-    def load_from_file(self, path: str) -> None:
-        with open(f"src/_content/maps/{path}", "r") as json_file:
-            json_string = json_file.read()
-
-        map_data = json.loads(json_string)
+    @classmethod
+    def read_map(cls, path: str, shape: tuple[int, int]) -> MapData:
+        """Read a binary (.bmap) or JSON (.map) map without touching any field.
+        Safe to call off the main thread."""
+        tiles_by_name = {kind.__name__: tile for tile, kind in cls.PALETTE.items()}
+        return MapFile.load(f"src/_content/maps/{path}", shape, tiles_by_name)
 
-        # Initialize or clear the field
-        self.field = np.empty_like(self.field)
+    def load_from_file(self, path: str) -> None:
+        self.load_map(GameField.read_map(path, self.field.shape))
 
-        # Access the "positions" dictionary within the loaded map_data
-        positions = map_data.get("positions", {})
+    def load_map(self, map_data: MapData) -> None:
+        """Replace the field with an already read map."""
+        # Blocks get destroyed during a game: keep the read map intact for the next one
+        self.field = map_data.tiles.copy()
+        self.spawn_points = list(map_data.spawn_points)
+        self.__is_reloaded = True
 
-        for pos_str, block_type in positions.items():
-            # Convert pos_str back to an IntPosition instance
-            pos = IntPosition.from_string(pos_str)
-            self.put_block(pos)
+        self.__update_distances()
@@ -9,21 +9,27 @@ from pygame import Surface
 from OpenGL.GL import *  # type: ignore
 from OpenGL.GLU import *  # type: ignore
 
-from game.entities.buff import Buff
-from game.entities.weapon import Weapon
-from game.systems.bullets import Bullets
-from game.consts import GAME_BG_COLOR, BLOCK_SIZE, DRAW_DT, UPDATE_DT, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from game.consts import FRAME_CAP, GAME_BG_COLOR, UPDATE_DT, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from engine.frame_pacer import FramePacer
+from engine.frame_scheduler import FrameScheduler
 from engine.joysticks_manager import JoysticksManager
 from game.systems.collectable_objects import CollectableObjects
-from game.systems.damage import Damage
+from engine.graphics.blocks_renderer import BlocksRenderer
+from engine.graphics.bullets_renderer import BulletsRenderer
 from engine.graphics.display_manager import DisplayManager
+from engine.asset_manager import AssetManager
+from engine.graphics.gpu_resources import GpuResources
+from engine.graphics.meshes_renderer import MeshesRenderer
+from engine.graphics.players_renderer import PlayersRenderer
+from engine.graphics.scores_renderer import ScoresRenderer
 from game.game_field import GameField
 from game.systems.game_state import GameState
+from game.systems.map_preloader import MapPreloader
 from engine.music_manager import MusicManager
 from engine.graphics.opengl_utils import OpenGLUtils
-from game.systems.players import Players
 from engine.shader_utils import ShaderUtils
 from game.enums.window_enum import WindowEnum
+from game.world import World
 
 
 class GameWindow:
@@ -35,7 +41,7 @@ class GameWindow:
         music_manager: MusicManager,
         joysticks_manager: JoysticksManager,
         map_path: str,
-        player_start_pos: tuple[float, float]
+        preloader: MapPreloader | None = None
     ) -> None:
 
         self.__game_state = game_state
@@ -50,26 +56,18 @@ class GameWindow:
             "./src/game/_shaders/2d_shader.vert",
             "./src/game/_shaders/2d_shader.frag")
 
-        u2dProjection = glGetUniformLocation(self.__2d_shader, "uProjection")
         self.__2d_projection = OpenGLUtils.ortho(0, GAME_FIELD_WIDTH, 0, GAME_FIELD_HEIGHT, -1, 1)
-        glUniformMatrix4fv(u2dProjection, 1, GL_FALSE, self.__2d_projection.T)
+        self.__setup_2d_projection()
+
+        self.__quads_shader = ShaderUtils.create_shader(
+            "./src/game/_shaders/quads_shader.vert",
+            "./src/game/_shaders/quads_shader.frag")
 
         self.__3d_shader = ShaderUtils.create_shader(
             "./src/game/_shaders/3d_shader.vert",
             "./src/game/_shaders/3d_shader.frag")
 
-        u3dProjection = glGetUniformLocation(self.__3d_shader, "uProjection")
         self.__3d_projection = OpenGLUtils.ortho(0, GAME_FIELD_WIDTH, 0, GAME_FIELD_HEIGHT, -150, 150)
-        glUniformMatrix4fv(u3dProjection, 1, GL_FALSE, self.__3d_projection.T)
-
-        # Cache 3D shader uniform locations for faster rendering
-        self.__3d_uniforms = {
-            "mvp": glGetUniformLocation(self.__3d_shader, "mvp"),
-            "model": glGetUniformLocation(self.__3d_shader, "model"),
-            "lightPos": glGetUniformLocation(self.__3d_shader, "lightPos"),
-            "viewPos": glGetUniformLocation(self.__3d_shader, "viewPos"),
-            "objectColor": glGetUniformLocation(self.__3d_shader, "objectColor"),
-        }
 
         self.__view = OpenGLUtils.look_at(
             np.array([0.0, 0.0, 50], dtype=np.float32),
@@ -77,30 +75,46 @@ class GameWindow:
             np.array([0.0, 1.0, 0.0], dtype=np.float32)
         )
 
-        self.__game_field = GameField(
-            int(GAME_FIELD_WIDTH // BLOCK_SIZE),
-            int(GAME_FIELD_HEIGHT // BLOCK_SIZE),
-            self.__2d_shader
+        # Use what the map menu already read in the background
+        map_data = preloader.get_map(map_path) if preloader is not None else None
+        if map_data is None or map_data.tiles.shape != World.FIELD_SHAPE:
+            map_data = GameField.read_map(map_path, World.FIELD_SHAPE)
+
+        self.__world = World(
+            map_data,
+            preloader.get_meshes(CollectableObjects.get_model_paths()) if preloader is not None else None
         )
 
-        self.__game_field.load_from_file(map_path)
+        self.__joysticks_manager = joysticks_manager
+        self.__world.players.set_controllers(self.__joysticks_manager.get_joysticks())
 
-        self.__bullets = Bullets()
-        self.__players = Players(
-            self.__game_field,
-            joysticks_manager,
-            self.__2d_shader,
-            self.__bullets,
-            player_start_pos
-        )
-        self.__damage = Damage(self.__players, self.__bullets, self.__game_field)
-        self.__collectable_objects = CollectableObjects(self.__game_field, self.__3d_shader)
+        self.__blocks_renderer = BlocksRenderer(self.__2d_shader)
+        self.__scores_renderer = ScoresRenderer(self.__2d_shader)
+        self.__players_renderer = PlayersRenderer(self.__quads_shader)
+        self.__bullets_renderer = BulletsRenderer(self.__quads_shader)
+        self.__meshes_renderer = MeshesRenderer(self.__3d_shader)
+
+        # The renderers rebuild themselves
+        GpuResources.add_rebuild_callback(self.__rebuild)
 
         self.__display_manager = DisplayManager()
         self.__music_manager = music_manager
+        self.__frame_scheduler = FrameScheduler(UPDATE_DT)
+        self.__frame_pacer = FramePacer(FRAME_CAP)
 
         self.__running = True
 
+    def __setup_2d_projection(self) -> None:
+        glUseProgram(self.__2d_shader)
+        u2dProjection = glGetUniformLocation(self.__2d_shader, "uProjection")
+        glUniformMatrix4fv(u2dProjection, 1, GL_FALSE, self.__2d_projection.T)
+
+    def __rebuild(self) -> None:
+        self.__2d_shader = ShaderUtils.get_program(self.__2d_shader)
+        self.__quads_shader = ShaderUtils.get_program(self.__quads_shader)
+        self.__3d_shader = ShaderUtils.get_program(self.__3d_shader)
+        self.__setup_2d_projection()
+
     def show(self) -> None | tuple[float, float, float, float]:
 
         self.__screen = self.__display_manager.set_screen_size(
@@ -109,9 +123,9 @@ class GameWindow:
         self.__music_manager.play_game_theme()
         self.__running = True
 
-        last_time = time.perf_counter()
-        update_accumulator = 0.0
-        draw_accumulator = 0.0
+        # The time spent in menus is not simulated
+        self.__frame_scheduler.reset()
+        self.__frame_pacer.begin()
 
         start = time.time()
 
@@ -121,77 +135,78 @@ class GameWindow:
         glClearColor(*GAME_BG_COLOR)
 
         while self.__running:
-            t = time.time() - start
+            self.__frame_pacer.wait()
 
-            now = time.perf_counter()
-            frame_time = now - last_time
-            last_time = now
+            t = time.time() - start
 
-            update_accumulator += frame_time
-            draw_accumulator += frame_time
+            steps = self.__frame_scheduler.begin_frame()
 
             events = pygame.event.get()
-            keys = pygame.key.get_pressed()
-
             self.update_events(events)
+            self.__world.inputs.handle_events(events)
 
             # Updates
-            while update_accumulator >= UPDATE_DT:
-                self.__players.update(events, UPDATE_DT)
-                self.__damage.update(UPDATE_DT)
-                self.__collectable_objects.update()
+            for _ in range(steps):
+                self.__world.step(UPDATE_DT)
 
-                for player in self.__players:
-                    if player.get_scores() >= 25:
-                        self.__game_state.current_window = WindowEnum.VICTORY_MENU
-                        return player._color
+                if self.__world.winner is not None:
+                    self.__game_state.current_window = WindowEnum.VICTORY_MENU
+                    self.__frame_pacer.end()
+                    return self.__world.winner._color
 
-                for object in self.__collectable_objects:
-                    for player in self.__players:
-                        if player.rect.colliderect(object.rect):
-                            if isinstance(object, Weapon):
-                                player.update_weapon(object.get_type())
-                            elif isinstance(object, Buff):
-                                player.set_buff(object.get_type())
-                            self.__collectable_objects.remove(object)
+            # Draws, skipped while minimized; the housekeeping still runs every pass
+            if self.__frame_pacer.should_draw():
+                self.__draw(t, light_pos, camera_pos)
 
-                update_accumulator -= UPDATE_DT
+            GpuResources.collect()
+            AssetManager.update()
 
-            # Draws
-            while draw_accumulator >= DRAW_DT:
-                glEnable(GL_DEPTH_TEST)
+        self.__frame_pacer.end()
 
-                glEnable(GL_BLEND)
-                glClear(GL_COLOR_BUFFER_BIT)
-                glClear(GL_DEPTH_BUFFER_BIT)
+    def __draw(self, t: float, light_pos: np.ndarray, camera_pos: np.ndarray) -> None:
+        alpha = self.__frame_scheduler.get_alpha()
 
-                # --- 2D Rendering Pass ---
-                glUseProgram(self.__2d_shader)
-                glDisable(GL_DEPTH_TEST)
+        glEnable(GL_DEPTH_TEST)
 
-                self.__game_field.draw()
+        glEnable(GL_BLEND)
+        glClear(GL_COLOR_BUFFER_BIT)
+        glClear(GL_DEPTH_BUFFER_BIT)
+
+        # --- 2D Rendering Pass ---
+        glUseProgram(self.__2d_shader)
+        glDisable(GL_DEPTH_TEST)
 
-                for player in self.__players:
-                    player.draw()
+        self.__blocks_renderer.update(self.__world.game_field)
+        self.__blocks_renderer.draw()
 
-                self.__bullets.draw()
+        self.__scores_renderer.update(self.__world.players, alpha)
+        self.__scores_renderer.draw()
 
-                # --- 3D Rendering Pass ---
-                glUseProgram(self.__3d_shader)
-                glEnable(GL_DEPTH_TEST)
+        self.__players_renderer.update(self.__world.players, alpha)
+        self.__players_renderer.draw()
 
-                self.__collectable_objects.draw(
-                    self.__3d_projection,
-                    self.__view,
-                    t,
-                    light_pos,
-                    camera_pos,
-                    self.__3d_uniforms
-                )
+        self.__bullets_renderer.update(self.__world.bullets, alpha)
+        self.__bullets_renderer.draw()
+
+        # --- 3D Rendering Pass ---
+        self.__meshes_renderer.update(
+            [object.get_draw_data() for object in self.__world.collectable_objects],
+            self.__3d_projection,
+            self.__view,
+            t,
+            self.__screen.get_width() / GAME_FIELD_WIDTH
+        )
+        self.__meshes_renderer.draw(light_pos, camera_pos)
 
-                pygame.display.flip()
+        pygame.display.flip()
 
-                draw_accumulator -= DRAW_DT
+    def cleanup(self) -> None:
+        """Free the GPU resources of the match, call before dropping the window."""
+        self.__blocks_renderer.cleanup()
+        self.__scores_renderer.cleanup()
+        self.__players_renderer.cleanup()
+        self.__bullets_renderer.cleanup()
+        self.__meshes_renderer.cleanup()
 
     def update_events(self, events: list[Event]) -> None:
         for event in events:
@@ -202,6 +217,8 @@ class GameWindow:
                     (event.type == pygame.JOYBUTTONDOWN and event.button == 7):
                 self.__game_state.current_window = WindowEnum.PAUSE_MENU
                 self.__running = False
+            if event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
+                self.__world.players.set_controllers(self.__joysticks_manager.get_joysticks())
             if event.type == pygame.VIDEORESIZE:
                 videoresize = self.__display_manager.resize_display(
                     self.__screen, self.__2d_shader, self.__past_screen_size, event.size)
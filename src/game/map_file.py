@@ -0,0 +1,143 @@
+"""
+Binary map format (.bmap).
+
+Little-endian layout:
+- header: magic b"BMAP", format version (uint16), width and height in cells
+  (uint16), number of spawn points (uint16) and number of tile runs (uint32)
+- spawn points: (x, y) float32 pairs in cell units
+- tile runs: the run values (uint8), then the run lengths (uint16), over the
+  tile grid flattened in field[x][y] order
+
+Loading is a few np.frombuffer() calls and one np.repeat() straight into the
+field array. The JSON .map files ({"positions": {"XxY": "Block"}}) are still
+read for back-compat; they have no spawn points.
+"""
+
+from dataclasses import dataclass, field
+import json
+import struct
+
+import numpy as np
+
+from game.enums.tile_enum import TileEnum
+from game.systems.position import IntPosition
+
+
+@dataclass
+class MapData:
+    tiles: np.ndarray  # (width, height) uint8 tile ids, indexed as tiles[x][y]
+    spawn_points: list[tuple[float, float]] = field(default_factory=list)  # in cell units
+
+
+class MapFile:
+    MAGIC = b"BMAP"
+    VERSION = 1
+
+    HEADER = struct.Struct("<4sHHHHI")
+
+    # Longest run that fits a uint16 length
+    MAX_RUN = np.iinfo(np.uint16).max
+
+    @staticmethod
+    def load(path: str, shape: tuple[int, int], tiles_by_name: dict[str, int]) -> MapData:
+        """Load a binary or JSON map into a grid of `shape`.
+
+        Args:
+            path: Map file path
+            shape: (width, height) of the game field; tiles outside it are dropped
+            tiles_by_name: Tile id of each block name used by JSON maps
+        """
+        with open(path, "rb") as map_file:
+            data = map_file.read()
+
+        if data.startswith(MapFile.MAGIC):
+            map_data = MapFile.decode(data)
+        else:
+            map_data = MapFile.decode_json(data.decode("utf-8"), shape, tiles_by_name)
+
+        map_data.tiles = MapFile.__fit(map_data.tiles, shape)
+        return map_data
+
+    @staticmethod
+    def save(path: str, map_data: MapData) -> None:
+        with open(path, "wb") as map_file:
+            map_file.write(MapFile.encode(map_data))
+
+    @staticmethod
+    def encode(map_data: MapData) -> bytes:
+        values, lengths = MapFile.__encode_runs(np.ascontiguousarray(map_data.tiles, dtype=np.uint8).reshape(-1))
+        spawn_points = np.array(map_data.spawn_points, dtype="<f4").reshape(-1, 2)
+        width, height = map_data.tiles.shape
+
+        header = MapFile.HEADER.pack(MapFile.MAGIC, MapFile.VERSION, width, height, len(spawn_points), len(values))
+        return header + spawn_points.tobytes() + values.tobytes() + lengths.astype("<u2").tobytes()
+
+    @staticmethod
+    def decode(data: bytes) -> MapData:
+        if len(data) < MapFile.HEADER.size:
+            raise ValueError("Truncated map header.")
+
+        magic, version, width, height, spawn_count, run_count = MapFile.HEADER.unpack_from(data)
+        if magic != MapFile.MAGIC:
+            raise ValueError("Not a binary map file.")
+        if version != MapFile.VERSION:
+            raise ValueError(f"Unsupported map version {version}.")
+
+        offset = MapFile.HEADER.size
+        spawn_points = np.frombuffer(data, dtype="<f4", count=spawn_count * 2, offset=offset).reshape(-1, 2)
+        offset += spawn_points.nbytes
+        values = np.frombuffer(data, dtype=np.uint8, count=run_count, offset=offset)
+        offset += values.nbytes
+        lengths = np.frombuffer(data, dtype="<u2", count=run_count, offset=offset)
+
+        if int(lengths.sum()) != width * height:
+            raise ValueError("Tile runs do not match the map size.")
+
+        tiles = np.repeat(values, lengths).reshape(width, height)
+        return MapData(tiles, [(float(x), float(y)) for x, y in spawn_points])
+
+    @staticmethod
+    def decode_json(text: str, shape: tuple[int, int], tiles_by_name: dict[str, int]) -> MapData:
+        tiles = np.zeros(shape, dtype=np.uint8)
+
+        # Access the "positions" dictionary within the loaded map data
+        positions = json.loads(text).get("positions", {})
+        if not positions:
+            return MapData(tiles)
+
+        # Convert "XxY" keys into coordinate arrays and fill the grid in one go
+        coords = [IntPosition.from_string(pos_str) for pos_str in positions]
+        xs = np.array([pos.x for pos in coords], dtype=np.intp)
+        ys = np.array([pos.y for pos in coords], dtype=np.intp)
+        values = np.array([tiles_by_name.get(name, TileEnum.BLOCK) for name in positions.values()], dtype=np.uint8)
+
+        inside = (xs >= 0) & (xs < shape[0]) & (ys >= 0) & (ys < shape[1])
+        tiles[xs[inside], ys[inside]] = values[inside]
+
+        return MapData(tiles)
+
+    @staticmethod
+    def __encode_runs(flat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if len(flat) == 0:
+            return np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.uint16)
+
+        starts = np.flatnonzero(np.concatenate(([True], flat[1:] != flat[:-1])))
+        lengths = np.diff(np.append(starts, len(flat)))
+
+        # Split runs longer than a uint16 length
+        pieces = -(-lengths // MapFile.MAX_RUN)
+        values = np.repeat(flat[starts], pieces)
+        split = np.full(int(pieces.sum()), MapFile.MAX_RUN, dtype=np.int64)
+        split[np.cumsum(pieces) - 1] = lengths - (pieces - 1) * MapFile.MAX_RUN
+
+        return values, split.astype(np.uint16)
+
+    @staticmethod
+    def __fit(tiles: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+        if tiles.shape == shape:
+            return tiles
+
+        fitted = np.zeros(shape, dtype=np.uint8)
+        width, height = min(shape[0], tiles.shape[0]), min(shape[1], tiles.shape[1])
+        fitted[:width, :height] = tiles[:width, :height]
+        return fitted
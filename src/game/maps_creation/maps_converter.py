@@ -0,0 +1,53 @@
+"""
+Convert the JSON .map files in src/_content/maps to binary .bmap files.
+
+Run from the repository root:
+    python src/game/maps_creation/maps_converter.py [file.map ...]
+
+Without arguments every .map file in the maps folder is converted. The
+spawn point of each map (in cell units) is stored in the .bmap file.
+"""
+
+import glob
+import sys
+import os
+
+# Добавляем путь к src в sys.path, чтобы видеть модуль game
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from game.consts import MAP_HEIGHT, MAP_WIDTH
+from game.entities.block import Block
+from game.enums.tile_enum import TileEnum
+from game.map_file import MapData, MapFile
+
+
+MAPS_FOLDER = "src/_content/maps"
+
+# Player spawn point of each map in cells, the field center when missing
+SPAWN_POINTS: dict[str, tuple[float, float]] = {
+    "climbing.map": (MAP_WIDTH / 2, MAP_HEIGHT / 2),
+    "moon-or-not-moon.map": (MAP_WIDTH / 2, MAP_HEIGHT - 3),
+    "just-face.map": (MAP_WIDTH / 2, MAP_HEIGHT / 2 + 4),
+    "platform.map": (MAP_WIDTH / 2, MAP_HEIGHT / 2),
+    "pillars.map": (MAP_WIDTH / 2, MAP_HEIGHT / 2 - 9),
+    "sight.map": (MAP_WIDTH / 2, MAP_HEIGHT - 5),
+}
+
+TILES_BY_NAME = {Block.__name__: TileEnum.BLOCK}
+
+
+def convert(path: str) -> str:
+    map_data = MapFile.load(path, (MAP_WIDTH, MAP_HEIGHT), TILES_BY_NAME)
+    spawn_point = SPAWN_POINTS.get(os.path.basename(path), (MAP_WIDTH / 2, MAP_HEIGHT / 2))
+
+    output_path = os.path.splitext(path)[0] + ".bmap"
+    MapFile.save(output_path, MapData(map_data.tiles, [spawn_point]))
+    return output_path
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(MAPS_FOLDER, "*.map")))
+
+    for path in paths:
+        output_path = convert(path)
+        print(f"{path} -> {output_path} ({os.path.getsize(path)} -> {os.path.getsize(output_path)} bytes)")
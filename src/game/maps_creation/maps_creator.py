@@ -14,6 +14,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'
 
 from mouse_buttons import Mouse
 from game.consts import GAME_BG_COLOR, BLOCK_SIZE, GAME_FIELD_HEIGHT, GAME_FIELD_PROPORTIONS, GAME_FIELD_WIDTH, MAP_HEIGHT, MAP_WIDTH, MAPS_CELLS_COLOR, VIRTUAL_BLOCK_COLOR
+from engine.graphics.blocks_renderer import BlocksRenderer
 from engine.shader_utils import ShaderUtils
 from engine.graphics.opengl_utils import OpenGLUtils
 from engine.graphics.display_manager import DisplayManager
@@ -54,9 +55,9 @@ uColorLoc = glGetUniformLocation(shader, "uColor")
 mouse = Mouse()
 game_field = GameField(
     int(GAME_FIELD_WIDTH // BLOCK_SIZE),
-    int(GAME_FIELD_HEIGHT // BLOCK_SIZE),
-    shader
+    int(GAME_FIELD_HEIGHT // BLOCK_SIZE)
 )
+blocks_renderer = BlocksRenderer(shader)
 
 renderer = Renderer2D()
 
@@ -114,15 +115,15 @@ while True:
 
         if keys[pygame.K_s]:
             print('saved')
-            game_field.save_to_file("sight.map")
+            game_field.save_to_file("sight.bmap")
 
         if keys[pygame.K_l]:
             print('loaded')
-            game_field.load_from_file("sight.map")
+            game_field.load_from_file("sight.bmap")
 
         if keys[pygame.K_c]:
             print('cleared')
-            game_field.field.fill(None)
+            game_field.clear()
 
         if event.type == pygame.VIDEORESIZE:
             videoresize = display_manager.resize_display(screen, shader, past_screen_size, event.size)
@@ -188,7 +189,8 @@ while True:
         )
 
     # Draw
-    game_field.draw()
+    blocks_renderer.update(game_field)
+    blocks_renderer.draw()
 
     clock.tick(60)
     pygame.display.flip()
@@ -0,0 +1,40 @@
+import random
+
+
+class BotController:
+    """Random gamepad input for headless matches (see World).
+
+    Answers like a joystick. Every choice of stick, trigger and jump button
+    is held for a while, the way a player would, and changes on update().
+    """
+
+    # Range of ticks a choice is held for
+    HOLD_TICKS = (15, 90)
+
+    def __init__(self, seed: int) -> None:
+        self.__random = random.Random(seed)
+        self.__axes = [0.0] * 6
+        self.__buttons = [False] * 12
+        self.__hold = 0
+
+    def update(self) -> None:
+        """Advance one tick."""
+        self.__hold -= 1
+        if self.__hold > 0:
+            return
+
+        self.__hold = self.__random.randint(*self.HOLD_TICKS)
+
+        # Left stick x, right trigger (rests at -1) and the jump button
+        self.__axes[0] = self.__random.choice((-1.0, 0.0, 1.0))
+        self.__axes[5] = self.__random.choice((-1.0, 1.0))
+        self.__buttons[0] = self.__random.random() < 0.3
+
+    def get_axis(self, axis: int) -> float:
+        return self.__axes[axis]
+
+    def get_button(self, button: int) -> bool:
+        return self.__buttons[button]
+
+    def rumble(self, low_frequency: float, high_frequency: float, duration: int) -> bool:
+        return False
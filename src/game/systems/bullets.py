@@ -1,13 +1,149 @@
-from game.entities.bullet import Bullet
+import numpy as np
 
+from game.consts import (
+    BAZOOKA_BULLET_DAMAGE, BAZOOKA_BULLET_HEIGHT, BAZOOKA_BULLET_SPEED, BAZOOKA_BULLET_WIDTH,
+    GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH,
+    MACHINE_GUN_BULLET_DAMAGE, MACHINE_GUN_BULLET_HEIGHT, MACHINE_GUN_BULLET_SPEED, MACHINE_GUN_BULLET_WIDTH,
+    PISTOL_BULLET_DAMAGE, PISTOL_BULLET_HEIGHT, PISTOL_BULLET_SPEED, PISTOL_BULLET_WIDTH,
+    SHOTGUN_BULLET_DAMAGE, SHOTGUN_BULLET_DISPERSION_VELOCITY, SHOTGUN_BULLET_HEIGHT, SHOTGUN_BULLET_SPEED,
+    SHOTGUN_BULLET_WIDTH
+)
+from game.enums.direction_enum import DirectionEnum
+from game.enums.weapon_enum import WeaponEnum
+from game.systems.float_rect import FloatRect
 
-class Bullets(list[Bullet]):
-    def draw(self):
-        for bullet in self:
-            bullet.draw()
 
-    def add_bullet(self, bullet: Bullet):
-        self.append(bullet)
+# Weapon -> (damage, speed, width, height) of its bullets
+BULLET_STATS: dict[WeaponEnum, tuple[float, float, float, float]] = {
+    WeaponEnum.PISTOL: (PISTOL_BULLET_DAMAGE, PISTOL_BULLET_SPEED, PISTOL_BULLET_WIDTH, PISTOL_BULLET_HEIGHT),
+    WeaponEnum.MACHINE_GUN: (
+        MACHINE_GUN_BULLET_DAMAGE, MACHINE_GUN_BULLET_SPEED, MACHINE_GUN_BULLET_WIDTH, MACHINE_GUN_BULLET_HEIGHT
+    ),
+    WeaponEnum.BAZOOKA: (BAZOOKA_BULLET_DAMAGE, BAZOOKA_BULLET_SPEED, BAZOOKA_BULLET_WIDTH, BAZOOKA_BULLET_HEIGHT),
+    WeaponEnum.SHOTGUN: (SHOTGUN_BULLET_DAMAGE, SHOTGUN_BULLET_SPEED, SHOTGUN_BULLET_WIDTH, SHOTGUN_BULLET_HEIGHT),
+}
 
-    def clear_by_color(self, color: tuple[float, float, float, float]):
-        self[:] = [b for b in self if b._color != color]
+
+class Bullets:
+    """Structure-of-arrays store of all live bullets.
+
+    Every bullet is one index into a set of contiguous arrays, the first
+    `len(self)` entries are in use. Movement, culling and compaction are
+    vectorized over the whole store.
+    """
+
+    # Names of the per-bullet arrays
+    FIELDS = (
+        "x", "y", "prev_x", "prev_y", "width", "height", "velocity_x", "velocity_y",
+        "angle", "damage", "owner", "weapon", "color", "alive"
+    )
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+
+        # Position before the last update(), for render interpolation
+        self.prev_x = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+
+        self.width = np.zeros(capacity, dtype=np.float64)
+        self.height = np.zeros(capacity, dtype=np.float64)
+        self.velocity_x = np.zeros(capacity, dtype=np.float64)
+        self.velocity_y = np.zeros(capacity, dtype=np.float64)
+        self.angle = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.owner = np.zeros(capacity, dtype=np.int16)
+        self.weapon = np.zeros(capacity, dtype=np.uint8)
+        self.color = np.zeros((capacity, 4), dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+
+        self.__count = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        direction: DirectionEnum,
+        owner: int,
+        color: tuple[float, float, float, float],
+        weapon_type: WeaponEnum,
+        angle: float = 0,
+        damage_coefficient: float = 1.0
+    ) -> None:
+
+        if self.__count == len(self.x):
+            self.__grow()
+
+        damage, speed, width, height = BULLET_STATS[weapon_type]
+        sign = 1 if direction == DirectionEnum.RIGHT else -1
+
+        i = self.__count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.width[i] = width
+        self.height[i] = height
+        self.velocity_x[i] = sign * speed
+        if weapon_type == WeaponEnum.SHOTGUN:
+            self.velocity_y[i] = sign * SHOTGUN_BULLET_DISPERSION_VELOCITY * angle
+        else:
+            self.velocity_y[i] = 0.0
+        self.angle[i] = angle
+        self.damage[i] = damage * damage_coefficient
+        self.owner[i] = owner
+        self.weapon[i] = weapon_type.value
+        self.color[i] = color
+        self.alive[i] = True
+
+        self.__count += 1
+
+    def __grow(self) -> None:
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+
+    def update(self, dt: float) -> None:
+        n = self.__count
+
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+        self.x[:n] += self.velocity_x[:n] * dt
+        self.y[:n] += self.velocity_y[:n] * dt
+
+        # Bullets that left the game field never come back
+        outside = (
+            (self.x[:n] + self.width[:n] < 0.0) | (self.x[:n] > GAME_FIELD_WIDTH) |
+            (self.y[:n] + self.height[:n] < 0.0) | (self.y[:n] > GAME_FIELD_HEIGHT)
+        )
+        self.alive[:n] &= ~outside
+
+        self.compact()
+
+    def compact(self) -> None:
+        """Drop dead bullets, keeping the live ones contiguous and in order."""
+        keep = np.flatnonzero(self.alive[:self.__count])
+        if len(keep) == self.__count:
+            return
+
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self.alive[len(keep):self.__count] = False
+
+        self.__count = len(keep)
+
+    def kill(self, index: int) -> None:
+        self.alive[index] = False
+
+    def clear_by_owner(self, owner: int) -> None:
+        # Only marks the bullets dead: indices stay valid until the next compact()
+        self.alive[:self.__count] &= self.owner[:self.__count] != owner
+
+    def get_rect(self, index: int) -> FloatRect:
+        return FloatRect(self.x[index], self.y[index], self.width[index], self.height[index])
+
+    def get_weapon(self, index: int) -> WeaponEnum:
+        return WeaponEnum(int(self.weapon[index]))
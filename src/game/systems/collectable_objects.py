@@ -1,57 +1,76 @@
-import numpy as np
 import random
 
-from OpenGL.GL.shaders import ShaderProgram
-import pygame
-from engine.graphics.opengl_3d_utils import OpenGL_3D_Utils
+from engine.graphics.opengl_3d_utils import MeshData, OpenGL_3D_Utils
 from game.consts import BLOCK_SIZE
 from game.game_field import GameField
 from game.entities.buff import Buff
 from game.entities.weapon import Weapon
+from game.systems.game_clock import GameClock
 from game.enums.buff_enum import BuffEnum
 from game.enums.weapon_enum import WeaponEnum
 
 
 class CollectableObjects(list[Buff | Weapon]):
-
-    def __init__(self, game_field: GameField, shader: ShaderProgram | None) -> None:
+    # Конфиги для разных типов предметов
+    BUFFS_CONFIG = {
+        BuffEnum.ENDLESS_HEALTH: "src/_content/3D_models/buffs/heart.STL",
+        BuffEnum.STRENGTH_INCREASE: "src/_content/3D_models/buffs/energy_drink.STL"
+    }
+
+    WEAPONS_CONFIG = {
+        WeaponEnum.BAZOOKA: "src/_content/3D_models/weapons/bazooka.STL",
+        WeaponEnum.MACHINE_GUN: "src/_content/3D_models/weapons/machine_gun.STL",
+        WeaponEnum.SHOTGUN: "src/_content/3D_models/weapons/shotgun.STL"
+    }
+
+    @classmethod
+    def get_model_paths(cls) -> list[str]:
+        return [*cls.BUFFS_CONFIG.values(), *cls.WEAPONS_CONFIG.values()]
+
+    def __init__(
+        self,
+        game_field: GameField,
+        clock: GameClock,
+        random_generator: random.Random,
+        meshes: dict[str, MeshData] | None = None
+    ) -> None:
+        """
+        Args:
+            game_field: Field the items are spawned on
+            clock: Simulation clock of the spawn timers
+            random_generator: Picks the items and their positions, seeded for reproducible matches
+            meshes: Already loaded models by file path (see MapPreloader), others are loaded here
+        """
         super().__init__()
-        self.__shader = shader
+
+        self.__clock = clock
+        self.__random = random_generator
 
         self.__none_positions, self.__block_positions = game_field.return_block_positions()
 
         if not self.__block_positions:
             return
 
-        # Конфиги для разных типов предметов
-        self.__buffs_config = {
-            BuffEnum.ENDLESS_HEALTH: "src/_content/3D_models/buffs/heart.STL",
-            BuffEnum.STRENGTH_INCREASE: "src/_content/3D_models/buffs/energy_drink.STL"
-        }
-
-        self.__weapons_config = {
-            WeaponEnum.BAZOOKA: "src/_content/3D_models/weapons/bazooka.STL",
-            WeaponEnum.MACHINE_GUN: "src/_content/3D_models/weapons/machine_gun.STL",
-            WeaponEnum.SHOTGUN: "src/_content/3D_models/weapons/shotgun.STL"
-        }
+        meshes = meshes or {}
 
         # Загружаем модели
         self.__buff_models = {
-            enum_val: OpenGL_3D_Utils.load(path)
-            for enum_val, path in self.__buffs_config.items()
+            enum_val: meshes.get(path) or OpenGL_3D_Utils.load(path)
+            for enum_val, path in self.BUFFS_CONFIG.items()
         }
 
         self.__weapons_models = {
-            enum_val: OpenGL_3D_Utils.load(path)
-            for enum_val, path in self.__weapons_config.items()
+            enum_val: meshes.get(path) or OpenGL_3D_Utils.load(path)
+            for enum_val, path in self.WEAPONS_CONFIG.items()
         }
 
-        self.__buff_timer = 0
-        self.__weapon_timer = 0
+        # Spawn time of the last items, None when new ones are due
+        self.__buff_timer: int | None = None
+        self.__weapon_timer: int | None = None
         self.__timers_cooldown = 10000
 
     def update(self) -> None:
-        if self.__buff_timer == 0:
+        if self.__buff_timer is None:
             while True:
                 buff = self.__create_item(
                     self.__buff_models,
@@ -64,9 +83,9 @@ class CollectableObjects(list[Buff | Weapon]):
                     self.append(buff)
                     break
 
-            self.__buff_timer = pygame.time.get_ticks()
+            self.__buff_timer = self.__clock.get_ticks()
 
-        if self.__weapon_timer == 0:
+        if self.__weapon_timer is None:
             for _ in range(2):
                 while True:
                     weapon = self.__create_item(
@@ -80,15 +99,15 @@ class CollectableObjects(list[Buff | Weapon]):
                         self.append(weapon)
                         break
 
-            self.__weapon_timer = pygame.time.get_ticks()
+            self.__weapon_timer = self.__clock.get_ticks()
 
         if len(self) > 6:
             return
 
-        if pygame.time.get_ticks() - self.__buff_timer >= self.__timers_cooldown:
-            self.__buff_timer = 0
-        if pygame.time.get_ticks() - self.__weapon_timer >= self.__timers_cooldown:
-            self.__weapon_timer = 0
+        if self.__clock.get_ticks() - self.__buff_timer >= self.__timers_cooldown:
+            self.__buff_timer = None
+        if self.__clock.get_ticks() - self.__weapon_timer >= self.__timers_cooldown:
+            self.__weapon_timer = None
 
     def __create_item(
         self,
@@ -97,10 +116,10 @@ class CollectableObjects(list[Buff | Weapon]):
         block_positions: list[tuple[int, int]],
         none_positions: list[tuple[int, int]]
     ):
-        model_enum = random.choice(list(models.keys()))
+        model_enum = self.__random.choice(list(models.keys()))
 
         while True:
-            item_pos = random.choice(none_positions)
+            item_pos = self.__random.choice(none_positions)
 
             if (item_pos[0], item_pos[1] + BLOCK_SIZE) not in block_positions:
                 continue
@@ -111,22 +130,10 @@ class CollectableObjects(list[Buff | Weapon]):
 
             break
 
-        return item_class(self.__shader, item_pos, model_enum, models[model_enum])
+        return item_class(item_pos, model_enum, models[model_enum])
 
     def __check_collision(self, item) -> bool:
         for existing_item in self:
             if item.rect.colliderect(existing_item.rect):
                 return True
         return False
-
-    def draw(
-        self,
-        projection: np.ndarray,
-        view: np.ndarray,
-        t: float,
-        light_pos: np.ndarray,
-        camera_pos: np.ndarray,
-        uniforms: dict
-    ) -> None:
-        for item in self:
-            item.draw(projection, view, t, light_pos, camera_pos, uniforms)
@@ -1,11 +1,10 @@
 from typing import Sequence
-import numpy as np
 
 from game.consts import BLOCK_SIZE, GAME_FIELD_HEIGHT
-from game.entities.bullet import Bullet
 from game.systems.bullets import Bullets
 from game.game_field import GameField
 from game.systems.object_protocol import DamageableObject
+from game.systems.spatial_hash import SpatialHash
 
 
 class Damage:
@@ -19,38 +18,55 @@ class Damage:
         self.__bullets = bullets
         self.__damageables = damageables
         self.__game_field = game_field
+        self.__damageables_hash: SpatialHash[DamageableObject] = SpatialHash()
 
     def update(self, dt: float):
-        for bullet in self.__bullets:
-            if bullet.is_destroyed() == True:
-                self.__destroy(bullet)
-            bullet.update(dt)
-
-        for bullet in self.__bullets:
-            for player in self.__damageables:
-                if bullet.rect.colliderect(player.rect):
-                    is_dead = player.damage(bullet)
-
-                    for p in self.__damageables:
-                        if p._color == bullet._color and player._color != bullet._color and is_dead == "kill":
-                            p.add_score()
-                            self.__destroy(bullet)
-                            return
-
-                        self.__destroy(bullet)
-
-            for (bx, by), block in np.ndenumerate(self.__game_field.field):
-                if block is not None:
-                    block_rect = self.__game_field._get_block_rect(bx, by)
-                    if bullet.rect.colliderect(block_rect):
-                        self.__destroy(bullet)
-                        break
+        bullets = self.__bullets
+
+        # Movement, out-of-field culling and compaction, vectorized over all bullets
+        bullets.update(dt)
+
+        count = len(bullets)
+        hits_blocks = self.__game_field.colliderect_blocks_many(
+            bullets.x[:count], bullets.y[:count], bullets.width[:count], bullets.height[:count])
+
+        # Players move every tick, so the broadphase is rebuilt from scratch
+        self.__damageables_hash.clear()
+        for damageable in self.__damageables:
+            self.__damageables_hash.insert(damageable, damageable.rect)
+
+        for i in range(count):
+            if not bullets.alive[i]:
+                continue
+            if self.__hit_damageable(i) or hits_blocks[i]:
+                bullets.kill(i)
+
+        bullets.compact()
 
         for player in self.__damageables:
             if player.rect.top > GAME_FIELD_HEIGHT + BLOCK_SIZE * 15:
                 if not player._is_endless_health:
                     player.kill()
 
-    def __destroy(self, bullet: Bullet):
-        if bullet in self.__bullets:
-            self.__bullets.remove(bullet)
+    def __hit_damageable(self, index: int) -> bool:
+        bullet_rect = self.__bullets.get_rect(index)
+        owner = self.__bullets.owner[index]
+
+        for player in self.__damageables_hash.query(bullet_rect):
+            # A bullet never hits its own shooter
+            if player._id == owner:
+                continue
+
+            if not bullet_rect.colliderect(player.rect):
+                continue
+
+            is_dead = player.damage(float(self.__bullets.damage[index]), self.__bullets.get_weapon(index))
+
+            if is_dead == "kill":
+                for p in self.__damageables:
+                    if p._id == owner:
+                        p.add_score()
+
+            return True
+
+        return False
@@ -0,0 +1,24 @@
+from game.consts import UPDATE_DT
+
+
+class GameClock:
+    """Simulation time, advanced by the game loop by UPDATE_DT per tick.
+
+    Gameplay timers (cooldowns, buffs, pickup spawns) read this clock
+    instead of the wall clock: a headless match can run faster than real
+    time and the same inputs always give the same match.
+    """
+
+    def __init__(self) -> None:
+        self.__ticks = 0
+
+    def tick(self) -> None:
+        self.__ticks += 1
+
+    def get_tick_count(self) -> int:
+        return self.__ticks
+
+    def get_ticks(self) -> int:
+        """Milliseconds of simulation time, like pygame.time.get_ticks()."""
+        # From the tick count: summing UPDATE_DT would drift
+        return int(self.__ticks * UPDATE_DT * 1000)
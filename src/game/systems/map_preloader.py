@@ -0,0 +1,54 @@
+"""
+Background loading of maps and collectible meshes.
+
+The map menu starts the preloader when it opens. Every map listed in the
+menu is read and the collectible meshes are loaded (through the mesh cache)
+by the AssetManager while the player is still choosing; the meshes are
+uploaded during the menu frames. GameWindow then gets ready data instead of
+doing the file work before its first frame.
+"""
+
+from engine.asset_manager import AssetHandle, AssetManager
+from engine.graphics.opengl_3d_utils import MeshData
+from game.consts import MAP_HEIGHT, MAP_WIDTH
+from game.game_field import GameField
+from game.map_file import MapData
+
+
+class MapPreloader:
+    def __init__(self) -> None:
+        self.__maps: dict[str, AssetHandle[MapData]] = {}
+        self.__meshes: dict[str, AssetHandle[MeshData]] = {}
+
+    def start(self, map_paths: list[str], mesh_paths: list[str]) -> None:
+        """Request the maps and the meshes. Already requested files are skipped."""
+        for path in map_paths:
+            if path not in self.__maps:
+                self.__maps[path] = AssetManager.request(
+                    ("map", path),
+                    lambda path=path: GameField.read_map(path, (MAP_WIDTH, MAP_HEIGHT))
+                )
+
+        for path in mesh_paths:
+            if path not in self.__meshes:
+                self.__meshes[path] = AssetManager.load_mesh(path)
+
+    def get_map(self, path: str) -> MapData | None:
+        """Return the preloaded map, waiting for it if it is still loading.
+        None if it was never requested or failed to load (the caller loads it itself)."""
+        return self.__get_value(self.__maps.get(path))
+
+    def get_meshes(self, paths: list[str]) -> dict[str, MeshData]:
+        """Return the preloaded meshes among `paths` by path, waiting for those still loading."""
+        meshes = {path: self.__get_value(self.__meshes.get(path)) for path in paths}
+        return {path: mesh for path, mesh in meshes.items() if mesh is not None}
+
+    def __get_value(self, handle: AssetHandle | None):
+        if handle is None:
+            return None
+
+        try:
+            return handle.wait()
+        except Exception:
+            # Loading again on the main thread raises the error where it is handled
+            return None
@@ -1,5 +1,5 @@
 from typing import Protocol
-from game.entities.bullet import Bullet
+from game.enums.weapon_enum import WeaponEnum
 from game.systems.float_rect import FloatRect
 
 
@@ -13,9 +13,17 @@ class ObjectProtocol(Protocol):
 
 class DamageableObject(Protocol):
     rect: FloatRect
+    _id: int
     _color: tuple[float, float, float, float]
     _is_endless_health: bool
     _is_strength_increase: bool
-    def damage(self, bullet: Bullet) -> None | str: ...
+    def damage(self, damage: float, weapon_type: WeaponEnum) -> None | str: ...
     def add_score(self) -> None: ...
     def kill(self) -> None: ...
+
+
+class Controller(Protocol):
+    """Input device of a player: a pygame joystick, or anything answering like one."""
+    def get_axis(self, axis: int) -> float: ...
+    def get_button(self, button: int) -> bool: ...
+    def rumble(self, low_frequency: float, high_frequency: float, duration: int) -> bool: ...
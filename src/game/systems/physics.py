@@ -1,4 +1,7 @@
-from game.consts import GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH, GRAVITY
+import math
+from dataclasses import dataclass
+
+from game.consts import BLOCK_SIZE, COLLISION_INSET, CONTACT_DISTANCE, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH, GRAVITY
 from game.enums.direction_enum import DirectionEnum
 from game.systems.object_protocol import ObjectProtocol
 from typing import TYPE_CHECKING
@@ -7,61 +10,81 @@ if TYPE_CHECKING:
     from game.game_field import GameField
 
 
+@dataclass
+class SweepHit:
+    distance: float              # how far the rect can move before touching a block
+    normal: tuple[int, int]      # contact normal, (0, 0) when nothing was hit
+    remaining: float             # part of the requested move left after the contact
+
+    @property
+    def is_hit(self) -> bool:
+        return self.normal != (0, 0)
+
+
 class Physics:
     def __init__(self, object: ObjectProtocol, game_field: "GameField") -> None:
         self.__object = object
         self.__game_field = game_field
 
-    def collidepoints(self, direction: DirectionEnum, dt: float) -> tuple[tuple[float, float], tuple[float, float]]:
+    def sweep(self, direction: DirectionEnum, distance: float) -> SweepHit:
+        """Sweep the object's rect `distance` units in `direction` through the tile grid.
+
+        The nearest block line ahead comes from the game field's distance fields,
+        so the cost is a couple of array lookups however far away the block is.
+        """
+        rect = self.__object.rect
+        field = self.__game_field.field
+        step = 1 if direction in (DirectionEnum.RIGHT, DirectionEnum.DOWN) else -1
+
+        if direction in (DirectionEnum.LEFT, DirectionEnum.RIGHT):
+            line_count = field.shape[0]
+            first, last = self.__cells_between(
+                rect.top + COLLISION_INSET, rect.bottom - COLLISION_INSET, field.shape[1])
+            leading = rect.right if step > 0 else rect.left
+            normal = (-step, 0)
+        else:
+            line_count = field.shape[1]
+            first, last = self.__cells_between(
+                rect.left + COLLISION_INSET, rect.right - COLLISION_INSET, field.shape[0])
+            leading = rect.bottom if step > 0 else rect.top
+            normal = (0, -step)
+
+        # Cell under the leading edge, or the one it touches from the moving side
+        if step > 0:
+            line = max(math.floor(leading / BLOCK_SIZE), 0)
+        else:
+            line = min(math.ceil(leading / BLOCK_SIZE) - 1, line_count - 1)
 
-        if direction == DirectionEnum.DOWN:
-            x1 = self.__object.rect.x + 2.0
-            x2 = self.__object.rect.x + self.__object.rect.width - 2.0
-            y1 = y2 = self.__object.rect.y + self.__object.rect.height + self.__object.velocity_y * dt
-            return ((x1, y1), (x2, y2))
-        elif direction == DirectionEnum.UP:
-            x1 = self.__object.rect.x + 2.0
-            x2 = self.__object.rect.x + self.__object.rect.width - 2.0
-            y1 = y2 = self.__object.rect.y + self.__object.velocity_y * dt
-            return ((x1, y1), (x2, y2))
-        elif direction == DirectionEnum.LEFT:
-            x1 = x2 = self.__object.rect.x - self.__object.speed * dt
-            y1 = self.__object.rect.y + 2.0
-            y2 = self.__object.rect.y + self.__object.rect.height - 2.0
-            return ((x1, y1), (x2, y2))
-        elif direction == DirectionEnum.RIGHT:
-            x1 = x2 = self.__object.rect.x + self.__object.rect.width + self.__object.speed * dt
-            y1 = self.__object.rect.y + 2.0
-            y2 = self.__object.rect.y + self.__object.rect.height - 2.0
-            return ((x1, y1), (x2, y2))
+        if first <= last and 0 <= line < line_count:
+            block_line = self.__game_field.find_block_line(direction, line, first, last)
 
-    def is_block(self, direction: DirectionEnum, dt: float) -> bool:
+            if block_line is not None:
+                near_edge = block_line * BLOCK_SIZE if step > 0 else (block_line + 1) * BLOCK_SIZE
+                gap = max((near_edge - leading) * step, 0.0)
 
-        if direction == DirectionEnum.DOWN:
-            point1, point2 = self.collidepoints(direction, dt)
-            rect = self.__object.rect.move(0, self.__object.velocity_y * dt)
-            is_block = self.__game_field.colliderect_with(*point1, rect) or \
-                self.__game_field.colliderect_with(*point2, rect)
+                if gap <= distance:
+                    return SweepHit(gap, normal, distance - gap)
 
-        elif direction == DirectionEnum.UP:
-            point1, point2 = self.collidepoints(direction, dt)
-            rect = self.__object.rect.move(0, self.__object.velocity_y * dt)
-            is_block = self.__game_field.colliderect_with(*point1, rect) or \
-                self.__game_field.colliderect_with(*point2, rect)
+        return SweepHit(distance, (0, 0), 0.0)
 
-        elif direction == DirectionEnum.RIGHT:
-            point1, point2 = self.collidepoints(direction, dt)
-            rect = self.__object.rect.move(self.__object.speed * dt, 0)
-            is_block = self.__game_field.colliderect_with(*point1, rect) or \
-                self.__game_field.colliderect_with(*point2, rect)
+    def __cells_between(self, start: float, end: float, count: int) -> tuple[int, int]:
+        first = max(math.floor(start / BLOCK_SIZE), 0)
+        last = min(math.floor(end / BLOCK_SIZE), count - 1)
+        return first, last
 
-        elif direction == DirectionEnum.LEFT:
-            point1, point2 = self.collidepoints(direction, dt)
-            rect = self.__object.rect.move(-self.__object.speed * dt, 0)
-            is_block = self.__game_field.colliderect_with(*point1, rect) \
-                or self.__game_field.colliderect_with(*point2, rect)
+    def __probe_distance(self, direction: DirectionEnum, dt: float) -> float:
+        if direction == DirectionEnum.DOWN:
+            distance = self.__object.velocity_y * dt
+        elif direction == DirectionEnum.UP:
+            distance = -self.__object.velocity_y * dt
+        else:
+            distance = self.__object.speed * dt
 
-        return is_block
+        # Resting against a block still counts as touching it
+        return max(distance, CONTACT_DISTANCE)
+
+    def is_block(self, direction: DirectionEnum, dt: float) -> bool:
+        return self.sweep(direction, self.__probe_distance(direction, dt)).is_hit
 
     def borders_teleportation(self) -> None:
         coefficient = 0.75
@@ -79,69 +102,29 @@ class Physics:
 
     def side_blocks(self, dt: float) -> DirectionEnum | None:
 
-        is_left_block = self.is_block(direction=DirectionEnum.LEFT, dt=dt)
-        is_right_block = self.is_block(direction=DirectionEnum.RIGHT, dt=dt)
-        is_block = is_left_block or is_right_block
-
-        if is_block:
-
-            if is_left_block:
-                direction = DirectionEnum.LEFT
-                move_dir = -1
-            else:
-                direction = DirectionEnum.RIGHT
-                move_dir = 1
+        distance = self.__object.speed * dt
 
-            block_distance = self.__game_field.horizontal_block_distance(
-                self.__object.rect.right,
-                self.__object.rect.left,
-                self.__object.rect.bottom,
-                self.__object.rect.top,
-                direction
-            )
+        for direction in (DirectionEnum.LEFT, DirectionEnum.RIGHT):
+            hit = self.sweep(direction, distance)
 
-            if block_distance > 0:
-                self.__object.rect.move_ip(move_dir * block_distance, 0)
+            if hit.is_hit:
+                # Snap to the wall; the normal points back towards the object
+                self.__object.rect.move_ip(-hit.normal[0] * hit.distance, 0)
+                return direction
 
-            return direction
+        return None
 
     def gravitation(self, dt: float) -> None:
 
-        is_bottom_block = self.is_block(direction=DirectionEnum.DOWN, dt=dt)
-
-        if is_bottom_block:
-
-            bottom_block_distance = self.__game_field.vertical_block_distance(
-                self.__object.rect.left,
-                self.__object.rect.right,
-                self.__object.rect.bottom,
-                self.__object.rect.top,
-                direction=DirectionEnum.DOWN
-            )
-
-            if bottom_block_distance > 0:
-                self.__object.rect.move_ip(0, bottom_block_distance)
-
-            self.__object.velocity_y = 0
-        else:
-            if self.__object.velocity_y < self.__object.max_velocity_y:
-                self.__object.velocity_y += (GRAVITY - self.__object.anti_gravity) * dt
-
-            self.__object.rect.move_ip(0, self.__object.velocity_y * dt)
-
-        is_upper_block = self.is_block(direction=DirectionEnum.UP, dt=dt)
-
-        if is_upper_block:
+        if self.__object.velocity_y < self.__object.max_velocity_y:
+            self.__object.velocity_y += (GRAVITY - self.__object.anti_gravity) * dt
 
-            upper_block_distance = self.__game_field.vertical_block_distance(
-                self.__object.rect.left,
-                self.__object.rect.right,
-                self.__object.rect.bottom,
-                self.__object.rect.top,
-                direction=DirectionEnum.UP
-            )
+        dy = self.__object.velocity_y * dt
+        direction = DirectionEnum.DOWN if dy >= 0 else DirectionEnum.UP
 
-            if upper_block_distance > 0:
-                self.__object.rect.move_ip(0, -upper_block_distance)
+        hit = self.sweep(direction, abs(dy))
+        self.__object.rect.move_ip(0, math.copysign(hit.distance, dy))
 
+        # Landed on a floor or bumped into a ceiling
+        if hit.is_hit:
             self.__object.velocity_y = 0
@@ -1,69 +1,58 @@
-
-from pygame.event import Event
-import pygame
-
+from engine.input_snapshot import InputSnapshot
 from game.systems.bullets import Bullets
 from game.consts import BLUE, RED, GREEN, ORANGE
 from game.game_field import GameField
 from game.entities.player import Player
-from engine.joysticks_manager import JoysticksManager
+from game.systems.game_clock import GameClock
+from game.systems.object_protocol import Controller
 
 
 class Players(list[Player]):
+    # One player per color, at most
+    COLORS = (BLUE, RED, GREEN, ORANGE)
+
     def __init__(
         self,
         game_field: GameField,
-        joysticks_manager: JoysticksManager,
-        shader,
         bullets: Bullets,
+        clock: GameClock,
+        inputs: InputSnapshot,
         player_start_pos: tuple[float, float]
     ) -> None:
-        self.__colors = [BLUE, RED, GREEN, ORANGE]
         self.__bullets = bullets
-        self.__shader = shader
+        self.__clock = clock
+        self.__inputs = inputs
         self.__player_start_pos = player_start_pos
         self.__game_field = game_field
-        self.__joystick_manager = joysticks_manager
 
-    def update(self, events: list[Event], dt: float) -> None:
-        self.__joystick_events(events)
+    def update(self, dt: float) -> None:
         for player in self:
             player.update(dt)
 
-    def __joystick_events(self, events: list[Event]) -> None:
-        self.__players_append()
+    def set_controllers(self, controllers: list[Controller]) -> None:
+        """Match the connected controllers with players, e.g. after a device was added or removed."""
+        # In the order of `controllers`, so the same devices always get the same players
+        assigned_ids = {id(player.get_joystick()) for player in self}
+        free_controllers = [controller for controller in controllers if id(controller) not in assigned_ids]
+        controller_ids = {id(controller) for controller in controllers}
 
-        for event in events:
-            if event.type == pygame.JOYDEVICEADDED:
-                print("JOYDEVICEADDED")
-                self.__players_append()
-
-            # if event.type == pygame.JOYDEVICEREMOVED:
-            #     print("JOYDEVICEREMOVED")
-            #     self.__players[list(self.__players.keys())[0]] = 0
-            #     print(f"{self.__players=}")
-
-    def __players_append(self) -> None:
-        joysticks = {id(j): j for j in self.__joystick_manager.get_joysticks()}
-        player_joysticks = {id(player.get_joystick()): player for player in self}
+        # Players whose controller is gone take the free ones
+        for player in self:
+            if id(player.get_joystick()) not in controller_ids and free_controllers:
+                player.set_joystick(free_controllers.pop(0))
 
-        # получить список неактивных игроков
-        # найти не назначенные джойстики
-        # назначить им не назначенные джойстики
-        inactive_player_joystick_ids: set[int] = set(player_joysticks.keys()) - set(joysticks.keys())
-        inactive_joystick_ids = set(joysticks.keys()) - set(player_joysticks.keys())
-        for player_joystick_id in inactive_player_joystick_ids:
-            if len(inactive_joystick_ids) > 0:
-                joystick_id = inactive_joystick_ids.pop()
-                player_joysticks[player_joystick_id].set_joystick(joysticks[joystick_id])
+        for controller in free_controllers:
+            if len(self) == len(self.COLORS):
+                break
 
-        for inactive_joystick_id in inactive_joystick_ids:
             new_player = Player(
                 self.__game_field,
-                self.__shader,
                 self.__player_start_pos,
-                self.__colors[len(self)],
-                self.__bullets
+                self.COLORS[len(self)],
+                self.__bullets,
+                self.__clock,
+                self.__inputs,
+                len(self)
             )
-            new_player.set_joystick(joysticks[inactive_joystick_id])
+            new_player.set_joystick(controller)
             self.append(new_player)
@@ -27,7 +27,6 @@ class Scores:
             y=self.__rect.y,
             text=self.__text,
             rect_size=(self.__rect.width, self.__rect.height),
-            font=None,
             font_file_path=get_resource_path("src/_content/fonts/WDXLLubrifontSC-Regular.ttf"),
             shader=self.__shader,
             color=self.__color
@@ -42,3 +41,6 @@ class Scores:
 
     def update_pos(self, x: float, y: float):
         self.__text_worker.update_pos(x, y)
+
+    def cleanup(self) -> None:
+        self.__text_worker.cleanup()
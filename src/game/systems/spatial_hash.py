@@ -0,0 +1,46 @@
+import math
+from typing import Generic, TypeVar
+
+from game.consts import BLOCK_SIZE
+from game.systems.float_rect import FloatRect
+
+
+T = TypeVar("T")
+
+
+class SpatialHash(Generic[T]):
+    """Uniform grid broadphase: every item is stored in each cell its rect overlaps."""
+
+    def __init__(self, cell_size: float = BLOCK_SIZE) -> None:
+        self.__cell_size = cell_size
+        self.__cells: dict[tuple[int, int], list[T]] = {}
+
+    def clear(self) -> None:
+        self.__cells.clear()
+
+    def insert(self, item: T, rect: FloatRect) -> None:
+        for cell in self.__overlapped_cells(rect):
+            self.__cells.setdefault(cell, []).append(item)
+
+    def query(self, rect: FloatRect) -> list[T]:
+        """Return candidate items sharing at least one cell with `rect`, each only once."""
+        candidates: list[T] = []
+        seen: set[int] = set()
+        for cell in self.__overlapped_cells(rect):
+            for item in self.__cells.get(cell, ()):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    candidates.append(item)
+        return candidates
+
+    def __overlapped_cells(self, rect: FloatRect) -> list[tuple[int, int]]:
+        first_x = math.floor(rect.left / self.__cell_size)
+        last_x = math.ceil(rect.right / self.__cell_size) - 1
+        first_y = math.floor(rect.top / self.__cell_size)
+        last_y = math.ceil(rect.bottom / self.__cell_size) - 1
+
+        return [
+            (x, y)
+            for x in range(first_x, max(first_x, last_x) + 1)
+            for y in range(first_y, max(first_y, last_y) + 1)
+        ]
@@ -0,0 +1,99 @@
+"""
+Headless simulation of a match.
+
+The World owns the whole game state: field, players, bullets,
+collectables and the GameClock the gameplay timers read. It needs no
+display, GL context or joystick: players are driven by anything answering
+like a joystick (see Controller), so a match can run for tests, benchmarks
+or a server. Renderers only read the state;
+GameWindow feeds the controllers, steps the world and draws it.
+
+The clock advances by one tick per step(), so a match can be fast-forwarded
+and, with the same seed and inputs, replays the same way: step() polls the
+controllers into an InputSnapshot, or takes a recorded one.
+"""
+
+import random
+
+import numpy as np
+
+from engine.input_snapshot import InputSnapshot
+from engine.graphics.opengl_3d_utils import MeshData
+from game.consts import BLOCK_SIZE, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from game.entities.buff import Buff
+from game.entities.player import Player
+from game.entities.weapon import Weapon
+from game.game_field import GameField
+from game.map_file import MapData
+from game.systems.bullets import Bullets
+from game.systems.collectable_objects import CollectableObjects
+from game.systems.damage import Damage
+from game.systems.game_clock import GameClock
+from game.systems.players import Players
+
+
+class World:
+    WINNING_SCORE = 25
+
+    # Shape of the field every map is played on
+    FIELD_SHAPE = (int(GAME_FIELD_WIDTH // BLOCK_SIZE), int(GAME_FIELD_HEIGHT // BLOCK_SIZE))
+
+    def __init__(
+        self,
+        map_data: MapData,
+        meshes: dict[str, MeshData] | None = None,
+        seed: int | None = None
+    ) -> None:
+        """
+        Args:
+            map_data: The map to play, see GameField.read_map()
+            meshes: Already loaded collectable meshes by path, the missing ones are loaded here
+            seed: Seed of the pickup spawns, random when None
+        """
+        self.clock = GameClock()
+        self.inputs = InputSnapshot(len(Players.COLORS))
+        self.game_field = GameField(*self.FIELD_SHAPE)
+        self.game_field.load_map(map_data)
+
+        self.bullets = Bullets()
+        self.players = Players(
+            self.game_field, self.bullets, self.clock, self.inputs, self.game_field.get_spawn_position())
+        self.damage = Damage(self.players, self.bullets, self.game_field)
+        self.collectable_objects = CollectableObjects(self.game_field, self.clock, random.Random(seed), meshes)
+
+        self.winner: Player | None = None
+
+    def step(self, dt: float, inputs: np.ndarray | None = None) -> None:
+        """Advance the match by one tick of `dt` (UPDATE_DT, the clock tick). Does nothing once there is a winner.
+
+        Args:
+            dt: Tick duration in seconds
+            inputs: Recorded InputSnapshot.state to play this tick with, the controllers are polled when None
+        """
+        if self.winner is not None:
+            return
+
+        self.clock.tick()
+
+        if inputs is None:
+            self.inputs.poll([player.get_joystick() for player in self.players])
+        else:
+            self.inputs.load(inputs)
+        self.players.update(dt)
+        self.damage.update(dt)
+        self.collectable_objects.update()
+
+        for player in self.players:
+            if player.get_scores() >= self.WINNING_SCORE:
+                self.winner = player
+                return
+
+        for object in list(self.collectable_objects):
+            for player in self.players:
+                if player.rect.colliderect(object.rect):
+                    if isinstance(object, Weapon):
+                        player.update_weapon(object.get_type())
+                    elif isinstance(object, Buff):
+                        player.set_buff(object.get_type())
+                    self.collectable_objects.remove(object)
+                    break
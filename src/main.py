@@ -1,53 +1,72 @@
-import pygame
-import ctypes
-from pygame.locals import DOUBLEBUF, OPENGL, RESIZABLE
+# Before any other import, so the trace sees every import
+from engine.startup_trace import StartupTrace
+StartupTrace.enable_from_environment()
 
-from game.consts import SCREEN_HEIGHT, SCREEN_WIDTH
-from engine.joysticks_manager import JoysticksManager
-from menus.main_menu import MainMenu
-from game.game_window import GameWindow
-from engine.music_manager import MusicManager
-from menus.map_menu import MapMenu
-from menus.pause_menu import PauseMenu
-from game.systems.game_state import GameState
-from menus.victory_menu import VictoryMenu
-from game.enums.window_enum import WindowEnum
+with StartupTrace.phase("imports"):
+    import pygame
+    import ctypes
 
+    from game.consts import SCREEN_HEIGHT, SCREEN_WIDTH
+    from engine.graphics.display_manager import DisplayManager
+    from engine.graphics.gpu_resources import GpuResources
+    from engine.joysticks_manager import JoysticksManager
+    from menus.main_menu import MainMenu
+    from engine.music_manager import MusicManager
+    from game.systems.game_state import GameState
+    from game.enums.window_enum import WindowEnum
 
-# Set process DPI awareness. Use 1 for "System DPI Awareness", or 2 for "Per-Monitor DPI Awareness"
-ctypes.windll.shcore.SetProcessDpiAwareness(1)
+# The game, the map, pause and victory menus are imported and built when first shown
 
-pygame.init()
-pygame.joystick.init()
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=100)
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DOUBLEBUF | OPENGL | RESIZABLE)
-pygame.display.set_caption("Cubes, portals & weapons")
+with StartupTrace.phase("pygame init"):
+    # Set process DPI awareness. Use 1 for "System DPI Awareness", or 2 for "Per-Monitor DPI Awareness"
+    ctypes.windll.shcore.SetProcessDpiAwareness(1)
+
+    pygame.init()
+    pygame.joystick.init()
+    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=100)
+
+with StartupTrace.phase("display"):
+    screen = DisplayManager.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Cubes, portals & weapons")
+    GpuResources.check_context()
 
 clock = pygame.time.Clock()
 
-music_manager = MusicManager()
-joysticks_manager = JoysticksManager()
+with StartupTrace.phase("managers"):
+    music_manager = MusicManager()
+    joysticks_manager = JoysticksManager()
 
 game_state = GameState()
 
-map_menu = MapMenu(game_state, screen, clock, music_manager, joysticks_manager)
-main_menu = MainMenu(game_state, screen, clock, music_manager, joysticks_manager)
-pause_menu = PauseMenu(game_state, screen, clock, music_manager, joysticks_manager)
+with StartupTrace.phase("main menu"):
+    main_menu = MainMenu(game_state, screen, clock, music_manager, joysticks_manager)
+
+map_menu = None
+pause_menu = None
+game_window = None
 
 while True:
     if game_state.current_window == WindowEnum.MAIN_MENU:
         main_menu.show()
 
     elif game_state.current_window == WindowEnum.MAP_MENU:
+        if map_menu is None:
+            from menus.map_menu import MapMenu
+            map_menu = MapMenu(game_state, screen, clock, music_manager, joysticks_manager)
+
         map_menu.show()
+
+        from game.game_window import GameWindow
+        if game_window is not None:
+            game_window.cleanup()
         game_window = GameWindow(
             game_state,
             screen,
             music_manager,
             joysticks_manager,
             map_menu.map_path,
-            map_menu.player_start_pos
+            map_menu.preloader
         )
 
     elif game_state.current_window == WindowEnum.GAME_WINDOW:
@@ -56,16 +75,25 @@ while True:
             winner_color = variable
 
     elif game_state.current_window == WindowEnum.PAUSE_MENU:
+        if pause_menu is None:
+            from menus.pause_menu import PauseMenu
+            pause_menu = PauseMenu(game_state, screen, clock, music_manager, joysticks_manager)
+
         pause_menu.show()
 
     elif game_state.current_window == WindowEnum.VICTORY_MENU:
+        from menus.victory_menu import VictoryMenu
+
         victory_menu = VictoryMenu(winner_color, game_state, screen, clock, music_manager, joysticks_manager)
         victory_menu.show()
+        victory_menu.cleanup()
+
+        game_window.cleanup()
         game_window = GameWindow(
             game_state,
             screen,
             music_manager,
             joysticks_manager,
             map_menu.map_path,
-            map_menu.player_start_pos
+            map_menu.preloader
         )
@@ -7,6 +7,7 @@ from pygame.time import Clock
 from OpenGL.GL import *  # type: ignore
 
 from engine.graphics.display_manager import DisplayManager
+from engine.graphics.gpu_resources import GpuResources
 from engine.joysticks_manager import JoysticksManager
 from engine.music_manager import MusicManager
 from engine.shader_utils import ShaderUtils
@@ -44,11 +45,21 @@ class BaseMenu(ABC):
             "./src/game/_shaders/2d_shader.frag"
         )
 
+        self._projection = OpenGLUtils.ortho(0, GAME_FIELD_WIDTH, 0, GAME_FIELD_HEIGHT, -1, 1)
+        self.__setup_projection()
+
+        GpuResources.add_rebuild_callback(self.__rebuild)
+
+    def __setup_projection(self) -> None:
         glUseProgram(self._shader)
         uProjection = glGetUniformLocation(self._shader, "uProjection")
-        self._projection = OpenGLUtils.ortho(0, GAME_FIELD_WIDTH, 0, GAME_FIELD_HEIGHT, -1, 1)
         glUniformMatrix4fv(uProjection, 1, GL_FALSE, self._projection.T)
 
+    def __rebuild(self) -> None:
+        # The buttons rebuild themselves
+        self._shader = ShaderUtils.get_program(self._shader)
+        self.__setup_projection()
+
     def _create_buttons(self, buttons: dict) -> list[Button]:
         buttons_list = []
 
@@ -104,3 +115,9 @@ class BaseMenu(ABC):
     @abstractmethod
     def show(self):
         pass
+
+    def cleanup(self) -> None:
+        """Free the GPU resources of the menu, call before dropping it."""
+        for button in self._buttons:
+            button.cleanup()
+        self._buttons = []
@@ -5,6 +5,9 @@ from pygame.event import Event
 from game.consts import MENU_FPS
 from game.enums.window_enum import WindowEnum
 from menus.base_menu import BaseMenu
+from engine.asset_manager import AssetManager
+from engine.startup_trace import StartupTrace
+from engine.graphics.gpu_resources import GpuResources
 
 
 class MainMenu(BaseMenu):
@@ -50,4 +53,7 @@ class MainMenu(BaseMenu):
             self._draw_base()
 
             pygame.display.flip()
+            StartupTrace.first_frame()
+            GpuResources.collect()
+            AssetManager.update()
             self._clock.tick(MENU_FPS)
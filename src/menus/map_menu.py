@@ -2,30 +2,42 @@ import sys
 import pygame
 from pygame.event import Event
 
-from game.consts import BLOCK_SIZE, MENU_FPS, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH
+from game.consts import MENU_FPS
 from game.enums.window_enum import WindowEnum
+from game.systems.collectable_objects import CollectableObjects
+from game.systems.map_preloader import MapPreloader
 from menus.base_menu import BaseMenu
+from engine.asset_manager import AssetManager
+from engine.graphics.gpu_resources import GpuResources
 
 
 class MapMenu(BaseMenu):
+    # Button text -> map file
+    MAPS = {
+        "Climbing": "climbing.bmap",
+        "Just-face": "just-face.bmap",
+        "Moon-or-not-moon": "moon-or-not-moon.bmap",
+        "Pillars": "pillars.bmap",
+        "Platform": "platform.bmap",
+        "Sight": "sight.bmap"
+    }
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        self.map_path = "platform.map"
-        self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT / 2)
+        # The spawn point comes with the map file
+        self.map_path = "platform.bmap"
+
+        # Reads the maps and models while the player is choosing
+        self.preloader = MapPreloader()
 
-        buttons = {
-            "Climbing": self.__make_map_callback("climbing.map"),
-            "Just-face": self.__make_map_callback("just-face.map"),
-            "Moon-or-not-moon": self.__make_map_callback("moon-or-not-moon.map"),
-            "Pillars": self.__make_map_callback("pillars.map"),
-            "Platform": self.__make_map_callback("platform.map"),
-            "Sight": self.__make_map_callback("sight.map")
-        }
+        buttons = {text: self.__make_map_callback(map_path) for text, map_path in self.MAPS.items()}
 
         self._buttons = self._create_buttons(buttons)
 
     def show(self) -> None:
+        self.preloader.start(list(self.MAPS.values()), CollectableObjects.get_model_paths())
+
         self._joysticks_manager.current_first_button(self._buttons)
         
         self._running = True
@@ -44,6 +56,8 @@ class MapMenu(BaseMenu):
             self._draw_base()
 
             pygame.display.flip()
+            GpuResources.collect()
+            AssetManager.update()
             self._clock.tick(MENU_FPS)
 
     def _update_custom_events(self, event: Event) -> None:
@@ -56,19 +70,5 @@ class MapMenu(BaseMenu):
         def callback():
             self.map_path = map_path
             self._game_state.current_window = WindowEnum.GAME_WINDOW
-
-            if map_path == "climbing.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT / 2)
-            elif map_path == "moon-or-not-moon.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT - BLOCK_SIZE * 3)
-            elif map_path == "just-face.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT / 2 + BLOCK_SIZE * 4)
-            elif map_path == "platform.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT / 2)
-            elif map_path == "pillars.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT / 2 - BLOCK_SIZE * 9)
-            elif map_path == "sight.map":
-                self.player_start_pos = (GAME_FIELD_WIDTH / 2, GAME_FIELD_HEIGHT - BLOCK_SIZE * 5)
-
             self._running = False
         return callback
@@ -5,6 +5,8 @@ from pygame.event import Event
 from game.consts import MENU_FPS
 from game.enums.window_enum import WindowEnum
 from menus.base_menu import BaseMenu
+from engine.asset_manager import AssetManager
+from engine.graphics.gpu_resources import GpuResources
 
 
 class PauseMenu(BaseMenu):
@@ -56,4 +58,6 @@ class PauseMenu(BaseMenu):
             self._draw_base()
 
             pygame.display.flip()
+            GpuResources.collect()
+            AssetManager.update()
             self._clock.tick(MENU_FPS)
@@ -7,6 +7,8 @@ from game.consts import BLUE, BUTTON_HEIGHT, MENU_FPS, GAME_FIELD_HEIGHT, GAME_F
 from engine.ui.text_worker import TextWorker
 from game.enums.window_enum import WindowEnum
 from menus.base_menu import BaseMenu
+from engine.asset_manager import AssetManager
+from engine.graphics.gpu_resources import GpuResources
 
 
 class VictoryMenu(BaseMenu):
@@ -51,7 +53,6 @@ class VictoryMenu(BaseMenu):
             y=self._text_rect.y + BUTTON_HEIGHT * 0.25,
             text=self._text,
             rect_size=(self._text_rect.width, self._text_rect.height * 0.5),
-            font=None,
             font_file_path=get_resource_path("src/_content/fonts/Orbitron-VariableFont_wght.ttf"),
             shader=self._shader,
             color=winner_color
@@ -80,8 +81,14 @@ class VictoryMenu(BaseMenu):
             self._text_worker.draw()
 
             pygame.display.flip()
+            GpuResources.collect()
+            AssetManager.update()
             self._clock.tick(MENU_FPS)
 
+    def cleanup(self) -> None:
+        super().cleanup()
+        self._text_worker.cleanup()
+
     def _update_custom_events(self, event: Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
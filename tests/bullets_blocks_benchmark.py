@@ -0,0 +1,77 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Добавляем путь к src в sys.path, чтобы видеть модули game и engine
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from game.consts import (
+    BLOCK_SIZE, GAME_FIELD_HEIGHT, GAME_FIELD_WIDTH, MACHINE_GUN_BULLET_HEIGHT, MACHINE_GUN_BULLET_WIDTH
+)
+from game.game_field import GameField
+from game.systems.float_rect import FloatRect
+
+
+# Per-tick cost of the bullet-vs-block pass in Damage.update on sight.map.
+# Run from the repository root: python tests/bullets_blocks_benchmark.py
+
+MAP_PATH = "sight.bmap"
+BULLET_COUNTS = [10, 100, 1000]
+TICKS = 120
+
+game_field = GameField(
+    int(GAME_FIELD_WIDTH // BLOCK_SIZE),
+    int(GAME_FIELD_HEIGHT // BLOCK_SIZE)
+)
+game_field.load_from_file(MAP_PATH)
+
+
+def full_scan(rect: FloatRect) -> bool:
+    """The old approach: test the bullet against every block of the map."""
+    for bx, by in np.argwhere(game_field.field).tolist():
+        if rect.colliderect(game_field._get_block_rect(bx, by)):
+            return True
+    return False
+
+
+def grid_lookup(rect: FloatRect) -> bool:
+    return game_field.colliderect_blocks(rect)
+
+
+def measure(check, bullets: list[FloatRect], ticks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for rect in bullets:
+            check(rect)
+    return (time.perf_counter() - start) / ticks
+
+
+random.seed(0)
+
+print(f"{'bullets':>8} | {'full scan, ms/tick':>18} | {'grid lookup, ms/tick':>20} | {'speedup':>8}")
+
+for count in BULLET_COUNTS:
+    bullets = [
+        FloatRect(
+            random.uniform(0, GAME_FIELD_WIDTH),
+            random.uniform(0, GAME_FIELD_HEIGHT),
+            MACHINE_GUN_BULLET_WIDTH,
+            MACHINE_GUN_BULLET_HEIGHT
+        )
+        for _ in range(count)
+    ]
+
+    # Both checks must agree before we compare their speed
+    assert [full_scan(rect) for rect in bullets] == [grid_lookup(rect) for rect in bullets]
+
+    # The full scan is slow, so it runs for fewer ticks
+    full_scan_time = measure(full_scan, bullets, max(1, TICKS // count))
+    grid_lookup_time = measure(grid_lookup, bullets, TICKS)
+
+    print(
+        f"{count:>8} | {full_scan_time * 1000:>18.3f} | {grid_lookup_time * 1000:>20.3f} | "
+        f"{full_scan_time / grid_lookup_time:>7.0f}x"
+    )
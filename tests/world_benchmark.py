@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+# Добавляем путь к src в sys.path, чтобы видеть модули game и engine
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from game.consts import UPDATE_DT
+from game.game_field import GameField
+from game.systems.bot_controller import BotController
+from game.world import World
+
+
+# Headless match: four bots on sight.bmap, no window, GL context or joystick.
+# Run from the repository root: python tests/world_benchmark.py
+
+MAP_PATH = "sight.bmap"
+PLAYERS_COUNT = 4
+TICKS = 3600
+
+# Same seeds, same match: timers run on the simulation clock
+world = World(GameField.read_map(MAP_PATH, World.FIELD_SHAPE), seed=0)
+bots = [BotController(seed) for seed in range(PLAYERS_COUNT)]
+world.players.set_controllers(bots)
+
+tick_times = []
+for tick in range(TICKS):
+    for bot in bots:
+        bot.update()
+
+    start = time.perf_counter()
+    world.step(UPDATE_DT)
+    tick_times.append(time.perf_counter() - start)
+
+    if world.winner is not None:
+        break
+
+tick_times.sort()
+print(f"ticks: {len(tick_times)}, simulated: {len(tick_times) * UPDATE_DT:.1f} s, real: {sum(tick_times):.3f} s")
+print(f"tick, ms: mean {sum(tick_times) / len(tick_times) * 1000:.3f}, "
+      f"p99 {tick_times[int(len(tick_times) * 0.99)] * 1000:.3f}, max {tick_times[-1] * 1000:.3f}")
+print(f"scores: {[player.get_scores() for player in world.players]}, winner: {world.winner and world.winner._id}")